@@ -1,5 +1,9 @@
 # Import the Flask app from server directory
-from server.app_simple import app
+from server.factory import create_app
+from server.schema import bootstrap_database
+
+app = create_app()
 
 if __name__ == '__main__':
-    app.run(debug=False, host='0.0.0.0', port=5000) 
\ No newline at end of file
+    bootstrap_database(app)
+    app.run(debug=False, host='0.0.0.0', port=5000)
@@ -0,0 +1 @@
+"""Benchmarks and load tests; run each from the repo root with `python -m bench.<name>`"""
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Bulk order benchmark for JB-Rice-Pro backend
+Creates a batch of orders, marks them delivered and records a payment for
+each, once through the bulk endpoints and once with one request per
+order, each against a fresh SQLite file, and prints wall time and SQL
+statements per step.
+
+Usage: python -m bench.bulk_order_benchmark [orders]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import event
+
+from server.factory import create_app
+from server.extensions import db
+from server.models import User, Customer, Inventory, Order
+from server.security import issue_token
+
+CUSTOMERS = 50
+
+def seed():
+    """One shop with CUSTOMERS customers and plenty of stock"""
+    user = User(username='bench', email='bench@example.com', phone='0700000000', password_hash='x')
+    db.session.add(user)
+    db.session.flush()
+    customers = [Customer(user_id=user.id, name=f'Customer {i}', phone=f'07{i:08d}',
+                          customer_type='restaurant' if i % 3 else 'individual') for i in range(CUSTOMERS)]
+    db.session.add_all(customers)
+    db.session.add(Inventory(user_id=user.id, bags_added=1000, total_kg=60000.0, cost_per_bag=9000.0))
+    db.session.commit()
+    return issue_token(user.id), [customer.id for customer in customers]
+
+def run(mode, orders):
+    """{step: (seconds, SQL statements)} to create, deliver and pay for `orders` orders"""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    try:
+        app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}', 'RATE_LIMIT_ENABLED': False})
+        with app.app_context():
+            db.create_all()
+            token, customer_ids = seed()
+            statements = []
+            event.listen(db.engine, 'before_cursor_execute', lambda *args: statements.append(1))
+
+        items = [{'customer_id': customer_ids[i % CUSTOMERS], 'quantity_kg': 5 * (1 + i % 4)} for i in range(orders)]
+        headers = {'Authorization': f'Bearer {token}'}
+        client = app.test_client()
+        if mode == 'bulk':
+            steps = {
+                'create': lambda: [client.post('/api/orders/bulk', json={'orders': items}, headers=headers)],
+                'deliver': lambda: [client.put('/api/orders/bulk/status', json={
+                    'orders': [{'id': i + 1, 'status': 'delivered'} for i in range(orders)]
+                }, headers=headers)],
+                'pay': lambda: [client.post('/api/orders/bulk/payments', json={
+                    'payments': [{'order_id': i + 1, 'amount': 500} for i in range(orders)]
+                }, headers=headers)]
+            }
+        else:
+            steps = {
+                'create': lambda: [client.post('/api/orders', json=item, headers=headers) for item in items],
+                'deliver': lambda: [client.put(f'/api/orders/{i + 1}/status', json={'status': 'delivered'}, headers=headers)
+                                    for i in range(orders)],
+                'pay': lambda: [client.post(f'/api/orders/{i + 1}/payments', json={'amount': 500}, headers=headers)
+                                for i in range(orders)]
+            }
+
+        results = {}
+        for step, send in steps.items():
+            del statements[:]
+            started = time.perf_counter()
+            responses = send()
+            results[step] = (time.perf_counter() - started, len(statements))
+            assert all(response.status_code in (200, 201) for response in responses), responses[0].get_json()
+
+        with app.app_context():
+            assert db.session.query(Order).filter_by(delivery_status='delivered', amount_paid=500).count() == orders
+            db.engine.dispose()
+        return results
+    finally:
+        os.remove(path)
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"📦 {orders} orders for {CUSTOMERS} customers: create, deliver, pay")
+    results = {mode: run(mode, orders) for mode in ('sequential', 'bulk')}
+    for step in results['bulk']:
+        print(f"   {step}")
+        for mode in results:
+            elapsed, statements = results[mode][step]
+            print(f"      - {mode:10}: {elapsed * 1000:8.1f}ms ({elapsed / orders * 1000:.3f}ms/order), {statements} SQL statements")
+        print(f"      Bulk is {results['sequential'][step][0] / results['bulk'][step][0]:.0f}x faster")
+
+if __name__ == "__main__":
+    main()
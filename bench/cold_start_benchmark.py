@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for JB-Rice-Pro backend
+Measures, in fresh interpreters, how long importing the WSGI app takes and
+how long its first request takes - what a sleeping instance pays on wake-up.
+
+Usage: python -m bench.cold_start_benchmark [module:attribute] [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Runs inside a fresh interpreter so nothing is already imported
+PROBE = '''
+import importlib, json, sys, time
+started = time.perf_counter()
+module_name, attribute = sys.argv[1].split(':')
+app = getattr(importlib.import_module(module_name), attribute)
+imported = time.perf_counter()
+from server.security import issue_token
+with app.app_context():
+    token = issue_token(1)
+response = app.test_client().get('/api/inventory', headers={'Authorization': f'Bearer {token}'})
+finished = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'first_request_ms': (finished - imported) * 1000,
+    'status': response.status_code
+}))
+'''
+
+BOOTSTRAP = '''
+import importlib, sys
+from server.schema import bootstrap_database
+module_name, attribute = sys.argv[1].split(':')
+bootstrap_database(getattr(importlib.import_module(module_name), attribute))
+'''
+
+def run_probe(code, target):
+    """Run one snippet in a new interpreter from the repo root"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, '-c', code, target],
+        cwd=root, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ''
+
+def main():
+    """Print median and worst import and first-request times"""
+    target = sys.argv[1] if len(sys.argv) > 1 else 'app:app'
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    # Make sure the schema exists so the first request measures the app, not DDL
+    run_probe(BOOTSTRAP, target)
+
+    samples = [json.loads(run_probe(PROBE, target)) for _ in range(runs)]
+    print(f"🚀 Cold start of {target} over {runs} runs")
+    for key, label in (('import_ms', 'import'), ('first_request_ms', 'first request')):
+        values = [sample[key] for sample in samples]
+        print(f"   - {label}: median {statistics.median(values):.0f}ms, worst {max(values):.0f}ms")
+    print(f"   - status codes: {sorted({sample['status'] for sample in samples})}")
+
+if __name__ == "__main__":
+    main()
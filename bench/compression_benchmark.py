@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Response compression benchmark for JB-Rice-Pro backend
+Seeds an in-memory database with a long order and inventory history, then
+fetches the large list and report endpoints with each Accept-Encoding and
+prints bytes on the wire and server CPU per request.
+
+Usage: python -m bench.compression_benchmark [orders] [inventory records]
+"""
+
+import sys
+import time
+from datetime import timedelta
+
+from server.factory import create_app
+from server.compression import brotli
+from server.extensions import db
+from server.models import get_eat_time, User, Customer, Inventory, Order
+from server.security import issue_token
+
+ENDPOINTS = (
+    '/api/orders?limit=200',
+    '/api/orders?paginate=false',
+    '/api/inventory/history?paginate=false',
+    '/api/reports/inventory',
+    '/api/customers?limit=50'
+)
+REPEATS = 10
+
+def seed(orders, inventory_records):
+    """One shop with `orders` orders across 200 customers and a purchase history"""
+    now = get_eat_time()
+    user = User(username='bench', email='bench@example.com', phone='0700000000', password_hash='x')
+    db.session.add(user)
+    db.session.flush()
+    customers = [Customer(user_id=user.id, name=f'Customer {i}', phone=f'07{i:08d}', customer_type='restaurant' if i % 3 else 'individual',
+                          address=f'Stall {i}, Market Road') for i in range(200)]
+    db.session.add_all(customers)
+    db.session.flush()
+    db.session.add_all(Inventory(user_id=user.id, bags_added=10 + i % 5, total_kg=(10 + i % 5) * 60.0, cost_per_bag=9000.0,
+                                 date_added=now - timedelta(hours=6 * i)) for i in range(inventory_records))
+    db.session.add_all(Order(user_id=user.id, customer_id=customers[i % 200].id, quantity_kg=5.0 + i % 40, price_per_kg=200.0,
+                             total_amount=(5.0 + i % 40) * 200.0, order_date=now - timedelta(minutes=17 * i),
+                             delivery_status='delivered' if i % 4 else 'pending', delivery_date=now - timedelta(minutes=17 * i - 90) if i % 4 else None,
+                             payment_status='paid' if i % 4 else 'unpaid', amount_paid=(5.0 + i % 40) * 200.0 if i % 4 else 0.0,
+                             amount_remaining=0.0 if i % 4 else (5.0 + i % 40) * 200.0) for i in range(orders))
+    db.session.commit()
+    return issue_token(user.id)
+
+def measure(client, path, token, encoding):
+    """(bytes on the wire, CPU ms per request) for one endpoint and encoding"""
+    headers = {'Authorization': f'Bearer {token}', 'Accept-Encoding': encoding}
+    size = len(client.get(path, headers=headers).get_data())
+    started = time.process_time()
+    for _ in range(REPEATS):
+        client.get(path, headers=headers).get_data()
+    return size, (time.process_time() - started) / REPEATS * 1000
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    inventory_records = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'RATE_LIMIT_ENABLED': False})
+    with app.app_context():
+        db.create_all()
+        token = seed(orders, inventory_records)
+
+    encodings = ['identity', 'gzip'] + (['br'] if brotli else [])
+    client = app.test_client()
+    print(f"🗜️  {orders} orders, {inventory_records} inventory records, {REPEATS} requests each "
+          f"(brotli {'installed' if brotli else 'missing'})")
+    for path in ENDPOINTS:
+        results = {encoding: measure(client, path, token, encoding) for encoding in encodings}
+        plain_size, plain_cpu = results['identity']
+        print(f"   {path}")
+        for encoding, (size, cpu) in results.items():
+            print(f"      - {encoding:8}: {size / 1024:8.1f} KiB ({size / plain_size:5.1%}), "
+                  f"{cpu:6.1f}ms CPU (+{cpu - plain_cpu:.1f}ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Helpers for the load tests that drive a real gunicorn server over HTTP
+"""
+
+import json
+import os
+import subprocess
+import time
+import urllib.error
+import urllib.request
+
+PORT = 8799
+BASE_URL = f"http://127.0.0.1:{PORT}/api"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def call(method, path, body=None, token=None):
+    """Send one request; returns (status, parsed JSON body or None)"""
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(f"{BASE_URL}{path}", data=data, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            return response.status, json.loads(response.read() or b'null')
+    except urllib.error.HTTPError as e:
+        return e.code, None
+
+def start_server(workdir, rate_limited):
+    """Run gunicorn from the repo root against a scratch SQLite database"""
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'load.db')}",
+        RATE_LIMIT_DB=os.path.join(workdir, 'ratelimit.db'),
+        RATE_LIMIT_ENABLED='true' if rate_limited else 'false'
+    )
+    server = subprocess.Popen(
+        ['gunicorn', '-w', '3', '-b', f'127.0.0.1:{PORT}', 'app:app'],
+        cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    for _ in range(100):
+        try:
+            if call('GET', '/health/live')[0] == 200:
+                return server
+        except OSError:
+            pass
+        time.sleep(0.1)
+    server.kill()
+    raise SystemExit("❌ gunicorn did not start")
+
+def sign_in(username):
+    """Create a user (if needed) and return a token for it"""
+    password = 'Load123!'
+    call('POST', '/auth/signup', {
+        'username': username, 'email': f'{username}@example.com', 'phone': '0700000000',
+        'password': password, 'confirm_password': password
+    })
+    status, body = call('POST', '/auth/signin', {'username_or_email': username, 'password': password})
+    return body['token']
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Payment concurrency test for JB-Rice-Pro backend
+Starts gunicorn on a scratch database, then has many threads record small
+payments against one delivered order until it is fully paid, and then
+delete them all again. After each phase the order's balance, its
+payments, the successful responses and the sales report must agree: no
+update lost and no overpayment. Requests that run out of retries get
+409 and change nothing.
+
+Usage: python -m bench.payment_concurrency_test [threads] [payments per thread]
+"""
+
+import sys
+import tempfile
+import threading
+from collections import Counter
+
+from .live_server import call, sign_in, start_server
+
+PAYMENT = 10
+ORDER_KG = 50  # individual customer: 50kg x KES 200 = KES 10,000
+
+def hammer(threads, work):
+    """Run work(thread index) on every thread at once; returns a Counter of response statuses"""
+    statuses = Counter()
+    lock = threading.Lock()
+    start = threading.Barrier(threads)
+
+    def worker(index):
+        start.wait()
+        for status in work(index):
+            with lock:
+                statuses[status] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return statuses
+
+def conflict_rate(statuses):
+    """Share of requests that ran out of retries and got 409"""
+    return statuses[409] / max(1, sum(statuses.values()))
+
+def check(token, order_id):
+    """(amount paid, amount remaining, payment status, sum of payments, sales report revenue)"""
+    order = next(o for o in call('GET', '/orders?paginate=false', token=token)[1] if o['id'] == order_id)
+    payments = call('GET', f'/orders/{order_id}/payments?paginate=false', token=token)[1]
+    revenue = call('GET', '/reports/sales?period=all', token=token)[1]['total_revenue']
+    return order['amount_paid'], order['amount_remaining'], order['payment_status'], sum(p['amount'] for p in payments), revenue
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    per_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    with tempfile.TemporaryDirectory() as workdir:
+        server = start_server(workdir, rate_limited=False)
+        try:
+            token = sign_in('clerk')
+            call('POST', '/inventory', {'bags': 1}, token)
+            customer_id = call('POST', '/customers', {'name': 'Walk-in', 'phone': '0700000001', 'customer_type': 'individual'}, token)[1]['id']
+            order_id = call('POST', '/orders', {'customer_id': customer_id, 'quantity_kg': ORDER_KG}, token)[1]['id']
+            call('PUT', f'/orders/{order_id}/status', {'status': 'delivered'}, token)
+            total = ORDER_KG * 200
+
+            print(f"💸 {threads} threads x {per_thread} payments of KES {PAYMENT} against one KES {total:,} order")
+            added = hammer(threads, lambda i: (
+                call('POST', f'/orders/{order_id}/payments', {'amount': PAYMENT}, token)[0] for _ in range(per_thread)
+            ))
+            paid, remaining, status, payments_sum, revenue = check(token, order_id)
+            print(f"   - add:    responses {dict(added)}, 409 rate {conflict_rate(added):.1%}")
+            print(f"             paid {paid:,.0f}, remaining {remaining:,.0f} ({status}), payments sum {payments_sum:,.0f}, revenue {revenue:,.0f}")
+            ok = paid == payments_sum == revenue == added[201] * PAYMENT <= total and paid + remaining == total
+            before_delete = paid
+
+            payment_ids = [p['id'] for p in call('GET', f'/orders/{order_id}/payments?paginate=false', token=token)[1]]
+            deleted = hammer(threads, lambda i: (
+                call('DELETE', f'/orders/{order_id}/payments/{payment_id}', token=token)[0] for payment_id in payment_ids[i::threads]
+            ))
+            paid, remaining, status, payments_sum, revenue = check(token, order_id)
+            print(f"   - delete: responses {dict(deleted)}, 409 rate {conflict_rate(deleted):.1%}")
+            print(f"             paid {paid:,.0f}, remaining {remaining:,.0f} ({status}), payments sum {payments_sum:,.0f}, revenue {revenue:,.0f}")
+            ok = ok and paid == payments_sum == revenue == before_delete - deleted[200] * PAYMENT and paid + remaining == total
+        finally:
+            server.terminate()
+            server.wait()
+
+    print("✅ Balances consistent" if ok else "❌ Balances inconsistent")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Rate limiter load test for JB-Rice-Pro backend
+Starts gunicorn on a scratch database, lets one client flood sign-in and
+the sales report while another client reads inventory and orders, and
+prints the well-behaved client's latency with the limiter off and on.
+
+Usage: python -m bench.rate_limit_load_test [seconds per phase]
+"""
+
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from .live_server import call, sign_in, start_server
+
+FLOOD_THREADS = 12
+
+def run_phase(seconds, flood, victim_token, flooder_token):
+    """Measure the victim's latencies while the flooder runs (or not)"""
+    stop = threading.Event()
+    flood_statuses = []
+
+    def flooder(index):
+        while not stop.is_set():
+            if index % 2:
+                flood_statuses.append(call('POST', '/auth/signin', {'username_or_email': 'flooder', 'password': 'wrong'})[0])
+            else:
+                flood_statuses.append(call('GET', '/reports/sales?period=month', token=flooder_token)[0])
+
+    threads = [threading.Thread(target=flooder, args=(i,)) for i in range(FLOOD_THREADS if flood else 0)]
+    for thread in threads:
+        thread.start()
+
+    latencies = []
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        for path in ('/inventory', '/orders?limit=20'):
+            started = time.perf_counter()
+            call('GET', path, token=victim_token)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return latencies, flood_statuses
+
+def report(label, latencies, flood_statuses):
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    rejected = sum(1 for status in flood_statuses if status == 429)
+    print(f"   - {label}: p50 {statistics.median(latencies):.1f}ms, p99 {p99:.1f}ms "
+          f"({len(latencies)} requests; flood {len(flood_statuses)} sent, {rejected} got 429)")
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"🚦 Victim latency for GET /inventory and /orders, {seconds:.0f}s per phase, {FLOOD_THREADS} flood threads")
+    for rate_limited in (False, True):
+        with tempfile.TemporaryDirectory() as workdir:
+            server = start_server(workdir, rate_limited)
+            try:
+                victim_token, flooder_token = sign_in('victim'), sign_in('flooder')
+                label = 'limiter on ' if rate_limited else 'limiter off'
+                if not rate_limited:
+                    report('no flood   ', *run_phase(seconds, False, victim_token, flooder_token))
+                report(f'{label}', *run_phase(seconds, True, victim_token, flooder_token))
+            finally:
+                server.terminate()
+                server.wait()
+
+if __name__ == "__main__":
+    main()
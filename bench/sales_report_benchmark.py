@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Sales report benchmark for JB-Rice-Pro backend
+Seeds a SQLite file with 100k orders over 45 days for 200 customers, then
+times the week and month sales report the old way (every delivered Order
+loaded as an ORM object, customer lazily loaded per order) against
+GET /api/reports/sales, and checks that both return the same numbers.
+
+Usage: python -m bench.sales_report_benchmark [orders]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+from server.factory import create_app
+from server.extensions import db
+from server.models import get_eat_time, User, Customer, Order
+from server.sales import COST_PER_KG, backfill_daily_sales
+from server.security import issue_token
+
+CUSTOMERS = 200
+DAYS = 45
+REPEATS = 3
+
+def seed(orders):
+    """One shop with `orders` orders spread over the last DAYS days"""
+    now = get_eat_time()
+    user = User(username='bench', email='bench@example.com', phone='0700000000', password_hash='x')
+    db.session.add(user)
+    db.session.flush()
+    db.session.execute(db.insert(Customer), [
+        {'user_id': user.id, 'name': f'Customer {i}', 'phone': f'07{i:08d}', 'customer_type': 'restaurant' if i % 3 else 'individual'}
+        for i in range(CUSTOMERS)
+    ])
+    customer_ids = db.session.scalars(db.select(Customer.id)).all()
+    rows = []
+    for i in range(orders):
+        kg = 5.0 * (1 + i % 4)
+        total = kg * 200.0
+        paid = (total, total / 2, 0.0)[i % 3]
+        rows.append({
+            'user_id': user.id, 'customer_id': customer_ids[i % CUSTOMERS], 'quantity_kg': kg, 'price_per_kg': 200.0,
+            'total_amount': total, 'order_date': now - timedelta(minutes=i * DAYS * 24 * 60 // orders),
+            'delivery_status': ('delivered', 'delivered', 'pending', 'cancelled')[i % 4],
+            'amount_paid': paid, 'amount_remaining': total - paid,
+            'payment_status': ('paid', 'partial', 'unpaid')[i % 3]
+        })
+    db.session.execute(db.insert(Order), rows)
+    backfill_daily_sales()
+    db.session.commit()
+    return user.id
+
+def old_report(user_id, period):
+    """The report as it was computed before the summary table: full ORM rows, five passes, N+1 customers"""
+    end_date = get_eat_time()
+    start_date = (end_date - timedelta(days=7 if period == 'week' else 30)).replace(hour=0, minute=0, second=0, microsecond=0)
+    orders = Order.query.filter(
+        Order.user_id == user_id,
+        Order.order_date >= start_date,
+        Order.order_date <= end_date,
+        Order.delivery_status == 'delivered'
+    ).all()
+    total_revenue = sum(order.amount_paid for order in orders)
+    total_kg_sold = sum(order.quantity_kg for order in orders)
+    restaurant_orders = [o for o in orders if o.customer.customer_type == 'restaurant']
+    individual_orders = [o for o in orders if o.customer.customer_type == 'individual']
+    total_orders_amount = sum(order.total_amount for order in orders)
+    return {
+        'total_orders': len(orders),
+        'total_revenue': total_revenue,
+        'total_orders_amount': total_orders_amount,
+        'total_pending_payments': total_orders_amount - total_revenue,
+        'total_kg_sold': total_kg_sold,
+        'total_cost': total_kg_sold * COST_PER_KG,
+        'profit': total_revenue - total_kg_sold * COST_PER_KG,
+        'restaurant_orders': len(restaurant_orders),
+        'individual_orders': len(individual_orders),
+        'restaurant_revenue': sum(o.amount_paid for o in restaurant_orders),
+        'individual_revenue': sum(o.amount_paid for o in individual_orders)
+    }
+
+def best_of(run):
+    """(fastest seconds over REPEATS runs, last result)"""
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    try:
+        app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}', 'RATE_LIMIT_ENABLED': False})
+        with app.app_context():
+            db.create_all()
+            user_id = seed(orders)
+            token = issue_token(user_id)
+
+        client = app.test_client()
+        headers = {'Authorization': f'Bearer {token}'}
+        print(f"📊 Sales report over {orders:,} orders ({DAYS} days, {CUSTOMERS} customers), best of {REPEATS}")
+        ok = True
+        for period in ('week', 'month'):
+            def old():
+                with app.app_context():
+                    return old_report(user_id, period)
+            old_elapsed, expected = best_of(old)
+            new_elapsed, report = best_of(lambda: client.get(f'/api/reports/sales?period={period}', headers=headers).get_json())
+            mismatches = {key: (value, report[key]) for key, value in expected.items() if abs(value - report[key]) > 1e-6}
+            ok = ok and not mismatches
+            print(f"   {period} ({expected['total_orders']:,} delivered orders)")
+            print(f"      - ORM rows + lazy customers: {old_elapsed * 1000:8.1f}ms")
+            print(f"      - GET /api/reports/sales:    {new_elapsed * 1000:8.1f}ms ({old_elapsed / new_elapsed:.0f}x faster)")
+            if mismatches:
+                print(f"      ❌ Reports differ: {mismatches}")
+        with app.app_context():
+            db.engine.dispose()
+    finally:
+        os.remove(path)
+    print("✅ Same report both ways" if ok else "❌ Reports differ")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
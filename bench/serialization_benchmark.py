@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark for JB-Rice-Pro backend
+Encodes 50k order rows and 50k payment rows into a JSON response the old
+way (hand-built dicts, strftime per row, standard json provider) and with
+server.serialization (compiled encoders, cached display dates, orjson),
+printing CPU time and peak memory for each.
+
+Usage: python -m bench.serialization_benchmark [rows]
+"""
+
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from flask.json.provider import DefaultJSONProvider
+
+from server.factory import create_app
+from server.serialization import encode_order, encode_payment, OrjsonProvider, orjson
+
+OrderRow = namedtuple('OrderRow', [
+    'id', 'customer_id', 'customer_name', 'quantity_kg', 'price_per_kg', 'total_amount', 'order_date',
+    'delivery_status', 'delivery_date', 'payment_status', 'amount_paid', 'amount_remaining'
+])
+PaymentRow = namedtuple('PaymentRow', ['id', 'order_id', 'amount', 'payment_date', 'payment_method', 'notes'])
+
+def old_order(o):
+    return {
+        'id': o.id,
+        'customer_id': o.customer_id,
+        'customer_name': o.customer_name,
+        'quantity_kg': o.quantity_kg,
+        'price_per_kg': o.price_per_kg,
+        'total_amount': o.total_amount,
+        'order_date': o.order_date.isoformat(),
+        'delivery_status': o.delivery_status,
+        'delivery_date': o.delivery_date.isoformat() if o.delivery_date else None,
+        'payment_status': o.payment_status,
+        'amount_paid': o.amount_paid,
+        'amount_remaining': o.amount_remaining
+    }
+
+def old_payment(payment):
+    return {
+        'id': payment.id,
+        'order_id': payment.order_id,
+        'amount': payment.amount,
+        'payment_date': payment.payment_date.isoformat(),
+        'payment_method': payment.payment_method,
+        'notes': payment.notes,
+        'formatted_date': payment.payment_date.strftime('%B %d, %Y at %I:%M %p')
+    }
+
+def make_rows(count):
+    """Rows spread over ~35 days, a few seconds apart, like a busy shop's history"""
+    start = datetime(2026, 1, 1, 8, 0)
+    orders, payments = [], []
+    for i in range(count):
+        when = start + timedelta(seconds=60 * i)
+        delivered = i % 3 == 0
+        orders.append(OrderRow(
+            i, i % 400, f'Customer {i % 400}', 25.0, 180.0, 4500.0, when,
+            'delivered' if delivered else 'pending', when + timedelta(hours=2) if delivered else None,
+            'partial', 1000.0, 3500.0
+        ))
+        payments.append(PaymentRow(i, i, 1000.0, when, 'mpesa', ''))
+    return orders, payments
+
+def measure(app, provider, encode, rows, repeats=5):
+    """(best CPU seconds, peak MiB) to build one JSON response body for all rows"""
+    with app.app_context():
+        cpu = float('inf')
+        for _ in range(repeats):
+            started = time.process_time()
+            provider.response({'items': [encode(row) for row in rows]}).get_data()
+            cpu = min(cpu, time.process_time() - started)
+
+        tracemalloc.start()
+        provider.response({'items': [encode(row) for row in rows]}).get_data()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return cpu, peak / (1024 * 1024)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+    standard = DefaultJSONProvider(app)
+    fast = OrjsonProvider(app) if orjson else standard
+    orders, payments = make_rows(count)
+
+    print(f"📦 Serializing {count} rows per model (orjson {'installed' if orjson else 'missing'})")
+    for label, rows, old, new in (('orders', orders, old_order, encode_order), ('payments', payments, old_payment, encode_payment)):
+        old_cpu, old_peak = measure(app, standard, old, rows)
+        new_cpu, new_peak = measure(app, fast, new, rows)
+        print(f"   - {label}: CPU {old_cpu * 1000:.0f}ms -> {new_cpu * 1000:.0f}ms, "
+              f"peak memory {old_peak:.1f}MiB -> {new_peak:.1f}MiB")
+
+if __name__ == "__main__":
+    main()
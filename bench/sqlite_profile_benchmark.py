@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+SQLite engine profile benchmark for JB-Rice-Pro backend
+Runs several processes against one SQLite file, each recording inventory
+purchases interleaved with order-list reads, once per pragma profile:
+the production profile (WAL, synchronous=NORMAL, busy timeout) and the
+SQLite defaults (rollback journal, synchronous=FULL) with and without a
+busy timeout. Prints write throughput and 'database is locked' errors.
+
+Usage: python -m bench.sqlite_profile_benchmark [processes] [writes per process]
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from server.config import Config
+from server.factory import create_app
+from server.schema import bootstrap_database
+from server.security import issue_token
+
+PROFILES = {
+    'production (WAL)': Config.SQLITE_PRAGMAS,
+    'rollback journal, no wait': {'journal_mode': 'DELETE', 'synchronous': 'FULL', 'busy_timeout': 0},
+    'rollback journal, 5s wait': {'journal_mode': 'DELETE', 'synchronous': 'FULL', 'busy_timeout': 5000}
+}
+
+def make_app(path, pragmas):
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}',
+        'SQLITE_PRAGMAS': pragmas,
+        'RATE_LIMIT_ENABLED': False
+    })
+
+def worker(args):
+    """(writes ok, 'database is locked' errors, other errors, reads ok) for one process"""
+    path, pragmas, writes, token = args
+    app = make_app(path, pragmas)
+    app.logger.disabled = True  # lock errors outside the views' try blocks would print a traceback each
+    client = app.test_client()
+    headers = {'Authorization': f'Bearer {token}'}
+    ok = locked = failed = reads = 0
+    for _ in range(writes):
+        response = client.post('/api/inventory', json={'bags': 1}, headers=headers)
+        if response.status_code == 201:
+            ok += 1
+        elif 'locked' in (response.get_json() or {}).get('error', ''):
+            locked += 1
+        else:
+            failed += 1
+        reads += client.get('/api/orders?limit=20', headers=headers).status_code == 200
+    return ok, locked, failed, reads
+
+def run(pragmas, processes, writes):
+    """(seconds, writes ok, locked errors, other errors, reads ok) on a fresh database file"""
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, 'bench.db')
+        app = make_app(path, pragmas)
+        app.instance_path = workdir  # bootstrap.lock
+        bootstrap_database(app)
+        with app.app_context():
+            token = issue_token(1)
+
+        with multiprocessing.get_context('spawn').Pool(processes) as pool:
+            started = time.perf_counter()
+            results = pool.map(worker, [(path, pragmas, writes, token)] * processes)
+            elapsed = time.perf_counter() - started
+    return (elapsed, *(sum(column) for column in zip(*results)))
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    writes = int(sys.argv[2]) if len(sys.argv) > 2 else 150
+    print(f"🗄️  {processes} processes x {writes} inventory writes, each followed by an order-list read")
+    for label, pragmas in PROFILES.items():
+        elapsed, ok, locked, failed, reads = run(pragmas, processes, writes)
+        print(f"   - {label:26}: {ok}/{processes * writes} writes ok, {locked} locked, {failed} other errors, "
+              f"{reads} reads ok, {ok / elapsed:.0f} writes/s")
+
+if __name__ == "__main__":
+    main()
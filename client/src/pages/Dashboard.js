@@ -6,7 +6,7 @@ import {
   DollarSign,
   Wheat
 } from 'lucide-react';
-import { inventoryAPI, ordersAPI, customersAPI, reportsAPI } from '../services/api';
+import { dashboardAPI, subscribeToEvents } from '../services/api';
 import { Line, Doughnut } from 'react-chartjs-2';
 import {
   Chart as ChartJS,
@@ -35,26 +35,25 @@ const Dashboard = () => {
   const [stats, setStats] = useState({
     inventory: {},
     orders: [],
-    customers: [],
-    sales: {}
+    ordersCount: 0,
+    customersCount: 0,
+    sales: {},
+    revenueSeries: []
   });
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     const fetchDashboardData = async () => {
       try {
-        const [inventory, orders, customers, sales] = await Promise.all([
-          inventoryAPI.getInventory(),
-          ordersAPI.getOrders(),
-          customersAPI.getCustomers(),
-          reportsAPI.getSalesReport('month')
-        ]);
+        const { data } = await dashboardAPI.getSummary();
 
         setStats({
-          inventory: inventory.data,
-          orders: orders.data,
-          customers: customers.data,
-          sales: sales.data
+          inventory: data.inventory,
+          orders: data.recent_orders,
+          ordersCount: data.orders_count,
+          customersCount: data.customers_count,
+          sales: data.sales,
+          revenueSeries: data.revenue_series
         });
       } catch (error) {
         console.error('Error fetching dashboard data:', error);
@@ -64,6 +63,10 @@ const Dashboard = () => {
     };
 
     fetchDashboardData();
+
+    // Orders, payments and stock changes from other devices refresh the summary
+    const source = subscribeToEvents(() => fetchDashboardData());
+    return () => source && source.close();
   }, []);
 
   const statCards = [
@@ -77,7 +80,7 @@ const Dashboard = () => {
     },
     {
       title: 'Total Orders',
-      value: stats.orders.length || 0,
+      value: stats.ordersCount || 0,
       icon: ShoppingCart,
       color: 'bg-green-500',
       change: '+8%',
@@ -85,7 +88,7 @@ const Dashboard = () => {
     },
     {
       title: 'Total Customers',
-      value: stats.customers.length || 0,
+      value: stats.customersCount || 0,
       icon: Users,
       color: 'bg-purple-500',
       change: '+5%',
@@ -102,11 +105,13 @@ const Dashboard = () => {
   ];
 
   const salesData = {
-    labels: ['Week 1', 'Week 2', 'Week 3', 'Week 4'],
+    labels: stats.revenueSeries.map((point) =>
+      new Date(point.start).toLocaleDateString(undefined, { month: 'short', day: 'numeric' })
+    ),
     datasets: [
       {
         label: 'Revenue (KES)',
-        data: [45000, 52000, 48000, 61000],
+        data: stats.revenueSeries.map((point) => point.value),
         borderColor: '#16a34a',
         backgroundColor: 'rgba(22, 163, 74, 0.1)',
         tension: 0.4,
@@ -1,9 +1,12 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import { ShoppingCart, Plus, CheckCircle, XCircle, Clock, Filter, Calendar, Edit2, DollarSign, CreditCard, Trash2 } from 'lucide-react';
-import { ordersAPI, customersAPI, paymentsAPI } from '../services/api';
+import { ordersAPI, customersAPI, paymentsAPI, subscribeToEvents } from '../services/api';
 
 const Orders = () => {
   const [orders, setOrders] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [totalOrders, setTotalOrders] = useState(0);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [customers, setCustomers] = useState([]);
   const [loading, setLoading] = useState(true);
   const [showModal, setShowModal] = useState(false);
@@ -32,7 +35,7 @@ const Orders = () => {
   const fetchData = useCallback(async () => {
     try {
       setLoading(true);
-      const filters = {};
+      const filters = { include_total: true };
       if (statusFilter !== 'all') filters.status = statusFilter;
       if (periodFilter !== 'all') filters.period = periodFilter;
       
@@ -40,7 +43,9 @@ const Orders = () => {
         ordersAPI.getOrders(filters),
         customersAPI.getCustomers()
       ]);
-      setOrders(ordersResponse.data);
+      setOrders(ordersResponse.data.items);
+      setNextCursor(ordersResponse.data.next_cursor);
+      setTotalOrders(ordersResponse.data.total_count);
       setCustomers(customersResponse.data);
     } catch (error) {
       console.error('Error fetching data:', error);
@@ -53,6 +58,31 @@ const Orders = () => {
     fetchData();
   }, [fetchData]);
 
+  // Orders created, delivered or paid on another device
+  useEffect(() => {
+    const source = subscribeToEvents((type) => {
+      if (type !== 'stock_changed') fetchData();
+    });
+    return () => source && source.close();
+  }, [fetchData]);
+
+  const loadMoreOrders = async () => {
+    try {
+      setLoadingMore(true);
+      const filters = { cursor: nextCursor };
+      if (statusFilter !== 'all') filters.status = statusFilter;
+      if (periodFilter !== 'all') filters.period = periodFilter;
+      
+      const response = await ordersAPI.getOrders(filters);
+      setOrders((current) => current.concat(response.data.items));
+      setNextCursor(response.data.next_cursor);
+    } catch (error) {
+      console.error('Error loading more orders:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     try {
@@ -262,7 +292,7 @@ const Orders = () => {
         {/* Filter Summary */}
         <div className="mb-4 p-3 bg-blue-50 rounded-lg">
           <p className="text-sm text-blue-700">
-            <strong>Filters:</strong> Showing {getStatusLabel(statusFilter)} orders for {getFilterLabel(periodFilter).toLowerCase()} ({orders.length} orders)
+            <strong>Filters:</strong> Showing {getStatusLabel(statusFilter)} orders for {getFilterLabel(periodFilter).toLowerCase()} ({totalOrders} orders)
           </p>
         </div>
 
@@ -373,6 +403,13 @@ const Orders = () => {
                 </div>
               </div>
             ))}
+            {nextCursor && (
+              <div className="text-center">
+                <button onClick={loadMoreOrders} className="btn-secondary" disabled={loadingMore}>
+                  {loadingMore ? 'Loading...' : `Load more (${orders.length} of ${totalOrders})`}
+                </button>
+              </div>
+            )}
           </div>
         )}
       </div>
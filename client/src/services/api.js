@@ -19,17 +19,43 @@ const createAuthenticatedAPI = () => {
 
 const api = createAuthenticatedAPI();
 
+// Expired, revoked or pre-signing tokens: drop the session and sign in again
+api.interceptors.response.use(
+  (response) => response,
+  (error) => {
+    if (error.response && error.response.status === 401) {
+      localStorage.removeItem('user');
+      window.location.assign('/signin');
+    }
+    return Promise.reject(error);
+  }
+);
+
+// List endpoints return pages of { items, next_cursor }; follow the cursors
+// for short lists that screens need in full (customer pickers, payments)
+const fetchAllPages = async (url, params = {}) => {
+  let items = [];
+  let cursor = null;
+  do {
+    const response = await api.get(url, { params: { ...params, cursor, limit: 200 } });
+    items = items.concat(response.data.items);
+    cursor = response.data.next_cursor;
+  } while (cursor);
+  return { data: items };
+};
+
 // Inventory API
 export const inventoryAPI = {
   getInventory: () => api.get('/inventory'),
   addInventory: (data) => api.post('/inventory', data),
-  getInventoryHistory: (period = 'all') => api.get(`/inventory/history?period=${period}`),
+  getInventoryHistory: (period = 'all') => fetchAllPages('/inventory/history', { period }),
   updateInventory: (id, data) => api.put(`/inventory/${id}`, data)
 };
 
 // Customers API
 export const customersAPI = {
-  getCustomers: (type) => api.get('/customers', { params: { type } }),
+  getCustomers: (type) => fetchAllPages('/customers', { type }),
+  getCustomersPage: (params = {}) => api.get('/customers', { params }),
   addCustomer: (data) => api.post('/customers', data),
   updateCustomer: (id, data) => api.put(`/customers/${id}`, data),
   deleteCustomer: (id) => api.delete(`/customers/${id}`),
@@ -37,22 +63,32 @@ export const customersAPI = {
 
 // Orders API
 export const ordersAPI = {
+  // Returns one page: { items, next_cursor, total_count? }
   getOrders: (filters = {}) => {
     const params = new URLSearchParams();
     if (filters.status) params.append('status', filters.status);
     if (filters.customer_id) params.append('customer_id', filters.customer_id);
     if (filters.period) params.append('period', filters.period);
+    if (filters.cursor) params.append('cursor', filters.cursor);
+    if (filters.limit) params.append('limit', filters.limit);
+    if (filters.include_total) params.append('include_total', 'true');
     return api.get(`/orders?${params.toString()}`);
   },
   createOrder: (data) => api.post('/orders', data),
+  // orders: [{ customer_id, quantity_kg }]; returns { created, failed, results: [{ index, id } | { index, error }] }
+  createOrdersBulk: (orders) => api.post('/orders/bulk', { orders }),
   updateOrder: (orderId, data) => api.put(`/orders/${orderId}`, data),
-  updateOrderStatus: (orderId, status) => api.put(`/orders/${orderId}/status`, { status })
+  updateOrderStatus: (orderId, status) => api.put(`/orders/${orderId}/status`, { status }),
+  // orders: [{ id, status }]; returns { updated, failed, results: [{ index, id, status } | { index, error }] }
+  updateOrderStatusesBulk: (orders) => api.put('/orders/bulk/status', { orders })
 };
 
 // Payments API
 export const paymentsAPI = {
-  getOrderPayments: (orderId) => api.get(`/orders/${orderId}/payments`),
+  getOrderPayments: (orderId) => fetchAllPages(`/orders/${orderId}/payments`),
   addPayment: (orderId, data) => api.post(`/orders/${orderId}/payments`, data),
+  // payments: [{ order_id, amount, payment_method, notes }]; returns { created, failed, results }
+  addPaymentsBulk: (payments) => api.post('/orders/bulk/payments', { payments }),
   deletePayment: (orderId, paymentId) => api.delete(`/orders/${orderId}/payments/${paymentId}`)
 };
 
@@ -60,6 +96,35 @@ export const paymentsAPI = {
 export const reportsAPI = {
   getSalesReport: (period) => api.get('/reports/sales', { params: { period } }),
   getInventoryReport: () => api.get('/reports/inventory'),
+  getTimeseries: (params = {}) => api.get('/reports/timeseries', { params }),
+};
+
+// Dashboard API
+export const dashboardAPI = {
+  // Stock, counts, monthly sales, revenue trend and recent orders in one request
+  getSummary: () => api.get('/dashboard/summary'),
+};
+
+// Sync API
+export const syncAPI = {
+  // Rows changed since a version: { version, orders, customers, inventory, payments, deleted }.
+  // Omit since for a full sync; apply `deleted` before upserting the changed rows.
+  getChanges: (since) => api.get('/sync', { params: since === undefined ? {} : { since } }),
+};
+
+// Live updates over server-sent events. EventSource cannot send headers, so the
+// token goes in the query string; the browser reconnects with Last-Event-ID.
+// Returns the EventSource (close it on unmount), or null when signed out.
+const LIVE_EVENT_TYPES = ['order_created', 'orders_created', 'status_changed', 'statuses_changed', 'payment_added', 'payments_added', 'stock_changed', 'resync'];
+
+export const subscribeToEvents = (onEvent) => {
+  const user = authService.getCurrentUser();
+  if (!user || typeof EventSource === 'undefined') return null;
+  const source = new EventSource(`${API_BASE_URL}/events?token=${encodeURIComponent(user.token)}`);
+  LIVE_EVENT_TYPES.forEach((type) =>
+    source.addEventListener(type, (event) => onEvent(type, JSON.parse(event.data)))
+  );
+  return source;
 };
 
 export default api; 
\ No newline at end of file
@@ -51,8 +51,14 @@ export const authService = {
     localStorage.setItem('user', JSON.stringify(user));
   },
 
-  // Remove current user from localStorage
+  // Revoke the token on the server and remove current user from localStorage
   logout: () => {
+    const user = authService.getCurrentUser();
+    if (user && user.token) {
+      authAPI.post('/auth/signout', null, {
+        headers: { Authorization: `Bearer ${user.token}` }
+      }).catch(() => {});  // signing out locally must not wait for the server
+    }
     localStorage.removeItem('user');
   },
 
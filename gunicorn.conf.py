@@ -0,0 +1,22 @@
+# Gunicorn settings for the JB-Rice-Pro backend.
+# Picked up automatically by `gunicorn app:app` when started from the repo root;
+# server/render.yaml starts from server/ and passes it with `-c ../gunicorn.conf.py`.
+
+import os
+
+# Import the app once in the master; workers fork with the modules already loaded
+preload_app = True
+
+# Threaded workers: an open /api/events stream holds one thread, not a whole worker
+# process (EVENTS_MAX_STREAMS caps the streams per worker below the thread count)
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+def on_starting(server):
+    """Create/upgrade the database once in the master, before any worker forks"""
+    from app import app, bootstrap_database
+    from server.extensions import db
+
+    bootstrap_database(app)
+    with app.app_context():
+        db.engine.dispose()  # workers must not share the master's connections
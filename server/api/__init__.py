@@ -0,0 +1,9 @@
+from importlib import import_module
+
+# Blueprint modules, imported by register_blueprints() rather than at package import
+BLUEPRINTS = ('system', 'auth', 'inventory', 'customers', 'orders', 'payments', 'reports', 'dashboard', 'sync', 'events')
+
+def register_blueprints(app):
+    """Import each API blueprint module and attach its blueprint to the app"""
+    for name in BLUEPRINTS:
+        app.register_blueprint(import_module(f'{__name__}.{name}').bp)
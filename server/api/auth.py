@@ -0,0 +1,209 @@
+from flask import Blueprint, current_app, request, jsonify
+from datetime import timedelta
+import secrets
+
+from ..extensions import db
+from ..models import get_eat_time, User
+from ..security import (
+    validate_password, hash_password, verify_password, password_needs_rehash, PasswordHasherBusy,
+    dummy_password_hash, issue_token, revoke_token, get_bearer_token
+)
+
+bp = Blueprint('auth', __name__)
+
+def hasher_busy_response():
+    """503 asking the client to retry once a password hashing slot frees up"""
+    return jsonify({'error': 'Too many sign-in requests, please try again'}), 503, {'Retry-After': '1'}
+
+# Authentication routes
+@bp.route('/api/auth/signup', methods=['POST'])
+def signup():
+    """User registration"""
+    try:
+        data = request.get_json()
+        username = data.get('username', '').strip()
+        email = data.get('email', '').strip()
+        phone = data.get('phone', '').strip()
+        password = data.get('password', '')
+        confirm_password = data.get('confirm_password', '')
+        
+        # Validation
+        if not all([username, email, phone, password, confirm_password]):
+            return jsonify({'error': 'All fields are required'}), 400
+        
+        if password != confirm_password:
+            return jsonify({'error': 'Passwords do not match'}), 400
+        
+        # Password validation
+        is_valid, message = validate_password(password)
+        if not is_valid:
+            return jsonify({'error': message}), 400
+        
+        # Check if user already exists
+        if User.query.filter_by(username=username).first():
+            return jsonify({'error': 'Username already exists'}), 400
+        
+        if User.query.filter_by(email=email).first():
+            return jsonify({'error': 'Email already exists'}), 400
+        
+        # Create user
+        user = User(
+            username=username,
+            email=email,
+            phone=phone,
+            password_hash=hash_password(password)
+        )
+        
+        db.session.add(user)
+        db.session.commit()
+        
+        return jsonify({'message': 'User registered successfully'}), 201
+        
+    except PasswordHasherBusy:
+        db.session.rollback()
+        return hasher_busy_response()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/auth/signin', methods=['POST'])
+def signin():
+    """User login"""
+    try:
+        data = request.get_json()
+        username_or_email = data.get('username_or_email', '').strip()
+        password = data.get('password', '')
+        
+        if not username_or_email or not password:
+            return jsonify({'error': 'Username/email and password are required'}), 400
+        
+        # Find user by username or email
+        user = User.query.filter(
+            (User.username == username_or_email) | (User.email == username_or_email)
+        ).first()
+        
+        if not user:
+            # Run the KDF anyway so response times don't reveal which accounts exist
+            verify_password(password, dummy_password_hash())
+            return jsonify({'error': 'Invalid credentials'}), 401
+        if not verify_password(password, user.password_hash):
+            return jsonify({'error': 'Invalid credentials'}), 401
+        
+        user_data = {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email
+        }
+        
+        # Upgrade legacy or outdated hashes while the plaintext is at hand
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = hash_password(password)
+            db.session.commit()
+        
+        return jsonify({
+            'message': 'Login successful',
+            'user': user_data,
+            'token': issue_token(user_data['id']),
+            'expires_in': current_app.config['TOKEN_TTL_SECONDS']
+        }), 200
+        
+    except PasswordHasherBusy:
+        db.session.rollback()
+        return hasher_busy_response()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/auth/signout', methods=['POST'])
+def signout():
+    """Revoke the current token"""
+    try:
+        token = get_bearer_token()
+        if not token or not revoke_token(token):
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        db.session.commit()
+        
+        return jsonify({'message': 'Signed out successfully'}), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/auth/forgot-password', methods=['POST'])
+def forgot_password():
+    """Send password reset email"""
+    try:
+        data = request.get_json()
+        email = data.get('email', '').strip()
+        
+        if not email:
+            return jsonify({'error': 'Email is required'}), 400
+        
+        user = User.query.filter_by(email=email).first()
+        
+        if not user:
+            return jsonify({'error': 'Email not found'}), 404
+        
+        # Generate reset token
+        reset_token = secrets.token_urlsafe(32)
+        user.reset_token = reset_token
+        user.reset_token_expiry = get_eat_time() + timedelta(hours=1)
+        
+        db.session.commit()
+        
+        # In production, send email here
+        # For demo, just return the token
+        return jsonify({
+            'message': 'Password reset link sent to your email',
+            'reset_token': reset_token  # Remove this in production
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/auth/reset-password', methods=['POST'])
+def reset_password():
+    """Reset password using token"""
+    try:
+        data = request.get_json()
+        token = data.get('token', '').strip()
+        new_password = data.get('new_password', '')
+        confirm_password = data.get('confirm_password', '')
+        
+        if not all([token, new_password, confirm_password]):
+            return jsonify({'error': 'All fields are required'}), 400
+        
+        if new_password != confirm_password:
+            return jsonify({'error': 'Passwords do not match'}), 400
+        
+        # Password validation
+        is_valid, message = validate_password(new_password)
+        if not is_valid:
+            return jsonify({'error': message}), 400
+        
+        # Find user by token
+        user = User.query.filter_by(reset_token=token).first()
+        
+        if not user:
+            return jsonify({'error': 'Invalid reset token'}), 400
+        
+        if user.reset_token_expiry < get_eat_time():
+            return jsonify({'error': 'Reset token has expired'}), 400
+        
+        # Update password
+        user.password_hash = hash_password(new_password)
+        user.reset_token = None
+        user.reset_token_expiry = None
+        
+        db.session.commit()
+        
+        return jsonify({'message': 'Password reset successfully'}), 200
+        
+    except PasswordHasherBusy:
+        db.session.rollback()
+        return hasher_busy_response()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,135 @@
+from flask import Blueprint, request, jsonify
+
+from ..extensions import db
+from ..models import eat_day, Customer, Order
+from ..pagination import paginate_newest_first
+from ..sales import bump_daily_sales, bump_record_counts
+from ..security import get_current_user_id
+from ..serialization import encode_customer
+from ..versioning import conditional_on_data_version
+
+bp = Blueprint('customers', __name__)
+
+@bp.route('/api/customers', methods=['GET'])
+@conditional_on_data_version
+def get_customers():
+    """Get all customers with optional filtering"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        customer_type = request.args.get('type')
+        query = Customer.query.filter(Customer.user_id == user_id)
+        
+        if customer_type:
+            query = query.filter_by(customer_type=customer_type)
+        
+        return paginate_newest_first(query, Customer.created_at, Customer.id, encode_customer)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/customers', methods=['POST'])
+def add_customer():
+    """Add new customer"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        data = request.get_json()
+        name = data.get('name', '').strip()
+        phone = data.get('phone', '').strip()
+        email = data.get('email', '').strip()
+        customer_type = data.get('customer_type', 'individual')
+        address = data.get('address', '').strip()
+        
+        if not name or not phone:
+            return jsonify({'error': 'Name and phone are required'}), 400
+        
+        if customer_type not in ['restaurant', 'individual']:
+            return jsonify({'error': 'Customer type must be restaurant or individual'}), 400
+        
+        new_customer = Customer(
+            user_id=user_id,
+            name=name,
+            phone=phone,
+            email=email,
+            customer_type=customer_type,
+            address=address
+        )
+        
+        db.session.add(new_customer)
+        bump_record_counts(user_id, customers=1)
+        db.session.commit()
+        
+        return jsonify({'message': 'Customer added successfully', 'id': new_customer.id}), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/customers/<int:customer_id>', methods=['PUT'])
+def update_customer(customer_id):
+    """Update customer"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        customer = Customer.query.filter_by(id=customer_id, user_id=user_id).first()
+        if not customer:
+            return jsonify({'error': 'Customer not found'}), 404
+        
+        data = request.get_json()
+        
+        new_type = data.get('customer_type', customer.customer_type)
+        if new_type != customer.customer_type:
+            # Delivered orders move to the other customer type in the daily summary
+            per_day = {}
+            for order_date, kg, amount, paid in db.session.query(
+                Order.order_date, Order.quantity_kg, Order.total_amount, Order.amount_paid
+            ).filter(
+                Order.user_id == user_id,
+                Order.customer_id == customer.id,
+                Order.delivery_status == 'delivered'
+            ):
+                totals = per_day.setdefault(eat_day(order_date), [0, 0, 0, 0])
+                for i, value in enumerate((1, kg, amount, paid)):
+                    totals[i] += value
+            for day, (orders, kg, amount, paid) in per_day.items():
+                bump_daily_sales(user_id, day, customer.customer_type, -orders, -kg, -amount, -paid)
+                bump_daily_sales(user_id, day, new_type, orders, kg, amount, paid)
+        
+        customer.name = data.get('name', customer.name)
+        customer.phone = data.get('phone', customer.phone)
+        customer.email = data.get('email', customer.email)
+        customer.customer_type = data.get('customer_type', customer.customer_type)
+        customer.address = data.get('address', customer.address)
+        
+        db.session.commit()
+        
+        return jsonify({'message': 'Customer updated successfully'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/customers/<int:customer_id>', methods=['DELETE'])
+def delete_customer(customer_id):
+    """Delete customer"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        customer = Customer.query.filter_by(id=customer_id, user_id=user_id).first()
+        if not customer:
+            return jsonify({'error': 'Customer not found'}), 404
+        
+        db.session.delete(customer)
+        bump_record_counts(user_id, customers=-1)
+        db.session.commit()
+        
+        return jsonify({'message': 'Customer deleted successfully'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
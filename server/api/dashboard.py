@@ -0,0 +1,94 @@
+from flask import Blueprint, jsonify
+from datetime import timedelta
+
+from ..extensions import db
+from ..models import get_eat_time, eat_day, Customer, Order, DailySalesSummary, RecordCounts
+from ..security import get_current_user_id
+from ..serialization import encode_order
+from ..stock import calculate_inventory
+from ..versioning import conditional_on_data_version
+from .orders import ORDER_LIST_COLUMNS
+
+bp = Blueprint('dashboard', __name__)
+
+DASHBOARD_SERIES_DAYS = 30  # daily revenue points on the trend chart
+DASHBOARD_RECENT_ORDERS = 5
+
+@bp.route('/api/dashboard/summary', methods=['GET'])
+@conditional_on_data_version
+def get_dashboard_summary():
+    """Everything the dashboard shows, from four queries whose cost doesn't grow with history"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+
+        inventory_data = calculate_inventory(user_id)
+        if 'error' in inventory_data:
+            return jsonify({'error': inventory_data['error']}), 500
+
+        counts = db.session.query(
+            RecordCounts.order_count, RecordCounts.customer_count
+        ).filter(RecordCounts.user_id == user_id).first()
+        if counts is None:
+            # Users with no orders or customers yet have no counts row
+            counts = (0, 0)
+
+        # Same 30-day window as GET /api/reports/sales?period=month, one row per day and customer type
+        end_date = get_eat_time()
+        today = eat_day(end_date)
+        start_date = (end_date - timedelta(days=30)).replace(hour=0, minute=0, second=0, microsecond=0)
+        rows = db.session.query(
+            DailySalesSummary.day,
+            DailySalesSummary.customer_type,
+            DailySalesSummary.order_count,
+            DailySalesSummary.amount_paid,
+            DailySalesSummary.order_amount
+        ).filter(
+            DailySalesSummary.user_id == user_id,
+            DailySalesSummary.day >= start_date.date(),
+            DailySalesSummary.day <= today
+        ).all()
+
+        by_type = {'restaurant': [0, 0], 'individual': [0, 0]}
+        by_day = {}
+        for day, customer_type, order_count, paid, amount in rows:
+            totals = by_type.setdefault(customer_type, [0, 0])
+            totals[0] += order_count
+            totals[1] += paid
+            by_day[day] = by_day.get(day, 0) + paid
+        total_revenue = sum(row.amount_paid for row in rows)  # Actual payments received
+        total_orders_amount = sum(row.order_amount for row in rows)
+        series_days = [today - timedelta(days=offset) for offset in range(DASHBOARD_SERIES_DAYS - 1, -1, -1)]
+
+        recent_orders = db.session.query(*ORDER_LIST_COLUMNS).join(
+            Customer, Order.customer_id == Customer.id
+        ).filter(Order.user_id == user_id).order_by(
+            Order.order_date.desc(), Order.id.desc()
+        ).limit(DASHBOARD_RECENT_ORDERS).all()
+
+        return jsonify({
+            'inventory': inventory_data,
+            'orders_count': counts[0],
+            'customers_count': counts[1],
+            'sales': {
+                'period': 'month',
+                'start_date': start_date.isoformat(),
+                'end_date': end_date.isoformat(),
+                'total_orders': sum(totals[0] for totals in by_type.values()),
+                'total_revenue': total_revenue,
+                'total_orders_amount': total_orders_amount,
+                'total_pending_payments': total_orders_amount - total_revenue,
+                'restaurant_orders': by_type['restaurant'][0],
+                'individual_orders': by_type['individual'][0],
+                'restaurant_revenue': by_type['restaurant'][1],
+                'individual_revenue': by_type['individual'][1]
+            },
+            'revenue_series': [{
+                'start': day.isoformat(),
+                'value': by_day.get(day, 0)
+            } for day in series_days],
+            'recent_orders': [encode_order(order) for order in recent_orders]
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
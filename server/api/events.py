@@ -0,0 +1,39 @@
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+
+from ..events import acquire_stream_slot, release_stream_slot, event_stream
+from ..security import get_bearer_token, verify_token
+
+bp = Blueprint('events', __name__)
+
+@bp.route('/api/events', methods=['GET'])
+def stream_events():
+    """Server-sent events with live order, payment and stock updates for the signed-in user"""
+    try:
+        # EventSource cannot send headers, so browsers pass the token as ?token=
+        token = get_bearer_token() or request.args.get('token')
+        user_id = verify_token(token) if token else None
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+
+        last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+        try:
+            last_event_id = int(last_event_id) if last_event_id else None
+        except ValueError:
+            return jsonify({'error': 'Last-Event-ID must be an event id'}), 400
+
+        frames = event_stream(user_id, token, last_event_id)
+
+        # Each open stream holds a worker thread; cap them so ordinary requests keep some.
+        # Claimed only once nothing left here can raise, so the slot is always released on close
+        if not acquire_stream_slot():
+            return jsonify({'error': 'Too many open event streams, retry shortly'}), 503, {'Retry-After': '5'}
+
+        response = Response(
+            stream_with_context(frames),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+        response.call_on_close(release_stream_slot)
+        return response
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,137 @@
+from flask import Blueprint, request, jsonify
+from datetime import timedelta
+
+from ..events import publish_event
+from ..extensions import db
+from ..models import get_eat_time, Inventory
+from ..pagination import paginate_newest_first
+from ..security import get_current_user_id
+from ..serialization import encode_inventory
+from ..stock import calculate_inventory, record_stock_movement
+from ..versioning import conditional_on_data_version
+
+bp = Blueprint('inventory', __name__)
+
+@bp.route('/api/inventory', methods=['GET'])
+@conditional_on_data_version
+def get_inventory():
+    """Get current inventory status"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        inventory_data = calculate_inventory(user_id)
+        if 'error' in inventory_data:
+            return jsonify({'error': inventory_data['error']}), 500
+        return jsonify(inventory_data)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/inventory/history', methods=['GET'])
+@conditional_on_data_version
+def get_inventory_history():
+    """Get inventory history with timestamps and filtering"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        period = request.args.get('period', 'all')  # week, month, all
+        end_date = get_eat_time()
+        
+        if period == 'week':
+            start_date = end_date - timedelta(days=7)
+            query = Inventory.query.filter(
+                Inventory.user_id == user_id,
+                Inventory.date_added >= start_date
+            )
+        elif period == 'month':
+            start_date = end_date - timedelta(days=30)
+            query = Inventory.query.filter(
+                Inventory.user_id == user_id,
+                Inventory.date_added >= start_date
+            )
+        else:  # all
+            query = Inventory.query.filter(Inventory.user_id == user_id)
+        
+        return paginate_newest_first(query, Inventory.date_added, Inventory.id, encode_inventory)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/inventory', methods=['POST'])
+def add_inventory():
+    """Add new rice bags to inventory"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        data = request.get_json()
+        bags = data.get('bags', 0)
+        cost_per_bag = data.get('cost_per_bag', 9000.0)
+        
+        if bags <= 0:
+            return jsonify({'error': 'Number of bags must be positive'}), 400
+        
+        total_kg = bags * 60  # 60kg per bag
+        
+        new_inventory = Inventory(
+            user_id=user_id,
+            bags_added=bags,
+            total_kg=total_kg,
+            cost_per_bag=cost_per_bag
+        )
+        
+        available_kg = record_stock_movement(user_id, 'purchase', total_kg, bags=bags, inventory=new_inventory)
+        db.session.add(new_inventory)
+        publish_event(user_id, 'stock_changed', available_kg=round(available_kg, 2))
+        db.session.commit()
+        
+        return jsonify({'message': f'Added {bags} bags ({total_kg}kg) to inventory'}), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/inventory/<int:inventory_id>', methods=['PUT'])
+def update_inventory(inventory_id):
+    """Update inventory record"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        inventory = Inventory.query.filter_by(id=inventory_id, user_id=user_id).first()
+        if not inventory:
+            return jsonify({'error': 'Inventory record not found'}), 404
+        
+        data = request.get_json()
+        
+        bags = data.get('bags', inventory.bags_added)
+        cost_per_bag = data.get('cost_per_bag', inventory.cost_per_bag)
+        
+        if bags <= 0:
+            return jsonify({'error': 'Number of bags must be positive'}), 400
+        
+        total_kg = bags * 60  # 60kg per bag
+        
+        if total_kg != inventory.total_kg or bags != inventory.bags_added:
+            available_kg = record_stock_movement(
+                user_id, 'adjustment', total_kg - inventory.total_kg,
+                bags=bags - inventory.bags_added, inventory=inventory
+            )
+            publish_event(user_id, 'stock_changed', available_kg=round(available_kg, 2))
+        
+        inventory.bags_added = bags
+        inventory.total_kg = total_kg
+        inventory.cost_per_bag = cost_per_bag
+        
+        db.session.commit()
+        
+        return jsonify({
+            'message': f'Updated inventory record: {bags} bags ({total_kg}kg)',
+            'inventory': encode_inventory(inventory)
+        })
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
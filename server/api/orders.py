@@ -0,0 +1,466 @@
+from flask import Blueprint, request, jsonify
+from datetime import timedelta
+from sqlalchemy.orm.exc import StaleDataError
+
+from ..events import publish_event
+from ..extensions import db
+from ..models import get_eat_time, eat_day, Customer, Order
+from ..pagination import paginate_newest_first
+from ..sales import sales_snapshot, apply_sales_change, apply_sales_changes, bump_record_counts
+from ..security import get_current_user_id
+from ..serialization import encode_order
+from ..stock import record_stock_movement, record_order_movements, reserve_stock, release_stock
+from ..versioning import bump_data_version, conditional_on_data_version
+
+bp = Blueprint('orders', __name__)
+
+ORDER_LIST_COLUMNS = (
+    Order.id, Order.customer_id, Customer.name.label('customer_name'),
+    Order.quantity_kg, Order.price_per_kg, Order.total_amount, Order.order_date,
+    Order.delivery_status, Order.delivery_date, Order.payment_status,
+    Order.amount_paid, Order.amount_remaining
+)
+
+MAX_BULK_ORDERS = 1000
+
+def price_per_kg_for(customer_type):
+    """KES per kg: restaurants pay the trade price"""
+    return 180 if customer_type == 'restaurant' else 200
+
+@bp.route('/api/orders', methods=['GET'])
+@conditional_on_data_version
+def get_orders():
+    """Get all orders with optional filtering"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        status = request.args.get('status')
+        customer_id = request.args.get('customer_id')
+        period = request.args.get('period', 'all')  # week, month, all
+        end_date = get_eat_time()
+        
+        # Column projection joined to Customer once; rows are plain named tuples
+        query = db.session.query(*ORDER_LIST_COLUMNS).join(
+            Customer, Order.customer_id == Customer.id
+        ).filter(Order.user_id == user_id)
+        
+        # Apply period filter
+        if period == 'week':
+            start_date = end_date - timedelta(days=7)
+            query = query.filter(Order.order_date >= start_date)
+        elif period == 'month':
+            start_date = end_date - timedelta(days=30)
+            query = query.filter(Order.order_date >= start_date)
+        # 'all' doesn't add any date filter
+        
+        # Apply other filters
+        if status:
+            query = query.filter(Order.delivery_status == status)
+        if customer_id:
+            query = query.filter(Order.customer_id == customer_id)
+        
+        return paginate_newest_first(query, Order.order_date, Order.id, encode_order)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/orders', methods=['POST'])
+def create_order():
+    """Create new order"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        data = request.get_json()
+        customer_id = data.get('customer_id')
+        quantity_kg = data.get('quantity_kg', 0)
+        
+        if quantity_kg < 5 or quantity_kg % 5 != 0:
+            return jsonify({'error': 'Quantity must be at least 5kg and in multiples of 5kg'}), 400
+        
+        customer = Customer.query.get_or_404(customer_id)
+        price_per_kg = price_per_kg_for(customer.customer_type)
+        total_amount = quantity_kg * price_per_kg
+        
+        # Reserve stock for the pending order
+        if not reserve_stock(user_id, quantity_kg):
+            db.session.rollback()
+            return jsonify({'error': 'Insufficient inventory'}), 400
+        
+        new_order = Order(
+            user_id=user_id,
+            customer_id=customer_id,
+            quantity_kg=quantity_kg,
+            price_per_kg=price_per_kg,
+            total_amount=total_amount,
+            amount_remaining=total_amount  # Initially, amount remaining equals total amount
+        )
+        
+        db.session.add(new_order)
+        bump_record_counts(user_id, orders=1)
+        db.session.flush()
+        publish_event(
+            user_id, 'order_created', order_id=new_order.id, customer_id=customer.id,
+            quantity_kg=quantity_kg, total_amount=total_amount
+        )
+        db.session.commit()
+        
+        return jsonify({'message': 'Order created successfully', 'id': new_order.id}), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/orders/bulk', methods=['POST'])
+def create_orders_bulk():
+    """Create many orders in one transaction and report the outcome of each item.
+
+    Items with a bad quantity or an unknown customer fail on their own; the
+    rest are reserved against stock together, so either all of them are
+    created or, when stock is short, none.
+    """
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        data = request.get_json()
+        items = data.get('orders') if isinstance(data, dict) else None
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'orders must be a non-empty list'}), 400
+        if len(items) > MAX_BULK_ORDERS:
+            return jsonify({'error': f'At most {MAX_BULK_ORDERS} orders per request'}), 400
+        
+        # Validate every item before touching the database
+        results = [None] * len(items)
+        valid = []
+        for index, item in enumerate(items):
+            item = item if isinstance(item, dict) else {}
+            customer_id = item.get('customer_id')
+            quantity_kg = item.get('quantity_kg', 0)
+            if isinstance(quantity_kg, bool) or not isinstance(quantity_kg, (int, float)) \
+                    or quantity_kg < 5 or quantity_kg % 5 != 0:
+                results[index] = {'index': index, 'error': 'Quantity must be at least 5kg and in multiples of 5kg'}
+            elif isinstance(customer_id, bool) or not isinstance(customer_id, int):
+                results[index] = {'index': index, 'error': 'customer_id is required'}
+            else:
+                valid.append((index, customer_id, quantity_kg))
+        
+        # One IN query for every customer the batch names
+        customer_ids = {customer_id for _, customer_id, _ in valid}
+        customer_types = dict(db.session.query(Customer.id, Customer.customer_type).filter(
+            Customer.user_id == user_id, Customer.id.in_(customer_ids)
+        ).all()) if customer_ids else {}
+        
+        rows, row_indexes = [], []
+        order_date = get_eat_time()
+        for index, customer_id, quantity_kg in valid:
+            if customer_id not in customer_types:
+                results[index] = {'index': index, 'error': 'Customer not found'}
+                continue
+            price_per_kg = price_per_kg_for(customer_types[customer_id])
+            rows.append({
+                'user_id': user_id,
+                'customer_id': customer_id,
+                'quantity_kg': quantity_kg,
+                'price_per_kg': price_per_kg,
+                'total_amount': quantity_kg * price_per_kg,
+                'order_date': order_date,
+                'delivery_status': 'pending',
+                'payment_status': 'unpaid',
+                'amount_paid': 0.0,
+                'amount_remaining': quantity_kg * price_per_kg
+            })
+            row_indexes.append(index)
+        
+        if not rows:
+            return jsonify({'error': 'No valid orders', 'created': 0, 'results': results}), 400
+        
+        # A single reservation covers the whole batch
+        quantity_kg = sum(row['quantity_kg'] for row in rows)
+        if not reserve_stock(user_id, quantity_kg):
+            db.session.rollback()
+            for index in row_indexes:
+                results[index] = {'index': index, 'error': 'Insufficient inventory for this batch'}
+            return jsonify({'error': 'Insufficient inventory', 'created': 0, 'results': results}), 400
+        
+        # Bulk INSERT skips the flush hook, so version the rows here
+        version = bump_data_version(user_id)
+        for row in rows:
+            row['updated_version'] = version
+        order_ids = db.session.scalars(
+            db.insert(Order).returning(Order.id, sort_by_parameter_order=True), rows
+        ).all()
+        
+        total_amount = sum(row['total_amount'] for row in rows)
+        bump_record_counts(user_id, orders=len(order_ids))
+        publish_event(
+            user_id, 'orders_created', order_ids=order_ids,
+            quantity_kg=quantity_kg, total_amount=total_amount
+        )
+        db.session.commit()
+        
+        for index, order_id in zip(row_indexes, order_ids):
+            results[index] = {'index': index, 'id': order_id}
+        return jsonify({
+            'message': f'{len(order_ids)} orders created successfully',
+            'created': len(order_ids),
+            'failed': len(items) - len(order_ids),
+            'results': results
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/orders/bulk/status', methods=['PUT'])
+def update_order_statuses_bulk():
+    """Apply many delivery status changes in one transaction and report the outcome of each item.
+
+    Stock, the sales summary and the orders themselves are each updated
+    with a few set-based statements. Orders whose status changed since
+    they were read make the whole batch fail with 409, to be retried.
+    """
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        data = request.get_json()
+        items = data.get('orders') if isinstance(data, dict) else None
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'orders must be a non-empty list'}), 400
+        if len(items) > MAX_BULK_ORDERS:
+            return jsonify({'error': f'At most {MAX_BULK_ORDERS} orders per request'}), 400
+        
+        results = [None] * len(items)
+        requested = {}  # order id -> (index, new status)
+        for index, item in enumerate(items):
+            item = item if isinstance(item, dict) else {}
+            order_id = item.get('id')
+            new_status = item.get('status')
+            if new_status not in ['pending', 'delivered', 'cancelled']:
+                results[index] = {'index': index, 'error': 'Invalid status'}
+            elif isinstance(order_id, bool) or not isinstance(order_id, int):
+                results[index] = {'index': index, 'error': 'id is required'}
+            elif order_id in requested:
+                results[index] = {'index': index, 'error': 'Order appears more than once'}
+            else:
+                requested[order_id] = (index, new_status)
+        
+        orders = db.session.query(
+            Order.id, Order.delivery_status, Order.quantity_kg, Order.total_amount,
+            Order.amount_paid, Order.order_date, Customer.customer_type
+        ).join(Customer, Order.customer_id == Customer.id).filter(
+            Order.user_id == user_id, Order.id.in_(requested)
+        ).all() if requested else []
+        found = {order.id: order for order in orders}
+        for order_id, (index, _) in requested.items():
+            if order_id not in found:
+                results[index] = {'index': index, 'error': 'Order not found'}
+        
+        # Pending orders hold a reservation; delivered orders leave stock
+        changing = [(found[order_id], index, new_status) for order_id, (index, new_status) in requested.items()
+                    if order_id in found and found[order_id].delivery_status != new_status]
+        release_kg = sum(order.quantity_kg for order, _, new_status in changing
+                         if order.delivery_status == 'pending' and new_status == 'cancelled')
+        if release_kg:
+            release_stock(user_id, release_kg)
+        reactivated = [(order, index) for order, index, _ in changing if order.delivery_status == 'cancelled']
+        if reactivated and not reserve_stock(user_id, sum(order.quantity_kg for order, _ in reactivated)):
+            for order, index in reactivated:
+                results[index] = {'index': index, 'error': 'Insufficient inventory'}
+            changing = [change for change in changing if change[0].delivery_status != 'cancelled']
+        
+        movements, sales_changes = [], []
+        for order, index, new_status in changing:
+            old_status = 'pending' if order.delivery_status == 'cancelled' else order.delivery_status
+            if old_status == 'pending' and new_status == 'delivered':
+                movements.append(('sale', order.id, -order.quantity_kg, -order.quantity_kg))
+            elif old_status == 'delivered':
+                movements.append(('sale_reversal', order.id, order.quantity_kg,
+                                  order.quantity_kg if new_status == 'pending' else 0))
+            snapshot = (eat_day(order.order_date), order.customer_type,
+                        order.quantity_kg, order.total_amount, order.amount_paid)
+            sales_changes.append((
+                snapshot if order.delivery_status == 'delivered' else None,
+                snapshot if new_status == 'delivered' else None
+            ))
+        available_kg = record_order_movements(user_id, movements) if movements else None
+        apply_sales_changes(user_id, sales_changes)
+        
+        if changing:
+            # One UPDATE per (old, new) status pair, each guarded by the status read above
+            transitions = {}
+            for order, _, new_status in changing:
+                transitions.setdefault((order.delivery_status, new_status), []).append(order.id)
+            version = bump_data_version(user_id)
+            now = get_eat_time()
+            matched = 0
+            for (old_status, new_status), order_ids in transitions.items():
+                values = {'delivery_status': new_status, 'version': Order.version + 1, 'updated_version': version}
+                if new_status == 'delivered':
+                    values['delivery_date'] = now
+                matched += db.session.execute(db.update(Order).where(
+                    Order.user_id == user_id,
+                    Order.id.in_(order_ids),
+                    Order.delivery_status == old_status
+                ).values(**values).execution_options(synchronize_session=False)).rowcount
+            if matched != len(changing):
+                db.session.rollback()
+                return jsonify({'error': 'Some orders changed while updating, please retry'}), 409
+            
+            publish_event(user_id, 'statuses_changed', orders=[
+                {'order_id': order.id, 'status': new_status} for order, _, new_status in changing
+            ])
+        if available_kg is not None:
+            publish_event(user_id, 'stock_changed', available_kg=round(available_kg, 2))
+        db.session.commit()
+        
+        for order_id, (index, new_status) in requested.items():
+            if results[index] is None:
+                results[index] = {'index': index, 'id': order_id, 'status': new_status}
+        updated = sum(1 for result in results if 'id' in result)
+        return jsonify({
+            'message': f'{updated} orders updated successfully',
+            'updated': updated,
+            'failed': len(items) - updated,
+            'results': results
+        }), 200 if updated else 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/orders/<int:order_id>/status', methods=['PUT'])
+def update_order_status(order_id):
+    """Update order delivery status"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        order = Order.query.filter_by(id=order_id, user_id=user_id).first()
+        if not order:
+            return jsonify({'error': 'Order not found'}), 404
+        
+        data = request.get_json()
+        new_status = data.get('status')
+        
+        if new_status not in ['pending', 'delivered', 'cancelled']:
+            return jsonify({'error': 'Invalid status'}), 400
+        
+        sales_before = sales_snapshot(order)
+        
+        # Pending orders hold a reservation; delivered orders leave stock
+        old_status = order.delivery_status
+        quantity_kg = order.quantity_kg
+        if old_status == 'cancelled' and new_status != 'cancelled':
+            if not reserve_stock(user_id, quantity_kg):
+                db.session.rollback()
+                return jsonify({'error': 'Insufficient inventory'}), 400
+            old_status = 'pending'
+        
+        available_kg = None
+        if old_status == 'pending' and new_status == 'delivered':
+            available_kg = record_stock_movement(user_id, 'sale', -quantity_kg, reserved_kg=-quantity_kg, order=order)
+        elif old_status == 'pending' and new_status == 'cancelled':
+            release_stock(user_id, quantity_kg)
+        elif old_status == 'delivered' and new_status != 'delivered':
+            available_kg = record_stock_movement(
+                user_id, 'sale_reversal', quantity_kg,
+                reserved_kg=quantity_kg if new_status == 'pending' else 0, order=order
+            )
+        
+        status_changed = order.delivery_status != new_status
+        order.delivery_status = new_status
+        if new_status == 'delivered':
+            order.delivery_date = get_eat_time()
+        apply_sales_change(user_id, sales_before, sales_snapshot(order))
+        
+        if status_changed:
+            publish_event(user_id, 'status_changed', order_id=order.id, status=new_status)
+        if available_kg is not None:
+            publish_event(user_id, 'stock_changed', available_kg=round(available_kg, 2))
+        db.session.commit()
+        return jsonify({
+            'message': 'Order status updated successfully',
+            'order': {
+                'id': order.id,
+                'delivery_status': order.delivery_status,
+                'delivery_date': order.delivery_date.isoformat() if order.delivery_date else None,
+                'payment_status': order.payment_status,
+                'amount_paid': order.amount_paid,
+                'amount_remaining': order.amount_remaining,
+                'total_amount': order.total_amount
+            }
+        })
+    except StaleDataError:
+        db.session.rollback()  # the order's version moved on since it was read
+        return jsonify({'error': 'Order was changed by someone else, please reload and retry'}), 409
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/orders/<int:order_id>', methods=['PUT'])
+def update_order(order_id):
+    """Update order details (only for pending orders)"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        order = Order.query.filter_by(id=order_id, user_id=user_id).first()
+        if not order:
+            return jsonify({'error': 'Order not found'}), 404
+
+        # Only allow editing pending orders
+        if order.delivery_status != 'pending':
+            return jsonify({'error': 'Only pending orders can be edited'}), 400
+
+        data = request.get_json()
+        customer_id = data.get('customer_id', order.customer_id)
+        quantity_kg = data.get('quantity_kg', order.quantity_kg)
+
+        if quantity_kg < 5 or quantity_kg % 5 != 0:
+            return jsonify({'error': 'Quantity must be at least 5kg and in multiples of 5kg'}), 400
+
+        # Get customer to determine price
+        customer = Customer.query.get_or_404(customer_id)
+        price_per_kg = price_per_kg_for(customer.customer_type)
+        total_amount = quantity_kg * price_per_kg
+
+        # Adjust the order's reservation by the change in quantity
+        if quantity_kg > order.quantity_kg:
+            if not reserve_stock(user_id, quantity_kg - order.quantity_kg):
+                db.session.rollback()
+                return jsonify({'error': 'Insufficient inventory'}), 400
+        elif quantity_kg < order.quantity_kg:
+            release_stock(user_id, order.quantity_kg - quantity_kg)
+
+        order.customer_id = customer_id
+        order.quantity_kg = quantity_kg
+        order.price_per_kg = price_per_kg
+        order.total_amount = total_amount
+        customer_name = customer.name  # read before commit expires it
+
+        db.session.commit()
+
+        return jsonify({
+            'message': 'Order updated successfully',
+            'order': {
+                'id': order.id,
+                'customer_id': order.customer_id,
+                'customer_name': customer_name,
+                'quantity_kg': order.quantity_kg,
+                'price_per_kg': order.price_per_kg,
+                'total_amount': order.total_amount,
+                'order_date': order.order_date.isoformat(),
+                'delivery_status': order.delivery_status
+            }
+        })
+    except StaleDataError:
+        db.session.rollback()
+        return jsonify({'error': 'Order was changed by someone else, please reload and retry'}), 409
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
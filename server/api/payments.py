@@ -0,0 +1,320 @@
+from flask import Blueprint, request, jsonify
+import random
+import time
+
+from ..events import publish_event
+from ..extensions import db
+from ..models import get_eat_time, eat_day, Customer, Order, Payment
+from ..pagination import paginate_newest_first
+from ..sales import sales_snapshot, apply_sales_change, bump_daily_sales
+from ..security import get_current_user_id
+from ..serialization import encode_payment
+from ..versioning import bump_data_version, conditional_on_data_version
+from .orders import MAX_BULK_ORDERS
+
+bp = Blueprint('payments', __name__)
+
+BALANCE_UPDATE_ATTEMPTS = 12
+BALANCE_RETRY_PAUSE = 0.005  # seconds; doubles with each attempt, randomised so retries spread out
+BALANCE_RETRY_PAUSE_MAX = 1.0
+
+def pause_before_retry(attempt):
+    if attempt + 1 < BALANCE_UPDATE_ATTEMPTS:
+        time.sleep(random.uniform(0, min(BALANCE_RETRY_PAUSE * 2 ** attempt, BALANCE_RETRY_PAUSE_MAX)))
+
+def change_amount_paid(order, amount):
+    """Add `amount` (negative to take a payment back) to an order's amount paid in one
+    compare-and-swap UPDATE; runs in the caller's transaction.
+
+    The arithmetic happens in SQL, and the row only changes if it still has
+    the version `order` was read at and amount paid stays within 0 and the
+    order total. Returns the order's new amount_paid, amount_remaining and
+    payment_status, or None if the order changed since it was read.
+
+    The user's data version is bumped only once the swap has won, so a
+    losing attempt never waits on the lock of that row.
+    """
+    amount_paid = Order.amount_paid + amount
+    amount_remaining = Order.amount_remaining - amount
+    row = db.session.execute(db.update(Order).where(
+        Order.id == order.id,
+        Order.version == order.version,
+        amount_paid <= Order.total_amount,
+        amount_paid >= 0
+    ).values(
+        amount_paid=amount_paid,
+        amount_remaining=amount_remaining,
+        payment_status=db.case((amount_remaining <= 0, 'paid'), (amount_paid <= 0, 'unpaid'), else_='partial'),
+        version=Order.version + 1
+    ).returning(
+        Order.amount_paid, Order.amount_remaining, Order.payment_status
+    ).execution_options(synchronize_session=False)).first()
+    if row is None:
+        return None
+    db.session.execute(db.update(Order).where(Order.id == order.id).values(
+        updated_version=bump_data_version(order.user_id)
+    ).execution_options(synchronize_session=False))
+    # SQLite's RETURNING can hand back whole REALs as integers
+    return {
+        'amount_paid': float(row.amount_paid),
+        'amount_remaining': float(row.amount_remaining),
+        'payment_status': row.payment_status
+    }
+
+# Payment endpoints
+@bp.route('/api/orders/<int:order_id>/payments', methods=['GET'])
+@conditional_on_data_version
+def get_order_payments(order_id):
+    """Get all payments for a specific order"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        order = Order.query.filter_by(id=order_id, user_id=user_id).first()
+        if not order:
+            return jsonify({'error': 'Order not found'}), 404
+        
+        query = Payment.query.filter_by(order_id=order_id, user_id=user_id)
+        
+        return paginate_newest_first(query, Payment.payment_date, Payment.id, encode_payment)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/orders/<int:order_id>/payments', methods=['POST'])
+def add_payment(order_id):
+    """Add a payment to an order"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        data = request.get_json()
+        amount = data.get('amount', 0)
+        payment_method = data.get('payment_method', 'cash')
+        notes = data.get('notes', '')
+        
+        if amount <= 0:
+            return jsonify({'error': 'Payment amount must be positive'}), 400
+        
+        for attempt in range(BALANCE_UPDATE_ATTEMPTS):
+            order = Order.query.filter_by(id=order_id, user_id=user_id).first()
+            if not order:
+                return jsonify({'error': 'Order not found'}), 404
+            
+            if amount > order.amount_remaining:
+                return jsonify({'error': 'Payment amount cannot exceed remaining balance'}), 400
+            
+            sales_before = sales_snapshot(order)
+            balance = change_amount_paid(order, amount)
+            if balance:
+                break
+            db.session.rollback()  # another payment got there first; re-read and try again
+            pause_before_retry(attempt)
+        else:
+            return jsonify({'error': 'Order is being updated by someone else, please retry'}), 409
+        
+        if sales_before:
+            apply_sales_change(user_id, sales_before, sales_before[:4] + (balance['amount_paid'],))
+        
+        # Create payment record
+        payment = Payment(
+            order_id=order_id,
+            user_id=user_id,
+            amount=amount,
+            payment_method=payment_method,
+            notes=notes
+        )
+        db.session.add(payment)
+        db.session.flush()
+        publish_event(
+            user_id, 'payment_added', order_id=order_id, payment_id=payment.id, amount=amount, **balance
+        )
+        db.session.commit()
+        
+        return jsonify({
+            'message': 'Payment added successfully',
+            'payment': {
+                'id': payment.id,
+                'amount': payment.amount,
+                'payment_method': payment.payment_method,
+                'payment_date': payment.payment_date.isoformat()
+            },
+            'order_status': balance
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/orders/bulk/payments', methods=['POST'])
+def add_payments_bulk():
+    """Record many payments in one transaction and report the outcome of each item.
+
+    Payments for the same order are added up; if together they exceed the
+    order's remaining balance, all of them fail. Balances are updated with
+    one UPDATE whose arithmetic and overpayment guard run in SQL.
+    """
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        data = request.get_json()
+        items = data.get('payments') if isinstance(data, dict) else None
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'payments must be a non-empty list'}), 400
+        if len(items) > MAX_BULK_ORDERS:
+            return jsonify({'error': f'At most {MAX_BULK_ORDERS} payments per request'}), 400
+        
+        results = [None] * len(items)
+        valid = []
+        for index, item in enumerate(items):
+            item = item if isinstance(item, dict) else {}
+            order_id = item.get('order_id')
+            amount = item.get('amount', 0)
+            if isinstance(amount, bool) or not isinstance(amount, (int, float)) or amount <= 0:
+                results[index] = {'index': index, 'error': 'Payment amount must be positive'}
+            elif isinstance(order_id, bool) or not isinstance(order_id, int):
+                results[index] = {'index': index, 'error': 'order_id is required'}
+            else:
+                valid.append((index, order_id, amount, item.get('payment_method', 'cash'), item.get('notes', '')))
+        
+        order_ids = {order_id for _, order_id, _, _, _ in valid}
+        orders = {order.id: order for order in db.session.query(
+            Order.id, Order.amount_remaining, Customer.customer_type
+        ).join(Customer, Order.customer_id == Customer.id).filter(
+            Order.user_id == user_id, Order.id.in_(order_ids)
+        )} if order_ids else {}
+        
+        # Overpayment check for the whole batch in one pass
+        amounts = {}
+        for index, order_id, amount, _, _ in valid:
+            if order_id in orders:
+                amounts[order_id] = amounts.get(order_id, 0) + amount
+        payable = {order_id: float(amount) for order_id, amount in amounts.items()
+                   if amount <= orders[order_id].amount_remaining}
+        
+        updated = {}
+        if payable:
+            # SQL-side arithmetic; the guard also catches payments committed since the read
+            paid = db.case(payable, value=Order.id)
+            version = bump_data_version(user_id)
+            updated = {row.id: row for row in db.session.execute(db.update(Order).where(
+                Order.user_id == user_id,
+                Order.id.in_(payable),
+                Order.amount_remaining >= paid
+            ).values(
+                amount_paid=Order.amount_paid + paid,
+                amount_remaining=Order.amount_remaining - paid,
+                payment_status=db.case((Order.amount_remaining - paid <= 0, 'paid'), else_='partial'),
+                version=Order.version + 1,
+                updated_version=version
+            ).returning(
+                Order.id, Order.amount_paid, Order.amount_remaining, Order.payment_status,
+                Order.delivery_status, Order.order_date
+            ).execution_options(synchronize_session=False))}
+        
+        rows, row_items = [], []
+        payment_date = get_eat_time()
+        for index, order_id, amount, payment_method, notes in valid:
+            if order_id not in orders:
+                results[index] = {'index': index, 'error': 'Order not found'}
+            elif order_id not in updated:
+                results[index] = {'index': index, 'error': 'Payment amount cannot exceed remaining balance'}
+            else:
+                rows.append({
+                    'order_id': order_id,
+                    'user_id': user_id,
+                    'amount': amount,
+                    'payment_method': payment_method,
+                    'notes': notes,
+                    'payment_date': payment_date,
+                    'updated_version': version
+                })
+                row_items.append((index, order_id))
+        
+        if not rows:
+            db.session.rollback()
+            return jsonify({'error': 'No payments recorded', 'created': 0, 'results': results}), 400
+        
+        payment_ids = db.session.scalars(
+            db.insert(Payment).returning(Payment.id, sort_by_parameter_order=True), rows
+        ).all()
+        
+        # Delivered orders count their payments in the daily sales summary
+        sales_paid = {}
+        for order_id, order in updated.items():
+            if order.delivery_status == 'delivered':
+                key = (eat_day(order.order_date), orders[order_id].customer_type)
+                sales_paid[key] = sales_paid.get(key, 0) + payable[order_id]
+        for (day, customer_type), amount in sales_paid.items():
+            bump_daily_sales(user_id, day, customer_type, 0, 0, 0, amount)
+        
+        publish_event(
+            user_id, 'payments_added', order_ids=sorted(updated), payment_ids=payment_ids,
+            amount=sum(row['amount'] for row in rows)
+        )
+        db.session.commit()
+        
+        for (index, order_id), payment_id in zip(row_items, payment_ids):
+            order = updated[order_id]
+            results[index] = {
+                'index': index,
+                'id': payment_id,
+                'order_id': order_id,
+                'order_status': {
+                    # SQLite's RETURNING can hand back whole REALs as integers
+                    'amount_paid': float(order.amount_paid),
+                    'amount_remaining': float(order.amount_remaining),
+                    'payment_status': order.payment_status
+                }
+            }
+        return jsonify({
+            'message': f'{len(payment_ids)} payments added successfully',
+            'created': len(payment_ids),
+            'failed': len(items) - len(payment_ids),
+            'results': results
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/orders/<int:order_id>/payments/<int:payment_id>', methods=['DELETE'])
+def delete_payment(order_id, payment_id):
+    """Delete a payment from an order"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        for attempt in range(BALANCE_UPDATE_ATTEMPTS):
+            order = Order.query.filter_by(id=order_id, user_id=user_id).first()
+            if not order:
+                return jsonify({'error': 'Order not found'}), 404
+            
+            payment = Payment.query.filter_by(id=payment_id, order_id=order_id, user_id=user_id).first()
+            if not payment:
+                return jsonify({'error': 'Payment not found'}), 404
+            
+            sales_before = sales_snapshot(order)
+            balance = change_amount_paid(order, -payment.amount)
+            if balance:
+                break
+            db.session.rollback()
+            pause_before_retry(attempt)
+        else:
+            return jsonify({'error': 'Order is being updated by someone else, please retry'}), 409
+        
+        if sales_before:
+            apply_sales_change(user_id, sales_before, sales_before[:4] + (balance['amount_paid'],))
+        
+        db.session.delete(payment)
+        db.session.commit()
+        
+        return jsonify({
+            'message': 'Payment deleted successfully',
+            'order_status': balance
+        })
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
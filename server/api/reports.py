@@ -0,0 +1,221 @@
+from flask import Blueprint, request, jsonify
+from datetime import datetime, timedelta
+
+from ..extensions import db
+from ..models import get_eat_time, eat_day, Inventory, DailySalesSummary
+from ..sales import COST_PER_KG
+from ..security import get_current_user_id
+from ..versioning import conditional_on_data_version
+
+bp = Blueprint('reports', __name__)
+
+@bp.route('/api/reports/sales', methods=['GET'])
+@conditional_on_data_version
+def get_sales_report():
+    """Get sales report for specified period"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        period = request.args.get('period', 'month')  # day, week, month
+        end_date = get_eat_time()
+        
+        if period == 'day':
+            start_date = end_date
+        elif period == 'week':
+            start_date = end_date - timedelta(days=7)
+        else:  # month
+            start_date = end_date - timedelta(days=30)
+        # The summary is kept per EAT calendar day, so windows start at midnight
+        start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        # One grouped query over the daily summary (O(days)), split by customer type
+        rows = db.session.query(
+            DailySalesSummary.customer_type,
+            db.func.sum(DailySalesSummary.order_count),
+            db.func.sum(DailySalesSummary.amount_paid),
+            db.func.sum(DailySalesSummary.kg_sold),
+            db.func.sum(DailySalesSummary.order_amount)
+        ).filter(
+            DailySalesSummary.user_id == user_id,
+            DailySalesSummary.day >= start_date.date(),
+            DailySalesSummary.day <= end_date.date()
+        ).group_by(DailySalesSummary.customer_type).all()
+        by_type = {customer_type: (count, paid) for customer_type, count, paid, _, _ in rows}
+        
+        # Calculate revenue based on actual payments received
+        total_orders = sum(row[1] for row in rows)
+        total_revenue = sum(row[2] for row in rows)
+        total_kg_sold = sum(row[3] for row in rows)
+        
+        # Calculate cost of goods sold
+        total_cost = total_kg_sold * COST_PER_KG
+        profit = total_revenue - total_cost
+        
+        # Customer breakdown based on actual payments
+        restaurant_orders, restaurant_revenue = by_type.get('restaurant', (0, 0))
+        individual_orders, individual_revenue = by_type.get('individual', (0, 0))
+        
+        # Additional payment statistics
+        total_orders_amount = sum(row[4] for row in rows)
+        total_pending_payments = total_orders_amount - total_revenue
+        
+        return jsonify({
+            'period': period,
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'total_orders': total_orders,
+            'total_revenue': total_revenue,  # Actual payments received
+            'total_orders_amount': total_orders_amount,  # Total order amounts
+            'total_pending_payments': total_pending_payments,  # Outstanding payments
+            'total_kg_sold': total_kg_sold,
+            'total_cost': total_cost,
+            'profit': profit,
+            'restaurant_orders': restaurant_orders,
+            'individual_orders': individual_orders,
+            'restaurant_revenue': restaurant_revenue,
+            'individual_revenue': individual_revenue
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+TIMESERIES_METRICS = {
+    'revenue': DailySalesSummary.amount_paid,  # Actual payments received
+    'kg': DailySalesSummary.kg_sold,
+    'orders': DailySalesSummary.order_count
+}
+TIMESERIES_DEFAULT_SPAN = {'day': 30, 'week': 12, 'month': 12}  # buckets shown when from= is omitted
+MAX_TIMESERIES_POINTS = 732
+
+def _bucket_start_sql(bucket, column):
+    """SQL expression for the first day of the day/week/month bucket holding a date column"""
+    if bucket == 'day':
+        return column
+    if db.engine.dialect.name == 'postgresql':
+        return db.cast(db.func.date_trunc(bucket, column), db.Date)
+    if bucket == 'week':
+        return db.func.date(column, '-6 days', 'weekday 1')  # Monday on or before the day
+    return db.func.date(column, 'start of month')
+
+def _bucket_start(bucket, day):
+    """First day of the bucket holding a date (weeks start on Monday)"""
+    if bucket == 'week':
+        return day - timedelta(days=day.weekday())
+    if bucket == 'month':
+        return day.replace(day=1)
+    return day
+
+def _next_bucket(bucket, start):
+    """First day of the bucket following the one starting at `start`"""
+    if bucket == 'day':
+        return start + timedelta(days=1)
+    if bucket == 'week':
+        return start + timedelta(days=7)
+    return (start + timedelta(days=32)).replace(day=1)
+
+@bp.route('/api/reports/timeseries', methods=['GET'])
+@conditional_on_data_version
+def get_sales_timeseries():
+    """Get a zero-filled revenue/kg/orders series bucketed by EAT day, week or month"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        bucket = request.args.get('bucket', 'day')
+        metric = request.args.get('metric', 'revenue')
+        if bucket not in TIMESERIES_DEFAULT_SPAN:
+            return jsonify({'error': 'Bucket must be day, week or month'}), 400
+        if metric not in TIMESERIES_METRICS:
+            return jsonify({'error': 'Metric must be revenue, kg or orders'}), 400
+        
+        try:
+            to_day = datetime.strptime(request.args['to'], '%Y-%m-%d').date() if request.args.get('to') else eat_day(get_eat_time())
+            if request.args.get('from'):
+                from_day = datetime.strptime(request.args['from'], '%Y-%m-%d').date()
+            else:
+                from_day = _bucket_start(bucket, to_day)
+                for _ in range(TIMESERIES_DEFAULT_SPAN[bucket] - 1):
+                    from_day = _bucket_start(bucket, from_day - timedelta(days=1))
+        except ValueError:
+            return jsonify({'error': 'Dates must be in YYYY-MM-DD format'}), 400
+        if from_day > to_day:
+            return jsonify({'error': 'from must not be after to'}), 400
+        
+        # Dense list of bucket start days covering the window
+        starts = [_bucket_start(bucket, from_day)]
+        while _next_bucket(bucket, starts[-1]) <= to_day:
+            starts.append(_next_bucket(bucket, starts[-1]))
+            if len(starts) > MAX_TIMESERIES_POINTS:
+                return jsonify({'error': f'Range too large (max {MAX_TIMESERIES_POINTS} buckets)'}), 400
+        
+        # Single grouped query over the per-day summary
+        bucket_start = _bucket_start_sql(bucket, DailySalesSummary.day)
+        rows = db.session.query(
+            bucket_start, db.func.sum(TIMESERIES_METRICS[metric])
+        ).filter(
+            DailySalesSummary.user_id == user_id,
+            DailySalesSummary.day >= from_day,
+            DailySalesSummary.day <= to_day
+        ).group_by(bucket_start).all()
+        values = {str(start)[:10]: value or 0 for start, value in rows}
+        
+        return jsonify({
+            'bucket': bucket,
+            'metric': metric,
+            'from': from_day.isoformat(),
+            'to': to_day.isoformat(),
+            'timezone': 'Africa/Nairobi',
+            'points': [{
+                'start': start.isoformat(),
+                'value': values.get(start.isoformat(), 0)
+            } for start in starts]
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/reports/inventory', methods=['GET'])
+@conditional_on_data_version
+def get_inventory_report():
+    """Get detailed inventory report"""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        inventory_records = Inventory.query.filter(Inventory.user_id == user_id).order_by(Inventory.date_added.desc()).all()
+        
+        total_bags = sum(record.bags_added for record in inventory_records)
+        total_kg = sum(record.total_kg for record in inventory_records)
+        total_cost = sum(record.bags_added * record.cost_per_bag for record in inventory_records)
+        
+        # Calculate sold inventory from the daily summary
+        sold_kg, sold_revenue = db.session.query(
+            db.func.coalesce(db.func.sum(DailySalesSummary.kg_sold), 0),
+            db.func.coalesce(db.func.sum(DailySalesSummary.amount_paid), 0)  # Actual payments received
+        ).filter(DailySalesSummary.user_id == user_id).one()
+        
+        available_kg = total_kg - sold_kg
+        cost_of_sold = sold_kg * COST_PER_KG
+        profit = sold_revenue - cost_of_sold
+        
+        return jsonify({
+            'total_bags_purchased': total_bags,
+            'total_kg_purchased': total_kg,
+            'total_purchase_cost': total_cost,
+            'sold_kg': sold_kg,
+            'sold_revenue': sold_revenue,
+            'available_kg': available_kg,
+            'cost_of_sold': cost_of_sold,
+            'profit': profit,
+            'inventory_records': [{
+                'id': record.id,
+                'bags_added': record.bags_added,
+                'total_kg': record.total_kg,
+                'cost_per_bag': record.cost_per_bag,
+                'date_added': record.date_added.isoformat()
+            } for record in inventory_records]
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,65 @@
+from flask import Blueprint, request, jsonify
+
+from ..extensions import db
+from ..models import Customer, Inventory, Order, Payment, Tombstone
+from ..security import get_current_user_id
+from ..serialization import encode_customer, encode_inventory, encode_order, encode_payment
+from ..versioning import conditional_on_data_version, data_version
+from .orders import ORDER_LIST_COLUMNS
+
+bp = Blueprint('sync', __name__)
+
+# Collection name in the response -> (model, rows query, encoder)
+SYNC_COLLECTIONS = {
+    'orders': (Order, lambda: db.session.query(*ORDER_LIST_COLUMNS).join(Customer, Order.customer_id == Customer.id), encode_order),
+    'customers': (Customer, lambda: Customer.query, encode_customer),
+    'inventory': (Inventory, lambda: Inventory.query, encode_inventory),
+    'payments': (Payment, lambda: Payment.query, encode_payment)
+}
+
+@bp.route('/api/sync', methods=['GET'])
+@conditional_on_data_version
+def get_changes():
+    """Rows created, updated or deleted after a data version.
+
+    Without `since` every row is returned (a full sync). Clients store the
+    returned `version` and pass it as `since` next time; dropping the
+    `deleted` ids and then upserting the changed rows (SQLite may reuse the
+    id of a deleted row) brings a local copy up to date in O(changes).
+    """
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return jsonify({'error': 'User not authenticated'}), 401
+        
+        since = request.args.get('since')
+        try:
+            since = int(since) if since is not None else None
+        except ValueError:
+            return jsonify({'error': 'since must be a version number'}), 400
+        
+        # Read before the rows: anything written meanwhile is sent again next time, never skipped
+        version = data_version(user_id)
+        
+        result = {'version': version, 'since': since, 'full': since is None, 'deleted': {}}
+        tables = {}
+        for name, (model, query, encode) in SYNC_COLLECTIONS.items():
+            rows = query().filter(model.user_id == user_id)
+            if since is not None:
+                rows = rows.filter(model.updated_version > since)
+            result[name] = [encode(row) for row in rows.order_by(model.id)]
+            result['deleted'][name] = []
+            tables[model.__tablename__] = name
+        
+        if since is not None:
+            tombstones = db.session.query(Tombstone.entity, Tombstone.entity_id).filter(
+                Tombstone.user_id == user_id,
+                Tombstone.version > since
+            ).order_by(Tombstone.id)
+            for entity, entity_id in tombstones:
+                if entity in tables:
+                    result['deleted'][tables[entity]].append(entity_id)
+        
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,60 @@
+from flask import Blueprint, current_app, jsonify
+import time
+
+from ..extensions import db, pool_stats
+from ..models import get_eat_time
+
+bp = Blueprint('system', __name__)
+
+# Root route for testing
+@bp.route('/', methods=['GET'])
+def root():
+    """Root endpoint"""
+    return jsonify({
+        'message': 'JB-Rice-Pro API is running', 
+        'endpoints': '/api/*',
+        'timestamp': get_eat_time().isoformat()
+    }), 200
+
+# Keep-alive endpoint to prevent service sleeping
+@bp.route('/api/ping', methods=['GET'])
+def ping():
+    """Keep-alive endpoint"""
+    return jsonify({
+        'status': 'alive',
+        'timestamp': get_eat_time().isoformat()
+    }), 200
+
+# Liveness probe: answers without touching the database
+@bp.route('/api/health/live', methods=['GET'])
+def liveness_check():
+    """Liveness endpoint"""
+    return jsonify({'status': 'alive'}), 200
+
+# Readiness probe: one cheap round trip to the database, no schema work
+@bp.route('/api/health', methods=['GET'])
+@bp.route('/api/health/ready', methods=['GET'])
+def health_check():
+    """Health check endpoint"""
+    started = time.perf_counter()
+    try:
+        if db.engine.dialect.name == 'postgresql':
+            db.session.execute(db.text(f"SET LOCAL statement_timeout = {current_app.config['HEALTH_DB_TIMEOUT_MS']}"))
+        db.session.execute(db.text('SELECT 1'))
+        latency_ms = (time.perf_counter() - started) * 1000
+        db.session.rollback()
+        return jsonify({
+            'status': 'healthy', 
+            'message': 'JB-Rice-Pro API is running',
+            'database': 'ok',
+            'db_latency_ms': round(latency_ms, 2),
+            'pool': pool_stats()
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'status': 'unhealthy', 
+            'message': 'JB-Rice-Pro API is running',
+            'database': f'error: {str(e)}',
+            'pool': pool_stats()
+        }), 503
@@ -11,7 +11,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app_sqlite import app, db, Inventory, Order
+from app_sqlite import app
+from server.extensions import db
+from server.models import Inventory, Order, Payment, StockMovement, Tombstone, User
+from server.sales import backfill_daily_sales, backfill_record_counts
+from server.stock import rebuild_stock_ledger
+from server.versioning import bump_data_version
 
 def cleanup_data():
     """Clean up inventory and orders data"""
@@ -23,7 +28,7 @@ def cleanup_data():
             inventory_count = Inventory.query.count()
             orders_count = Order.query.count()
             
-            print(f"📊 Current data:")
+            print("📊 Current data:")
             print(f"   - Inventory records: {inventory_count}")
             print(f"   - Orders: {orders_count}")
             
@@ -38,6 +43,21 @@ def cleanup_data():
                 print("❌ Cleanup cancelled.")
                 return
             
+            # Bulk deletes skip the flush hook: bump every user's version (which also
+            # invalidates their cached lists) and leave tombstones for /api/sync ourselves
+            for (user_id,) in db.session.query(User.id).all():
+                version = bump_data_version(user_id)
+                for model in (Payment, Inventory, Order):
+                    db.session.execute(db.insert(Tombstone).from_select(
+                        ['user_id', 'entity', 'entity_id', 'version'],
+                        db.select(model.user_id, db.literal(model.__tablename__), model.id, db.literal(version))
+                        .where(model.user_id == user_id)
+                    ))
+            
+            # Ledger entries and payments reference the rows being deleted
+            StockMovement.query.delete()
+            Payment.query.delete()
+            
             # Delete inventory records
             if inventory_count > 0:
                 print(f"🗑️  Deleting {inventory_count} inventory records...")
@@ -50,6 +70,11 @@ def cleanup_data():
                 Order.query.delete()
                 print("✅ Orders deleted.")
             
+            # Reset stock balances, the daily sales summary and record counts to match
+            rebuild_stock_ledger()
+            backfill_daily_sales()
+            backfill_record_counts()
+            
             # Commit changes
             db.session.commit()
             
@@ -57,12 +82,12 @@ def cleanup_data():
             final_inventory_count = Inventory.query.count()
             final_orders_count = Order.query.count()
             
-            print(f"\n✅ Cleanup completed successfully!")
-            print(f"📊 Final data:")
+            print("\n✅ Cleanup completed successfully!")
+            print("📊 Final data:")
             print(f"   - Inventory records: {final_inventory_count}")
             print(f"   - Orders: {final_orders_count}")
-            print(f"\n🎉 Your JB-Rice-Pro is now ready for fresh data!")
-            print(f"💡 You can now start adding new inventory and creating orders.")
+            print("\n🎉 Your JB-Rice-Pro is now ready for fresh data!")
+            print("💡 You can now start adding new inventory and creating orders.")
             
         except Exception as e:
             print(f"❌ Error during cleanup: {str(e)}")
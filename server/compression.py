@@ -0,0 +1,82 @@
+from flask import current_app, request
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/html', 'text/plain', 'text/csv', 'text/css', 'application/javascript'}
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def _compressor(encoding):
+    """(compress(chunk), flush()) for one response body"""
+    config = current_app.config
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=config['COMPRESSION_BROTLI_QUALITY'])
+        return compressor.process, compressor.finish
+    # wbits 31: zlib stream with a gzip header and trailer
+    compressor = zlib.compressobj(config['COMPRESSION_LEVEL'], zlib.DEFLATED, 31)
+    return compressor.compress, compressor.flush
+
+def _compress_chunks(compressor, chunks):
+    """Compress an iterable of byte chunks, yielding output as it is produced"""
+    compress, flush = compressor
+    for chunk in chunks:
+        output = compress(chunk)
+        if output:
+            yield output
+    yield flush()
+
+def _slices(data):
+    for start in range(0, len(data), STREAM_CHUNK_SIZE):
+        yield data[start:start + STREAM_CHUNK_SIZE]
+
+def compress_response(response):
+    """after_request hook: gzip/brotli-encode large text bodies the client accepts.
+
+    Bodies under COMPRESSION_MIN_SIZE are sent as is (the header overhead and
+    CPU are not worth it); bodies over COMPRESSION_STREAM_SIZE, and responses
+    that are already streamed, are compressed chunk by chunk as they are sent
+    instead of holding a second full copy in memory. Event streams are never
+    touched since buffering in the compressor would delay every event.
+    """
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES or request.method == 'HEAD':
+        return response
+    response.vary.add('Accept-Encoding')
+    if (response.status_code < 200 or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers
+            or 'no-transform' in response.headers.get('Cache-Control', '')):
+        return response
+
+    encoding = request.accept_encodings.best_match(('br', 'gzip') if brotli else ('gzip',))
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        original = response.response
+        response.response = _compress_chunks(_compressor(encoding), original)
+        if hasattr(original, 'close'):
+            response.call_on_close(original.close)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < current_app.config['COMPRESSION_MIN_SIZE']:
+            return response
+        if len(data) >= current_app.config['COMPRESSION_STREAM_SIZE']:
+            response.response = _compress_chunks(_compressor(encoding), _slices(data))
+            response.headers.pop('Content-Length', None)
+        else:
+            response.set_data(b''.join(_compress_chunks(_compressor(encoding), (data,))))
+
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # The encoded bytes differ from the identity ones, so the validator can only be weak
+        response.set_etag(etag, weak=True)
+    return response
+
+def init_compression(app):
+    """Install response compression when COMPRESSION_ENABLED is set"""
+    if app.config['COMPRESSION_ENABLED']:
+        app.after_request(compress_response)
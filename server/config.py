@@ -1,10 +1,129 @@
 import os
 from dotenv import load_dotenv
+from sqlalchemy.pool import QueuePool
 
 load_dotenv()
 
+def normalize_database_url(url):
+    """Pick the database from DATABASE_URL, defaulting to the local SQLite file"""
+    if not url:
+        return 'sqlite:///mwearicepro.db'
+    # Render/Heroku still hand out the deprecated postgres:// scheme
+    if url.startswith('postgres://'):
+        url = url.replace('postgres://', 'postgresql://', 1)
+    return url
+
+DEFAULT_SECRET_KEY = 'your-secret-key-here'  # development only; create_app() refuses it elsewhere
+
 class Config:
-    SECRET_KEY = os.getenv('SECRET_KEY', 'your-secret-key-here')
-    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'postgresql://localhost/mwearicepro')
+    SECRET_KEY = os.getenv('SECRET_KEY', DEFAULT_SECRET_KEY)
+    SQLALCHEMY_DATABASE_URI = normalize_database_url(os.getenv('DATABASE_URL'))
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    FLASK_ENV = os.getenv('FLASK_ENV', 'development') 
\ No newline at end of file
+    FLASK_ENV = os.getenv('FLASK_ENV', 'development')
+    JSON_USE_ORJSON = os.getenv('JSON_USE_ORJSON', 'true').lower() == 'true'  # when orjson is installed
+
+    # Password hashing; `flask calibrate-kdf` suggests costs for this CPU
+    PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'scrypt')  # or pbkdf2_sha256
+    PASSWORD_SCRYPT_N = int(os.getenv('PASSWORD_SCRYPT_N', 2 ** 14))
+    PASSWORD_SCRYPT_R = int(os.getenv('PASSWORD_SCRYPT_R', 8))
+    PASSWORD_SCRYPT_P = int(os.getenv('PASSWORD_SCRYPT_P', 1))
+    PASSWORD_PBKDF2_ITERATIONS = int(os.getenv('PASSWORD_PBKDF2_ITERATIONS', 600000))
+    PASSWORD_HASH_CONCURRENCY = int(os.getenv('PASSWORD_HASH_CONCURRENCY', 1))  # KDF runs at once per process
+    PASSWORD_HASH_WAIT_SECONDS = float(os.getenv('PASSWORD_HASH_WAIT_SECONDS', 2))  # then answer 503
+
+    # Signed bearer tokens
+    TOKEN_TTL_SECONDS = int(os.getenv('TOKEN_TTL_SECONDS', 7 * 24 * 3600))
+    AUTH_CACHE_SIZE = int(os.getenv('AUTH_CACHE_SIZE', 1024))  # verified tokens kept per process
+    TOKEN_REVOCATION_REFRESH_SECONDS = int(os.getenv('TOKEN_REVOCATION_REFRESH_SECONDS', 10))  # sign-outs reach other workers within this
+
+    # Per-client request budgets shared by the workers on a host: endpoint -> (requests, per seconds)
+    RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+    RATE_LIMIT_DB = os.getenv('RATE_LIMIT_DB')  # SQLite file, defaults to instance/ratelimit.db
+    RATE_LIMITS = {
+        'auth.signin': (10, 60),
+        'auth.signup': (5, 60),
+        'auth.forgot_password': (3, 300),
+        'auth.reset_password': (5, 300),
+        'reports.*': (30, 60),
+        # Health probes and keep-alive pings are never limited
+        'system.ping': None,
+        'system.liveness_check': None,
+        'system.health_check': None,  # /api/health and /api/health/ready
+        'default': (300, 60)
+    }
+    PROXY_FIX_X_FOR = int(os.getenv('PROXY_FIX_X_FOR', 0))  # proxies setting X-Forwarded-For (1 on Render)
+
+    # gzip/brotli response compression, negotiated from Accept-Encoding
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))  # bytes; smaller bodies go out as is
+    COMPRESSION_STREAM_SIZE = int(os.getenv('COMPRESSION_STREAM_SIZE', 256 * 1024))  # bytes; larger bodies are compressed chunk by chunk
+    COMPRESSION_LEVEL = int(os.getenv('COMPRESSION_LEVEL', 6))  # gzip 1-9
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', 5))  # brotli 0-11, when the brotli package is installed
+
+    # Connection pool (server databases and SQLite files)
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))  # seconds to wait for a free connection
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))  # seconds before a connection is replaced
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', 15000))
+    HEALTH_DB_TIMEOUT_MS = int(os.getenv('HEALTH_DB_TIMEOUT_MS', 2000))  # readiness probe query budget
+
+    # SQLite engine profile, applied to every new connection
+    SQLITE_PRAGMAS = {
+        'journal_mode': os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),  # readers don't block the writer
+        'synchronous': os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),  # no fsync per commit in WAL mode
+        'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000)),  # wait for locks instead of failing
+        'cache_size': int(os.getenv('SQLITE_CACHE_SIZE', -20000)),  # negative means KiB (~20 MB)
+        'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', 128 * 1024 * 1024)),
+        'temp_store': os.getenv('SQLITE_TEMP_STORE', 'MEMORY'),
+        'foreign_keys': os.getenv('SQLITE_FOREIGN_KEYS', 'ON')
+    }
+
+    # Server-sent events (GET /api/events)
+    EVENTS_BUFFER_SIZE = int(os.getenv('EVENTS_BUFFER_SIZE', 200))  # events kept per user for Last-Event-ID resume
+    EVENTS_POLL_SECONDS = float(os.getenv('EVENTS_POLL_SECONDS', 1))  # outbox poll interval per stream
+    EVENTS_HEARTBEAT_SECONDS = int(os.getenv('EVENTS_HEARTBEAT_SECONDS', 15))  # keeps proxies from closing idle streams
+    EVENTS_STREAM_SECONDS = int(os.getenv('EVENTS_STREAM_SECONDS', 300))  # then the browser reconnects with Last-Event-ID
+    EVENTS_MAX_STREAMS = int(os.getenv('EVENTS_MAX_STREAMS', 4))  # open streams per worker process; leaves threads for requests
+    EVENTS_RETRY_MS = int(os.getenv('EVENTS_RETRY_MS', 3000))  # browser reconnect delay
+
+    # SQLite snapshots to a directory that survives restarts (unset to disable)
+    SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR')
+    SNAPSHOT_INTERVAL_SECONDS = int(os.getenv('SNAPSHOT_INTERVAL_SECONDS', 30))  # writes are coalesced for this long
+    SNAPSHOT_PAGES_PER_STEP = int(os.getenv('SNAPSHOT_PAGES_PER_STEP', -1))  # -1 copies in one pass; WAL readers don't block writers
+    SNAPSHOT_RESTORE_BUDGET_SECONDS = float(os.getenv('SNAPSHOT_RESTORE_BUDGET_SECONDS', 30))
+
+def engine_options(config):
+    """SQLAlchemy engine options tuned for the backend named in the database URL"""
+    url = config['SQLALCHEMY_DATABASE_URI']
+
+    if url.startswith('sqlite'):
+        if url in ('sqlite://', 'sqlite:///:memory:'):
+            # Private in-memory database; Flask-SQLAlchemy pins it to one StaticPool connection
+            return {}
+        # Files and shared-cache memory databases (file:name?mode=memory&cache=shared&uri=true)
+        return {
+            'poolclass': QueuePool,
+            'pool_size': config['DB_POOL_SIZE'],
+            'max_overflow': config['DB_MAX_OVERFLOW'],
+            'pool_timeout': config['DB_POOL_TIMEOUT'],
+            'connect_args': {
+                'check_same_thread': False,
+                'timeout': config['SQLITE_PRAGMAS']['busy_timeout'] / 1000
+            }
+        }
+
+    options = {
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+        'pool_pre_ping': True  # survive connections dropped while the service sleeps
+    }
+    if url.startswith('postgresql'):
+        # Timestamps are stored naive and read back as EAT (eat_day(), report windows), so the
+        # session must convert aware EAT datetimes to Nairobi wall-clock time, not the server's zone
+        options['connect_args'] = {
+            'options': f"-c statement_timeout={config['DB_STATEMENT_TIMEOUT_MS']} -c timezone=Africa/Nairobi"
+        }
+    return options
@@ -0,0 +1,91 @@
+from flask import current_app
+import json
+import threading
+import time
+
+from .extensions import db
+from .models import UserEvent
+from .security import verify_token
+
+_stream_slots = None
+_stream_slots_lock = threading.Lock()
+
+def publish_event(user_id, event_type, **data):
+    """Queue a live update for a user's event streams; runs in the caller's transaction.
+
+    Publish after making the change it describes: the autoflush before the
+    insert bumps the user's data version, whose row lock makes one user's
+    events commit in id order. Older events beyond EVENTS_BUFFER_SIZE are
+    dropped in the same transaction.
+    """
+    db.session.execute(db.insert(UserEvent).values(
+        user_id=user_id,
+        event_type=event_type,
+        data=json.dumps(data, separators=(',', ':'))
+    ))
+    oldest_kept = db.select(UserEvent.id).where(UserEvent.user_id == user_id).order_by(
+        UserEvent.id.desc()
+    ).offset(current_app.config['EVENTS_BUFFER_SIZE'] - 1).limit(1).scalar_subquery()
+    db.session.execute(db.delete(UserEvent).where(UserEvent.user_id == user_id, UserEvent.id < oldest_kept))
+
+def acquire_stream_slot():
+    """Claim one of this process's EVENTS_MAX_STREAMS stream slots without waiting; False if all are taken"""
+    global _stream_slots
+    if _stream_slots is None:
+        with _stream_slots_lock:
+            if _stream_slots is None:
+                _stream_slots = threading.BoundedSemaphore(current_app.config['EVENTS_MAX_STREAMS'])
+    return _stream_slots.acquire(blocking=False)
+
+def release_stream_slot():
+    _stream_slots.release()
+
+def _format_event(event_id, event_type, data):
+    return f'id: {event_id}\nevent: {event_type}\ndata: {data}\n\n'
+
+def event_stream(user_id, token, last_event_id):
+    """SSE frames for a user's new events until EVENTS_STREAM_SECONDS have passed.
+
+    Starts after last_event_id, or at the newest event for a fresh
+    connection; the position is fixed now, before the response starts. A
+    resync event tells the client that events it missed have already been
+    dropped from the buffer and it should refetch. The stream ends early
+    once its token is revoked or expires.
+    """
+    config = current_app.config
+    newest, oldest, buffered = db.session.query(
+        db.func.max(UserEvent.id), db.func.min(UserEvent.id), db.func.count(UserEvent.id)
+    ).filter(UserEvent.user_id == user_id).one()
+    db.session.close()  # don't hold a pooled connection between polls
+
+    resync = last_event_id is not None and (
+        last_event_id > (newest or 0) or (buffered >= config['EVENTS_BUFFER_SIZE'] and oldest > last_event_id)
+    )
+    if last_event_id is None or resync:
+        last_event_id = newest or 0
+
+    def frames(last_event_id):
+        yield f"retry: {config['EVENTS_RETRY_MS']}\n\n"
+        if resync:
+            yield _format_event(last_event_id, 'resync', '{}')
+
+        deadline = time.monotonic() + config['EVENTS_STREAM_SECONDS']
+        next_heartbeat = time.monotonic() + config['EVENTS_HEARTBEAT_SECONDS']
+        while time.monotonic() < deadline and verify_token(token) == user_id:
+            events = db.session.query(UserEvent.id, UserEvent.event_type, UserEvent.data).filter(
+                UserEvent.user_id == user_id,
+                UserEvent.id > last_event_id
+            ).order_by(UserEvent.id).limit(100).all()
+            db.session.close()
+
+            for event_id, event_type, data in events:
+                yield _format_event(event_id, event_type, data)
+                last_event_id = event_id
+            if events:
+                next_heartbeat = time.monotonic() + config['EVENTS_HEARTBEAT_SECONDS']
+            elif time.monotonic() >= next_heartbeat:
+                # Comment frame: ignored by EventSource, but a dead connection fails the write
+                yield ': keep-alive\n\n'
+                next_heartbeat = time.monotonic() + config['EVENTS_HEARTBEAT_SECONDS']
+            time.sleep(config['EVENTS_POLL_SECONDS'])
+    return frames(last_event_id)
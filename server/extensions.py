@@ -0,0 +1,36 @@
+from flask_sqlalchemy import SQLAlchemy
+from flask_cors import CORS
+from sqlalchemy import event
+
+# Unbound extension objects; create_app() attaches them to the application
+db = SQLAlchemy()
+cors = CORS()
+
+def register_sqlite_pragmas(engine, pragmas):
+    """Apply the configured SQLite profile to each new DB-API connection of this engine"""
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+def pool_stats():
+    """Connection pool counters for the current engine"""
+    pool = db.engine.pool
+    stats = {'backend': db.engine.dialect.name, 'pool': type(pool).__name__}
+    for name in ('size', 'checkedin', 'checkedout', 'overflow'):
+        if hasattr(pool, name):
+            stats[name] = getattr(pool, name)()
+    return stats
+
+def dialect_insert(model):
+    """Return an INSERT construct supporting ON CONFLICT for the active database"""
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
@@ -0,0 +1,63 @@
+from flask import Flask
+import os
+
+from .config import Config, DEFAULT_SECRET_KEY, engine_options
+from .extensions import db, cors, register_sqlite_pragmas
+from .serialization import init_json
+
+def create_app(config_overrides=None):
+    """Build the JB-Rice-Pro API application.
+
+    Nothing touches the database here; the schema is created or upgraded by
+    bootstrap_database() (gunicorn master, `flask bootstrap`, `python app.py`).
+    """
+    app = Flask(__name__)
+
+    # Database configuration - DATABASE_URL (PostgreSQL in production), SQLite file by default
+    app.config.from_object(Config)
+    if config_overrides:
+        app.config.update(config_overrides)
+    if app.config['FLASK_ENV'] != 'development' and app.config['SECRET_KEY'] in ('', DEFAULT_SECRET_KEY):
+        # Anyone could sign bearer tokens with the published default key
+        raise RuntimeError('Set SECRET_KEY to a random value; the default is only allowed with FLASK_ENV=development')
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config))
+
+    db.init_app(app)
+    cors.init_app(app)
+    init_json(app)
+    with app.app_context():
+        register_sqlite_pragmas(db.engine, app.config['SQLITE_PRAGMAS'])
+
+    if app.config['PROXY_FIX_X_FOR']:
+        # Client addresses (used by the rate limiter) come from the proxy's X-Forwarded-For
+        from werkzeug.middleware.proxy_fix import ProxyFix
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_FIX_X_FOR'])
+
+    from .api import register_blueprints
+    from .compression import init_compression
+    from .ratelimit import init_rate_limiter
+    from .snapshot import init_snapshots
+    register_blueprints(app)
+    init_rate_limiter(app)
+    init_compression(app)
+    init_snapshots(app)
+    register_commands(app)
+    return app
+
+def register_commands(app):
+    """Attach the maintenance CLI; Alembic is only imported under the flask command"""
+    from .schema import bootstrap_command
+    from .security import calibrate_kdf_command
+    from .stock import stock_cli
+    from .sales import reports_cli
+    from .snapshot import snapshot_cli
+
+    app.cli.add_command(bootstrap_command)
+    app.cli.add_command(calibrate_kdf_command)
+    app.cli.add_command(stock_cli)
+    app.cli.add_command(reports_cli)
+    app.cli.add_command(snapshot_cli)
+
+    if os.environ.get('FLASK_RUN_FROM_CLI') == 'true':
+        from flask_migrate import Migrate
+        Migrate(app, db)
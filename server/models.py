@@ -0,0 +1,192 @@
+from datetime import datetime, timedelta, timezone
+
+from .extensions import db
+
+# Africa/Nairobi has been UTC+3 without daylight saving since 1960
+EAT = timezone(timedelta(hours=3), 'EAT')
+
+# Timezone function
+def get_eat_time():
+    """Get current time in East Africa Time (EAT)"""
+    return datetime.now(EAT)
+
+def eat_day(value):
+    """Calendar day of a timestamp in East Africa Time (naive values are already EAT)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(EAT)
+    return value.date()
+
+# Models
+class User(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(80), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    phone = db.Column(db.String(20), nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
+    reset_token = db.Column(db.String(255))
+    reset_token_expiry = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=get_eat_time)
+    __table_args__ = (
+        db.Index('ix_user_reset_token', 'reset_token'),
+    )
+
+class Customer(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    phone = db.Column(db.String(20))
+    email = db.Column(db.String(100))
+    customer_type = db.Column(db.String(20), nullable=False)  # 'restaurant' or 'individual'
+    address = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=get_eat_time)
+    updated_version = db.Column(db.BigInteger, nullable=False, default=0)  # DataVersion.version of the last write
+    user = db.relationship('User', backref='customers')
+    __table_args__ = (
+        db.Index('ix_customer_user_created', 'user_id', 'created_at'),
+        db.Index('ix_customer_user_version', 'user_id', 'updated_version'),
+    )
+
+class Inventory(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    bags_added = db.Column(db.Integer, nullable=False)
+    total_kg = db.Column(db.Float, nullable=False)
+    cost_per_bag = db.Column(db.Float, default=9000.0)  # KES 9,000 per 60kg bag
+    date_added = db.Column(db.DateTime, default=get_eat_time)
+    updated_version = db.Column(db.BigInteger, nullable=False, default=0)  # DataVersion.version of the last write
+    user = db.relationship('User', backref='inventory_records')
+    __table_args__ = (
+        db.Index('ix_inventory_user_date', 'user_id', 'date_added'),
+        db.Index('ix_inventory_user_version', 'user_id', 'updated_version'),
+    )
+
+class Order(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    customer_id = db.Column(db.Integer, db.ForeignKey('customer.id'), nullable=False)
+    quantity_kg = db.Column(db.Float, nullable=False)
+    price_per_kg = db.Column(db.Float, nullable=False)
+    total_amount = db.Column(db.Float, nullable=False)
+    order_date = db.Column(db.DateTime, default=get_eat_time)
+    delivery_status = db.Column(db.String(20), default='pending')  # pending, delivered, cancelled
+    delivery_date = db.Column(db.DateTime)
+    payment_status = db.Column(db.String(20), default='unpaid')  # unpaid, partial, paid
+    amount_paid = db.Column(db.Float, default=0.0)
+    amount_remaining = db.Column(db.Float, default=0.0)
+    updated_version = db.Column(db.BigInteger, nullable=False, default=0)  # DataVersion.version of the last write
+    version = db.Column(db.Integer, nullable=False, default=1)  # row version for compare-and-swap updates
+    # Numbers the rows of a bulk INSERT so RETURNING can hand ids back in row order
+    # without SQLite falling back to one INSERT per row
+    insert_sentinel = db.insert_sentinel('insert_sentinel')
+    user = db.relationship('User', backref='orders')
+    customer = db.relationship('Customer', backref='orders')
+    payments = db.relationship('Payment', backref='order', cascade='all, delete-orphan')
+    __table_args__ = (
+        db.Index('ix_order_user_date', 'user_id', 'order_date'),
+        db.Index('ix_order_user_status_date', 'user_id', 'delivery_status', 'order_date'),
+        db.Index('ix_order_user_customer', 'user_id', 'customer_id'),
+        db.Index('ix_order_customer', 'customer_id'),  # Customer.orders, loaded when a customer is deleted
+        db.Index('ix_order_user_version', 'user_id', 'updated_version'),
+    )
+    # ORM flushes only update the row if its version is unchanged (else StaleDataError)
+    __mapper_args__ = {'version_id_col': version}
+
+class Payment(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    order_id = db.Column(db.Integer, db.ForeignKey('order.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    amount = db.Column(db.Float, nullable=False)
+    payment_date = db.Column(db.DateTime, default=get_eat_time)
+    payment_method = db.Column(db.String(50), default='cash')  # cash, mpesa, bank, etc.
+    notes = db.Column(db.Text)
+    updated_version = db.Column(db.BigInteger, nullable=False, default=0)  # DataVersion.version of the last write
+    insert_sentinel = db.insert_sentinel('insert_sentinel')  # see Order.insert_sentinel
+    user = db.relationship('User', backref='payments')
+    __table_args__ = (
+        db.Index('ix_payment_order_date', 'order_id', 'payment_date'),
+        db.Index('ix_payment_user_version', 'user_id', 'updated_version'),
+    )
+
+class StockBalance(db.Model):
+    """Running stock totals per user, kept in step with the stock ledger"""
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    total_bags_added = db.Column(db.Integer, nullable=False, default=0)
+    total_kg_added = db.Column(db.Float, nullable=False, default=0.0)
+    total_sold_kg = db.Column(db.Float, nullable=False, default=0.0)
+    available_kg = db.Column(db.Float, nullable=False, default=0.0)
+    reserved_kg = db.Column(db.Float, nullable=False, default=0.0)  # held by pending orders
+    updated_at = db.Column(db.DateTime, default=get_eat_time)
+
+class StockMovement(db.Model):
+    """Append-only stock ledger; balance_kg is the running balance after the movement"""
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    movement_type = db.Column(db.String(20), nullable=False)  # opening, purchase, adjustment, sale, sale_reversal
+    quantity_kg = db.Column(db.Float, nullable=False)  # signed change in available kg
+    bags = db.Column(db.Integer, nullable=False, default=0)
+    balance_kg = db.Column(db.Float, nullable=False)
+    inventory_id = db.Column(db.Integer, db.ForeignKey('inventory.id'))
+    order_id = db.Column(db.Integer, db.ForeignKey('order.id'))
+    created_at = db.Column(db.DateTime, default=get_eat_time)
+    inventory = db.relationship('Inventory')
+    order = db.relationship('Order')
+    __table_args__ = (
+        db.Index('ix_stock_movement_user', 'user_id', 'id'),
+    )
+
+class DailySalesSummary(db.Model):
+    """Delivered-order totals per user, EAT calendar day (of order_date) and customer type"""
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    customer_type = db.Column(db.String(20), nullable=False)
+    order_count = db.Column(db.Integer, nullable=False, default=0)
+    kg_sold = db.Column(db.Float, nullable=False, default=0.0)
+    order_amount = db.Column(db.Float, nullable=False, default=0.0)
+    amount_paid = db.Column(db.Float, nullable=False, default=0.0)
+    cost = db.Column(db.Float, nullable=False, default=0.0)
+    __table_args__ = (db.UniqueConstraint('user_id', 'day', 'customer_type'),)
+
+class RecordCounts(db.Model):
+    """Running order and customer counts per user, so the dashboard never counts rows"""
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    order_count = db.Column(db.Integer, nullable=False, default=0)
+    customer_count = db.Column(db.Integer, nullable=False, default=0)
+
+class DataVersion(db.Model):
+    """Per-user change counter, bumped in the same transaction as any write to the user's
+    orders, customers, inventory or payments; list and report ETags are derived from it"""
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+class Tombstone(db.Model):
+    """Deleted orders, customers, inventory records and payments, for GET /api/sync"""
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    entity = db.Column(db.String(20), nullable=False)  # table name of the deleted row
+    entity_id = db.Column(db.Integer, nullable=False)
+    version = db.Column(db.BigInteger, nullable=False)  # DataVersion.version of the delete
+    __table_args__ = (
+        db.Index('ix_tombstone_user_version', 'user_id', 'version'),
+    )
+
+class UserEvent(db.Model):
+    """Outbox of live updates for GET /api/events; only the newest EVENTS_BUFFER_SIZE per user are kept"""
+    id = db.Column(db.Integer, primary_key=True)  # SSE event id, used for Last-Event-ID
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    event_type = db.Column(db.String(30), nullable=False)  # order_created, status_changed, payment_added, stock_changed
+    data = db.Column(db.Text, nullable=False)  # JSON payload
+    created_at = db.Column(db.DateTime, default=get_eat_time)
+    __table_args__ = (
+        db.Index('ix_user_event_user_id', 'user_id', 'id'),
+    )
+
+class RevokedToken(db.Model):
+    """Signed-out bearer tokens, kept until they would have expired anyway"""
+    id = db.Column(db.Integer, primary_key=True)
+    signature = db.Column(db.String(64), unique=True, nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    expires_at = db.Column(db.Integer, nullable=False)  # Unix time
+    __table_args__ = (
+        db.Index('ix_revoked_token_expires', 'expires_at'),
+    )
@@ -0,0 +1,69 @@
+from flask import request, jsonify
+from datetime import datetime
+import base64
+import json
+
+from .extensions import db
+
+# Keyset pagination shared by the list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+def encode_cursor(sort_value, row_id):
+    """Opaque cursor pointing just after the row with this (date, id)"""
+    payload = json.dumps([sort_value.isoformat() if sort_value else None, row_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor; raises ValueError for anything malformed"""
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        return (datetime.fromisoformat(sort_value) if sort_value else None), int(row_id)
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError('Invalid cursor')
+
+def paginate_newest_first(query, date_column, id_column, serialize):
+    """Return one page of `query`, newest first by (date_column, id_column).
+
+    Query parameters: `limit` (1..MAX_PAGE_SIZE), `cursor` (the next_cursor
+    of the previous page) and `include_total=true` for a total count. The
+    old unpaginated list is only returned with `paginate=false`.
+    Rows may be ORM objects or named tuples exposing both columns by name.
+    """
+    query = query.order_by(date_column.desc(), id_column.desc())
+    if request.args.get('paginate', 'true').lower() == 'false':
+        return jsonify([serialize(row) for row in query.all()])
+    
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return jsonify({'error': 'Limit must be a number'}), 400
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return jsonify({'error': f'Limit must be between 1 and {MAX_PAGE_SIZE}'}), 400
+    
+    cursor = request.args.get('cursor')
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    page = query
+    if position:
+        last_date, last_id = position
+        page = page.filter(db.or_(
+            date_column < last_date,
+            db.and_(date_column == last_date, id_column < last_id)
+        ))
+    rows = page.limit(limit + 1).all()
+    
+    result = {
+        'items': [serialize(row) for row in rows[:limit]],
+        'next_cursor': None,
+        'limit': limit
+    }
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        result['next_cursor'] = encode_cursor(getattr(last, date_column.key), getattr(last, id_column.key))
+    if request.args.get('include_total', 'false').lower() == 'true':
+        result['total_count'] = query.order_by(None).count()
+    return jsonify(result)
@@ -0,0 +1,100 @@
+from flask import current_app, request, jsonify
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from .security import get_current_user_id
+
+# One token bucket per (budget, client) in a small SQLite file shared by every
+# worker process on the host. The refill, the check and the take happen in a
+# single upsert; SET expressions all see the old row, so the refill is
+# computed once per column from the same values.
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS rate_bucket (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    allowed INTEGER NOT NULL
+)
+'''
+TAKE_TOKEN = '''
+INSERT INTO rate_bucket (key, tokens, updated_at, allowed) VALUES (:key, :capacity - 1, :now, 1)
+ON CONFLICT (key) DO UPDATE SET
+    allowed = MIN(:capacity, tokens + (:now - updated_at) * :rate) >= 1,
+    tokens = MIN(:capacity, tokens + (:now - updated_at) * :rate)
+        - (MIN(:capacity, tokens + (:now - updated_at) * :rate) >= 1),
+    updated_at = :now
+RETURNING tokens, allowed
+'''
+PRUNE_EVERY = 1000  # calls per process between sweeps of idle buckets
+
+_local = threading.local()
+_calls = 0
+
+def _connection():
+    """This thread's connection to the limiter database (reopened after fork)"""
+    connection = getattr(_local, 'connection', None)
+    if connection is None or _local.pid != os.getpid():
+        path = current_app.config['RATE_LIMIT_DB']
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        connection = sqlite3.connect(path, timeout=1, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=OFF')  # throwaway counters; losing them on a crash is fine
+        connection.execute(SCHEMA)
+        _local.connection, _local.pid = connection, os.getpid()
+    return connection
+
+def budget_for(endpoint):
+    """(name, capacity, period seconds) for an endpoint, or None if it is not limited.
+
+    RATE_LIMITS is looked up by endpoint ('auth.signin'), then blueprint
+    ('reports.*'), then 'default'.
+    """
+    limits = current_app.config['RATE_LIMITS']
+    for name in (endpoint, f"{endpoint.split('.')[0]}.*", 'default'):
+        if name in limits:
+            return (name, *limits[name]) if limits[name] else None
+    return None
+
+def take_token(key, capacity, period):
+    """Spend one token from a bucket; returns (allowed, seconds until the next token)"""
+    global _calls
+    rate = capacity / period
+    now = time.time()
+    connection = _connection()
+    tokens, allowed = connection.execute(TAKE_TOKEN, {'key': key, 'capacity': capacity, 'rate': rate, 'now': now}).fetchone()
+
+    _calls += 1
+    if _calls % PRUNE_EVERY == 0:
+        connection.execute('DELETE FROM rate_bucket WHERE updated_at < ?', (now - 3600,))
+    return bool(allowed), max(0.0, (1 - tokens) / rate)
+
+def check_rate_limit():
+    """before_request hook: answer 429 once the client's budget for this route is spent"""
+    if request.method == 'OPTIONS' or not request.endpoint:
+        return None
+    budget = budget_for(request.endpoint)
+    if budget is None:
+        return None
+
+    name, capacity, period = budget
+    user_id = get_current_user_id()
+    client = f'user:{user_id}' if user_id else f'ip:{request.remote_addr}'
+    try:
+        allowed, retry_after = take_token(f'{name}|{client}', capacity, period)
+    except sqlite3.Error as e:
+        current_app.logger.warning('Rate limiter unavailable, letting request through: %s', e)
+        return None
+    if allowed:
+        return None
+    return jsonify({'error': 'Too many requests, please slow down'}), 429, {'Retry-After': str(math.ceil(retry_after))}
+
+def init_rate_limiter(app):
+    """Install the limiter when RATE_LIMIT_ENABLED is set"""
+    if not app.config['RATE_LIMIT_ENABLED']:
+        return
+    if not app.config['RATE_LIMIT_DB']:
+        app.config['RATE_LIMIT_DB'] = os.path.join(app.instance_path, 'ratelimit.db')
+    app.before_request(check_rate_limit)
@@ -0,0 +1,132 @@
+from flask.cli import AppGroup
+import click
+
+from .extensions import db, dialect_insert
+from .models import eat_day, Customer, Order, DailySalesSummary, RecordCounts
+
+COST_PER_KG = 150  # KES 150 per kg (9000/60)
+
+def sales_snapshot(order):
+    """What an order contributes to the daily sales summary, or None unless delivered"""
+    if order.delivery_status != 'delivered':
+        return None
+    return (
+        eat_day(order.order_date), order.customer.customer_type,
+        order.quantity_kg, order.total_amount, order.amount_paid
+    )
+
+def apply_sales_change(user_id, before, after):
+    """Move an order's contribution in the daily summary from one snapshot to another.
+
+    Take `before` with sales_snapshot() prior to changing the order and
+    `after` once the change is made; runs in the caller's transaction.
+    """
+    apply_sales_changes(user_id, [(before, after)])
+
+def apply_sales_changes(user_id, changes):
+    """apply_sales_change for many (before, after) pairs, with one upsert per summary row touched"""
+    deltas = {}
+    for before, after in changes:
+        for snapshot, sign in ((before, -1), (after, 1)):
+            if snapshot is None:
+                continue
+            day, customer_type, kg, amount, paid = snapshot
+            totals = deltas.setdefault((day, customer_type), [0, 0, 0, 0])
+            for i, value in enumerate((1, kg, amount, paid)):
+                totals[i] += sign * value
+    
+    for (day, customer_type), totals in deltas.items():
+        if any(totals):
+            bump_daily_sales(user_id, day, customer_type, *totals)
+
+def bump_daily_sales(user_id, day, customer_type, orders, kg, amount, paid):
+    """Add deltas to one summary row, creating it if needed, with a single upsert"""
+    stmt = dialect_insert(DailySalesSummary).values(
+        user_id=user_id,
+        day=day,
+        customer_type=customer_type,
+        order_count=orders,
+        kg_sold=kg,
+        order_amount=amount,
+        amount_paid=paid,
+        cost=kg * COST_PER_KG
+    )
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=['user_id', 'day', 'customer_type'],
+        set_={
+            column: getattr(DailySalesSummary, column) + getattr(stmt.excluded, column)
+            for column in ('order_count', 'kg_sold', 'order_amount', 'amount_paid', 'cost')
+        }
+    ))
+
+def backfill_daily_sales(user_id=None):
+    """Rebuild the daily sales summary from delivered orders; returns the number of rows written"""
+    query = db.session.query(
+        Order.user_id, Order.order_date, Customer.customer_type,
+        Order.quantity_kg, Order.total_amount, Order.amount_paid
+    ).join(Customer, Order.customer_id == Customer.id).filter(
+        Order.delivery_status == 'delivered',
+        Order.order_date.isnot(None)
+    )
+    summary = db.session.query(DailySalesSummary)
+    if user_id:
+        query = query.filter(Order.user_id == user_id)
+        summary = summary.filter(DailySalesSummary.user_id == user_id)
+    summary.delete(synchronize_session=False)
+    
+    rows = {}
+    for uid, order_date, customer_type, kg, amount, paid in query:
+        key = (uid, eat_day(order_date), customer_type)
+        row = rows.setdefault(key, {
+            'user_id': uid, 'day': key[1], 'customer_type': customer_type,
+            'order_count': 0, 'kg_sold': 0, 'order_amount': 0, 'amount_paid': 0, 'cost': 0
+        })
+        row['order_count'] += 1
+        row['kg_sold'] += kg
+        row['order_amount'] += amount
+        row['amount_paid'] += paid
+        row['cost'] += kg * COST_PER_KG
+    
+    if rows:
+        db.session.execute(db.insert(DailySalesSummary), list(rows.values()))
+    return len(rows)
+
+def bump_record_counts(user_id, orders=0, customers=0):
+    """Add to a user's order/customer counts with a single upsert; runs in the caller's transaction"""
+    stmt = dialect_insert(RecordCounts).values(user_id=user_id, order_count=orders, customer_count=customers)
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=['user_id'],
+        set_={
+            'order_count': RecordCounts.order_count + stmt.excluded.order_count,
+            'customer_count': RecordCounts.customer_count + stmt.excluded.customer_count
+        }
+    ))
+
+def backfill_record_counts(user_id=None):
+    """Recount orders and customers per user; returns the number of rows written"""
+    counts = {}
+    for model, column in ((Order, 'order_count'), (Customer, 'customer_count')):
+        query = db.session.query(model.user_id, db.func.count(model.id)).group_by(model.user_id)
+        if user_id:
+            query = query.filter(model.user_id == user_id)
+        for uid, count in query:
+            counts.setdefault(uid, {'user_id': uid, 'order_count': 0, 'customer_count': 0})[column] = count
+    
+    stale = db.session.query(RecordCounts)
+    if user_id:
+        stale = stale.filter(RecordCounts.user_id == user_id)
+    stale.delete(synchronize_session=False)
+    if counts:
+        db.session.execute(db.insert(RecordCounts), list(counts.values()))
+    return len(counts)
+
+reports_cli = AppGroup('reports', help='Report rollup maintenance commands')
+
+@reports_cli.command('backfill')
+@click.option('--user-id', type=int, help='Only backfill the summary of this user')
+def reports_backfill_command(user_id):
+    """Rebuild the daily sales summary and the dashboard record counts"""
+    count = backfill_daily_sales(user_id)
+    users = backfill_record_counts(user_id)
+    db.session.commit()
+    click.echo(f"✅ Wrote {count} daily sales summary row(s) and record counts for {users} user(s)")
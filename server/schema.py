@@ -0,0 +1,106 @@
+from flask import current_app
+from flask.cli import with_appcontext
+import click
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows: bootstrap runs unlocked
+    fcntl = None
+
+from .extensions import db
+from .models import User
+from .sales import backfill_daily_sales, backfill_record_counts
+from .security import hash_password
+from .snapshot import restore_snapshot
+
+# Columns added after a table was first released; create_all() never alters existing tables.
+# Each entry is (table, column, column DDL, backfill SQL run once after the column is added).
+SCHEMA_UPGRADES = [
+    ('stock_balance', 'reserved_kg', 'FLOAT NOT NULL DEFAULT 0',
+     'UPDATE stock_balance SET reserved_kg = (SELECT COALESCE(SUM(quantity_kg), 0) FROM "order" '
+     "WHERE \"order\".user_id = stock_balance.user_id AND \"order\".delivery_status = 'pending')"),
+    # Rows written before delta sync are only sent by a full sync (no since=)
+    ('order', 'updated_version', 'BIGINT NOT NULL DEFAULT 0', None),
+    ('customer', 'updated_version', 'BIGINT NOT NULL DEFAULT 0', None),
+    ('inventory', 'updated_version', 'BIGINT NOT NULL DEFAULT 0', None),
+    ('payment', 'updated_version', 'BIGINT NOT NULL DEFAULT 0', None),
+    ('order', 'version', 'INTEGER NOT NULL DEFAULT 1', None),
+    # Only bulk inserts fill these in; older rows keep NULL
+    ('order', 'insert_sentinel', 'INTEGER', None),
+    ('payment', 'insert_sentinel', 'INTEGER', None),
+]
+
+def upgrade_schema():
+    """Add columns and indexes introduced since an existing database was created"""
+    inspector = db.inspect(db.engine)
+    tables = inspector.get_table_names()
+    for table, column, ddl, backfill in SCHEMA_UPGRADES:
+        if table not in tables or column in {c['name'] for c in inspector.get_columns(table)}:
+            continue
+        db.session.execute(db.text(f'ALTER TABLE "{table}" ADD COLUMN {column} {ddl}'))
+        if backfill:
+            db.session.execute(db.text(backfill))
+    db.session.commit()
+    
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+def bootstrap_database(app, reset=False):
+    """Create or upgrade the schema and seed the default admin user.
+
+    Runs once per start from the gunicorn master (gunicorn.conf.py),
+    `flask bootstrap` or `python app.py` - never at import time or in a
+    request. A file lock in the instance folder serialises concurrent starts.
+    With SNAPSHOT_DIR set, a newer snapshot replaces the local database first.
+    reset drops every table instead, starting from an empty database.
+    """
+    os.makedirs(app.instance_path, exist_ok=True)
+    with open(os.path.join(app.instance_path, 'bootstrap.lock'), 'w') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        with app.app_context():
+            try:
+                if reset:
+                    db.drop_all()
+                    print("✅ Database tables dropped")
+                # Ephemeral disks come back empty after a sleep; start from the last snapshot
+                elif restore_snapshot():
+                    print("✅ Database restored from snapshot")
+                inspector = db.inspect(db.engine)
+                had_summary = inspector.has_table('daily_sales_summary')
+                had_counts = inspector.has_table('record_counts')
+                db.create_all()
+                upgrade_schema()
+                if not had_summary:
+                    backfill_daily_sales()
+                if not had_counts:
+                    backfill_record_counts()
+                db.session.commit()
+                print("✅ Database tables created successfully")
+                
+                # Create a default admin user if no users exist
+                if User.query.count() == 0:
+                    admin_user = User(
+                        username='admin',
+                        email='admin@jb-rice-pro.com',
+                        phone='123456789',
+                        password_hash=hash_password('Admin123!')
+                    )
+                    db.session.add(admin_user)
+                    db.session.commit()
+                    print("✅ Default admin user created")
+                    
+            except Exception as e:
+                print(f"⚠️ Database initialization error: {e}")
+
+
+@click.command('bootstrap')
+@click.option('--reset', is_flag=True, help='Drop every table first, deleting all data')
+@with_appcontext
+def bootstrap_command(reset):
+    """Create or upgrade the database schema and seed the admin user"""
+    if reset:
+        click.confirm('Delete all data and recreate the database?', abort=True)
+    bootstrap_database(current_app, reset=reset)
@@ -0,0 +1,251 @@
+from flask import current_app, request
+from flask.cli import with_appcontext
+from collections import OrderedDict
+from contextlib import contextmanager
+import base64
+import click
+import hashlib
+import hmac
+import re
+import secrets
+import statistics
+import threading
+import time
+
+from .extensions import db
+from .models import RevokedToken
+
+# Password validation function
+def validate_password(password):
+    """Validate password strength"""
+    if len(password) < 6:
+        return False, "Password must be at least 6 characters long"
+    
+    if not re.search(r'[A-Za-z]', password):
+        return False, "Password must contain at least one letter"
+    
+    if not re.search(r'\d', password):
+        return False, "Password must contain at least one number"
+    
+    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+        return False, "Password must contain at least one special character"
+    
+    return True, "Password is valid"
+
+# Password hashing: "<algorithm>$<cost params...>$<salt>$<hash>" using a stdlib KDF
+class PasswordHasherBusy(Exception):
+    """Every password hashing slot in this process stayed busy for PASSWORD_HASH_WAIT_SECONDS"""
+
+def _scrypt(password, salt, n, r, p):
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r * p, dklen=32)
+
+def _pbkdf2_sha256(password, salt, iterations):
+    return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, iterations)
+
+# algorithm -> (derive function, cost parameters from config)
+PASSWORD_HASHERS = {
+    'scrypt': (_scrypt, lambda config: (
+        config['PASSWORD_SCRYPT_N'], config['PASSWORD_SCRYPT_R'], config['PASSWORD_SCRYPT_P']
+    )),
+    'pbkdf2_sha256': (_pbkdf2_sha256, lambda config: (config['PASSWORD_PBKDF2_ITERATIONS'],))
+}
+LEGACY_HASH_PREFIX = 'hashed_'  # plaintext demo format, replaced on the next sign in
+
+_hashing_slots = None
+_hashing_slots_lock = threading.Lock()
+
+@contextmanager
+def _hashing_slot():
+    """Bound concurrent KDF runs per process so a login burst leaves threads for other traffic"""
+    global _hashing_slots
+    if _hashing_slots is None:
+        with _hashing_slots_lock:
+            if _hashing_slots is None:
+                _hashing_slots = threading.BoundedSemaphore(current_app.config['PASSWORD_HASH_CONCURRENCY'])
+    if not _hashing_slots.acquire(timeout=current_app.config['PASSWORD_HASH_WAIT_SECONDS']):
+        raise PasswordHasherBusy()
+    try:
+        yield
+    finally:
+        _hashing_slots.release()
+
+def hash_password(password, algorithm=None, params=None):
+    """Hash a password with the configured KDF and cost"""
+    algorithm = algorithm or current_app.config['PASSWORD_HASHER']
+    derive, configured_params = PASSWORD_HASHERS[algorithm]
+    params = params or configured_params(current_app.config)
+    salt = secrets.token_bytes(16)
+    with _hashing_slot():
+        digest = derive(password, salt, *params)
+    return '$'.join([algorithm, *map(str, params), base64.b64encode(salt).decode(), base64.b64encode(digest).decode()])
+
+def verify_password(password, hashed):
+    """Check a password against any supported hash format in constant time"""
+    if hashed.startswith(LEGACY_HASH_PREFIX):
+        return hmac.compare_digest(hashed.encode(), f"{LEGACY_HASH_PREFIX}{password}".encode())
+    
+    algorithm, *params, salt, digest = hashed.split('$')
+    derive, _ = PASSWORD_HASHERS[algorithm]
+    with _hashing_slot():
+        candidate = derive(password, base64.b64decode(salt), *map(int, params))
+    return hmac.compare_digest(candidate, base64.b64decode(digest))
+
+_dummy_hashes = {}  # (algorithm, cost parameters) -> hash of a random password
+
+def dummy_password_hash():
+    """A hash with the configured KDF and cost that no password matches.
+
+    Sign in verifies against it when no user matches, so an unknown account
+    takes as long to reject as a wrong password.
+    """
+    algorithm = current_app.config['PASSWORD_HASHER']
+    params = PASSWORD_HASHERS[algorithm][1](current_app.config)
+    key = (algorithm, params)
+    if key not in _dummy_hashes:
+        _dummy_hashes[key] = hash_password(secrets.token_urlsafe(32), algorithm, params)
+    return _dummy_hashes[key]
+
+def password_needs_rehash(hashed):
+    """True if a hash uses a legacy format or a different algorithm or cost than configured"""
+    if hashed.startswith(LEGACY_HASH_PREFIX):
+        return True
+    algorithm = current_app.config['PASSWORD_HASHER']
+    _, configured_params = PASSWORD_HASHERS[algorithm]
+    return hashed.split('$')[:-2] != [algorithm, *map(str, configured_params(current_app.config))]
+
+def _time_kdf_ms(algorithm, params, rounds=3):
+    """Median milliseconds for one hash with these parameters"""
+    derive, _ = PASSWORD_HASHERS[algorithm]
+    salt = secrets.token_bytes(16)
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        derive('Calibrate123!', salt, *params)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+@click.command('calibrate-kdf')
+@click.option('--target-ms', default=250, show_default=True, help='Wanted time per password verification')
+@click.option('--algorithm', type=click.Choice(sorted(PASSWORD_HASHERS)), help='Defaults to PASSWORD_HASHER')
+@with_appcontext
+def calibrate_kdf_command(target_ms, algorithm):
+    """Pick KDF cost parameters for a target verification time on this CPU"""
+    algorithm = algorithm or current_app.config['PASSWORD_HASHER']
+    if algorithm == 'scrypt':
+        r, p = current_app.config['PASSWORD_SCRYPT_R'], current_app.config['PASSWORD_SCRYPT_P']
+        # scrypt's N must be a power of two: keep the largest one within the target
+        n, elapsed = 2 ** 10, _time_kdf_ms(algorithm, (2 ** 10, r, p))
+        while True:
+            next_elapsed = _time_kdf_ms(algorithm, (n * 2, r, p))
+            if next_elapsed > target_ms:
+                break
+            n, elapsed = n * 2, next_elapsed
+        settings = {'PASSWORD_SCRYPT_N': n, 'PASSWORD_SCRYPT_R': r, 'PASSWORD_SCRYPT_P': p}
+    else:
+        # PBKDF2 cost is linear in the iteration count
+        sample = 100000
+        iterations = max(sample, int(sample * target_ms / _time_kdf_ms(algorithm, (sample,)) / 10000) * 10000)
+        elapsed = _time_kdf_ms(algorithm, (iterations,))
+        settings = {'PASSWORD_PBKDF2_ITERATIONS': iterations}
+    
+    click.echo(f"✅ {algorithm}: {elapsed:.0f}ms per verification (target {target_ms}ms). Set:")
+    click.echo(f"PASSWORD_HASHER={algorithm}")
+    for name, value in settings.items():
+        click.echo(f"{name}={value}")
+
+# Signed bearer tokens: "<user id>.<issued at>.<HMAC-SHA256 of both with SECRET_KEY>"
+_verified_tokens = OrderedDict()  # token -> (user id, expires at), least recently used first
+_revoked_signatures = set()
+_revocations_loaded_at = None
+_token_lock = threading.Lock()
+
+def _sign(payload):
+    digest = hmac.new(current_app.config['SECRET_KEY'].encode(), payload.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).decode().rstrip('=')
+
+def issue_token(user_id):
+    """Create a signed token for a user; it expires after TOKEN_TTL_SECONDS"""
+    payload = f'{user_id}.{int(time.time())}'
+    return f'{payload}.{_sign(payload)}'
+
+def verify_token(token):
+    """Return the user id of a valid, unexpired and unrevoked token, else None.
+
+    No database round trip: tokens verified recently are answered from a
+    per-process LRU, others cost one HMAC. Revocations are an in-memory set
+    reloaded from RevokedToken every TOKEN_REVOCATION_REFRESH_SECONDS.
+    """
+    now = time.time()
+    _refresh_revocations(now)
+    payload, _, signature = token.rpartition('.')
+    if signature in _revoked_signatures:
+        return None
+    
+    cached = _verified_tokens.get(token)
+    if cached and cached[1] > now:
+        with _token_lock:
+            if token in _verified_tokens:
+                _verified_tokens.move_to_end(token)
+        return cached[0]
+    
+    try:
+        user_id, issued_at = (int(part) for part in payload.split('.'))
+    except ValueError:
+        return None
+    expires_at = issued_at + current_app.config['TOKEN_TTL_SECONDS']
+    # Bytes, since compare_digest raises TypeError on non-ASCII str
+    if expires_at <= now or not hmac.compare_digest(signature.encode(), _sign(payload).encode()):
+        return None
+    
+    with _token_lock:
+        _verified_tokens[token] = (user_id, expires_at)
+        while len(_verified_tokens) > current_app.config['AUTH_CACHE_SIZE']:
+            _verified_tokens.popitem(last=False)
+    return user_id
+
+def _refresh_revocations(now):
+    """Reload the revoked signatures when the local copy is older than the refresh interval"""
+    global _revoked_signatures, _revocations_loaded_at
+    if _revocations_loaded_at and now - _revocations_loaded_at < current_app.config['TOKEN_REVOCATION_REFRESH_SECONDS']:
+        return
+    _revoked_signatures = {
+        signature for (signature,) in
+        db.session.query(RevokedToken.signature).filter(RevokedToken.expires_at > now)
+    }
+    _revocations_loaded_at = now
+
+def revoke_token(token):
+    """Stop accepting a token (e.g. on sign out); returns False if it was not valid. The caller commits."""
+    user_id = verify_token(token)
+    if user_id is None:
+        return False
+    
+    payload, _, signature = token.rpartition('.')
+    now = int(time.time())
+    db.session.query(RevokedToken).filter(RevokedToken.expires_at <= now).delete(synchronize_session=False)
+    db.session.add(RevokedToken(
+        signature=signature,
+        user_id=user_id,
+        expires_at=int(payload.split('.')[1]) + current_app.config['TOKEN_TTL_SECONDS']
+    ))
+    _revoked_signatures.add(signature)
+    with _token_lock:
+        _verified_tokens.pop(token, None)
+    return True
+
+# Session management for user isolation using request headers
+def get_bearer_token():
+    """Get the bearer token from request headers"""
+    auth_header = request.headers.get('Authorization')
+    if auth_header and auth_header.startswith('Bearer '):
+        return auth_header[len('Bearer '):]
+    return None
+
+def get_current_user_id():
+    """Get user ID from the signed bearer token"""
+    token = get_bearer_token()
+    return verify_token(token) if token else None
+
+def set_current_user_id(user_id):
+    """This is handled by the frontend now"""
+    pass
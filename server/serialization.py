@@ -0,0 +1,120 @@
+from flask.json.provider import DefaultJSONProvider
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional: the standard json provider is used instead
+    orjson = None
+
+DISPLAY_DATE_FORMAT = '%B %d, %Y at %I:%M %p'
+
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+@lru_cache(maxsize=4096)
+def _display_minute(year, month, day, hour, minute):
+    return f'{_MONTHS[month - 1]} {day:02d}, {year} at {hour % 12 or 12:02d}:{minute:02d} {"AM" if hour < 12 else "PM"}'
+
+def display_date(value):
+    """value.strftime(DISPLAY_DATE_FORMAT), rendered once per distinct minute"""
+    return _display_minute(value.year, value.month, value.day, value.hour, value.minute)
+
+# How an attribute is rendered: as is, ISO 8601, ISO 8601 or None, display date
+_CONVERTERS = {
+    None: 'row.{attr}',
+    'iso': 'row.{attr}.isoformat()',
+    'iso_or_none': '(row.{attr}.isoformat() if row.{attr} is not None else None)',
+    'display': '_display_date(row.{attr})'
+}
+
+def compile_encoder(name, fields):
+    """Generate a row -> dict function for (key, attribute, conversion) fields.
+
+    The function body is a single dict literal built once per model, so
+    encoding a row costs no per-field loops or lookups. Rows may be ORM
+    objects or named tuples from a column projection.
+    """
+    items = ',\n        '.join(
+        f'{key!r}: ' + _CONVERTERS[conversion].format(attr=attr)
+        for key, attr, conversion in fields
+    )
+    source = f'def {name}(row):\n    return {{\n        {items}\n    }}\n'
+    namespace = {'_display_date': display_date}
+    exec(compile(source, f'<encoder {name}>', 'exec'), namespace)
+    return namespace[name]
+
+encode_order = compile_encoder('encode_order', (
+    ('id', 'id', None),
+    ('customer_id', 'customer_id', None),
+    ('customer_name', 'customer_name', None),
+    ('quantity_kg', 'quantity_kg', None),
+    ('price_per_kg', 'price_per_kg', None),
+    ('total_amount', 'total_amount', None),
+    ('order_date', 'order_date', 'iso'),
+    ('delivery_status', 'delivery_status', None),
+    ('delivery_date', 'delivery_date', 'iso_or_none'),
+    ('payment_status', 'payment_status', None),
+    ('amount_paid', 'amount_paid', None),
+    ('amount_remaining', 'amount_remaining', None)
+))
+
+encode_customer = compile_encoder('encode_customer', (
+    ('id', 'id', None),
+    ('name', 'name', None),
+    ('phone', 'phone', None),
+    ('email', 'email', None),
+    ('customer_type', 'customer_type', None),
+    ('address', 'address', None),
+    ('created_at', 'created_at', 'iso')
+))
+
+encode_inventory = compile_encoder('encode_inventory', (
+    ('id', 'id', None),
+    ('bags_added', 'bags_added', None),
+    ('total_kg', 'total_kg', None),
+    ('cost_per_bag', 'cost_per_bag', None),
+    ('date_added', 'date_added', 'iso'),
+    ('formatted_date', 'date_added', 'display')
+))
+
+encode_payment = compile_encoder('encode_payment', (
+    ('id', 'id', None),
+    ('order_id', 'order_id', None),
+    ('amount', 'amount', None),
+    ('payment_date', 'payment_date', 'iso'),
+    ('payment_method', 'payment_method', None),
+    ('notes', 'notes', None),
+    ('formatted_date', 'payment_date', 'display')
+))
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Responses decode to the same values as the default provider's: keys are
+    sorted and datetimes go through its default() as HTTP dates (the encoders
+    above pre-format theirs as ISO strings). The bytes differ: non-ASCII text
+    is sent as UTF-8 rather than \\u escapes, without spaces or a trailing newline.
+    """
+
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:  # json.dumps options such as indent; let the standard library handle them
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option), mimetype=self.mimetype
+        )
+
+def init_json(app):
+    """Use the orjson provider when enabled and installed"""
+    if app.config['JSON_USE_ORJSON'] and orjson is not None:
+        app.json = OrjsonProvider(app)
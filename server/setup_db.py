@@ -5,34 +5,37 @@ Database setup script for MweaRicePro ERP System
 
 import os
 import sys
-from dotenv import load_dotenv
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import the SQLite version of the app
-from app_sqlite import app, db
+from app_sqlite import app, bootstrap_database
+from server.extensions import db
+from server.models import User, Customer, Inventory
+from server.sales import bump_record_counts
+from server.stock import record_stock_movement
 
 def setup_database():
     """Initialize the database and create tables"""
     print("🗄️  Setting up MweaRicePro Database (SQLite)...")
     
+    # Create or upgrade the tables and seed the admin user
+    bootstrap_database(app)
+    
     with app.app_context():
         try:
-            # Create all tables
-            db.create_all()
-            print("✅ Database tables created successfully!")
-            
-            # Add some sample data
-            from app_sqlite import Customer, Inventory
+            # Sample data belongs to the default admin user
+            owner = User.query.order_by(User.id).first()
             
             # Check if we already have data
-            if Customer.query.count() == 0:
+            if Customer.query.filter_by(user_id=owner.id).count() == 0:
                 print("📝 Adding sample customers...")
                 
                 # Add sample customers
                 sample_customers = [
                     Customer(
+                        user_id=owner.id,
                         name="Davana Hotel",
                         phone="+254700123456",
                         email="info@davanahotel.com",
@@ -40,6 +43,7 @@ def setup_database():
                         address="Mwea Town, Kirinyaga County"
                     ),
                     Customer(
+                        user_id=owner.id,
                         name="La Enzi Club",
                         phone="+254700654321",
                         email="contact@laenziclub.com",
@@ -47,6 +51,7 @@ def setup_database():
                         address="Mwea Town, Kirinyaga County"
                     ),
                     Customer(
+                        user_id=owner.id,
                         name="John Doe",
                         phone="+254700111111",
                         email="john.doe@email.com",
@@ -54,6 +59,7 @@ def setup_database():
                         address="Mwea Town, Kirinyaga County"
                     ),
                     Customer(
+                        user_id=owner.id,
                         name="Jane Smith",
                         phone="+254700222222",
                         email="jane.smith@email.com",
@@ -64,20 +70,23 @@ def setup_database():
                 
                 for customer in sample_customers:
                     db.session.add(customer)
+                bump_record_counts(owner.id, customers=len(sample_customers))
                 
                 db.session.commit()
                 print("✅ Sample customers added successfully!")
             
-            if Inventory.query.count() == 0:
+            if Inventory.query.filter_by(user_id=owner.id).count() == 0:
                 print("📦 Adding sample inventory...")
                 
                 # Add sample inventory (10 bags = 600kg)
                 sample_inventory = Inventory(
+                    user_id=owner.id,
                     bags_added=10,
                     total_kg=600,
                     cost_per_bag=9000.0
                 )
                 
+                record_stock_movement(owner.id, 'purchase', 600, bags=10, inventory=sample_inventory)
                 db.session.add(sample_inventory)
                 db.session.commit()
                 print("✅ Sample inventory added successfully!")
@@ -0,0 +1,224 @@
+from flask import current_app, request
+from flask.cli import AppGroup
+from contextlib import contextmanager
+import atexit
+import click
+import os
+import shutil
+import sqlite3
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: snapshots are not serialised between processes
+    fcntl = None
+
+from .extensions import db
+
+WRITE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+_dirty = threading.Event()
+_worker = None
+_worker_lock = threading.Lock()
+
+def sqlite_database_path():
+    """Path of the SQLite database file, or None for server and in-memory databases"""
+    url = db.engine.url
+    if url.get_backend_name() != 'sqlite' or url.database in (None, '', ':memory:'):
+        return None
+    if url.query.get('mode') == 'memory':
+        return None
+    return url.database
+
+def snapshot_path(database_path):
+    """Where the snapshot of a database file lives, or None when snapshots are off"""
+    snapshot_dir = current_app.config['SNAPSHOT_DIR']
+    if not snapshot_dir or not database_path:
+        return None
+    return os.path.join(snapshot_dir, os.path.basename(database_path))
+
+def _modified_at(database_path):
+    """Last write to a database, including pages still sitting in its WAL file"""
+    return max(
+        os.path.getmtime(path)
+        for path in (database_path, database_path + '-wal')
+        if os.path.exists(path)
+    )
+
+def _fsync(path):
+    """Flush a file (or directory entry) to disk"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+@contextmanager
+def _snapshot_lock(wait):
+    """Hold the snapshot directory lock; yields False if busy and wait is False"""
+    with open(os.path.join(current_app.config['SNAPSHOT_DIR'], '.snapshot.lock'), 'w') as lock_file:
+        if fcntl:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+        yield True
+
+def create_snapshot(wait=False):
+    """Copy the live database into SNAPSHOT_DIR with the SQLite online backup API.
+
+    The copy goes to a temporary file that is renamed over the previous
+    snapshot, so a complete snapshot is always on disk. Its mtime is set to
+    the source's last write before the copy started, which is what
+    restore_snapshot() compares against. Returns the snapshot path, or None
+    when snapshots are off or another process holds the lock.
+    """
+    source_path = sqlite_database_path()
+    target = snapshot_path(source_path)
+    if not target or not os.path.exists(source_path):
+        return None
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+
+    with _snapshot_lock(wait) as locked:
+        if not locked:
+            return None
+        source_mtime = _modified_at(source_path)
+        temp = target + '.tmp'
+        if os.path.exists(temp):
+            os.remove(temp)
+
+        source = sqlite3.connect(source_path, timeout=current_app.config['SQLITE_PRAGMAS']['busy_timeout'] / 1000)
+        try:
+            destination = sqlite3.connect(temp)
+            try:
+                source.backup(destination, pages=current_app.config['SNAPSHOT_PAGES_PER_STEP'], sleep=0.005)
+            finally:
+                destination.close()
+        finally:
+            source.close()
+
+        _fsync(temp)
+        os.utime(temp, (source_mtime, source_mtime))
+        os.replace(temp, target)
+        _fsync(os.path.dirname(target))
+    return target
+
+def restore_snapshot(force=False):
+    """Replace the local database with the snapshot when it is missing or older.
+
+    Must run before the app opens connections (bootstrap_database does this).
+    The snapshot is copied beside the database, checked with quick_check and
+    renamed into place, and stale WAL/shared-memory files are removed first.
+    A corrupt snapshot is left alone and the local database kept. Returns
+    True if restored.
+    """
+    local_path = sqlite_database_path()
+    source = snapshot_path(local_path)
+    if not source or not os.path.exists(source):
+        return False
+    if not force and os.path.exists(local_path) and _modified_at(local_path) >= os.path.getmtime(source):
+        return False
+
+    started = time.perf_counter()
+    db.engine.dispose()
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    temp = local_path + '.restore'
+    shutil.copyfile(source, temp)  # kernel-side copy (sendfile) on Linux
+    shutil.copystat(source, temp)
+    if not _is_intact(temp):
+        os.remove(temp)
+        current_app.logger.error('Snapshot %s is corrupt; keeping the local database', source)
+        return False
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(local_path + suffix):
+            os.remove(local_path + suffix)
+    os.replace(temp, local_path)
+
+    elapsed = time.perf_counter() - started
+    size_mb = os.path.getsize(local_path) / (1024 * 1024)
+    budget = current_app.config['SNAPSHOT_RESTORE_BUDGET_SECONDS']
+    if elapsed > budget:
+        current_app.logger.warning('Snapshot restore of %.0f MB took %.1fs (budget %.0fs)', size_mb, elapsed, budget)
+    else:
+        current_app.logger.info('Restored %.0f MB snapshot in %.2fs', size_mb, elapsed)
+    return True
+
+def _is_intact(path):
+    """True if a database file passes SQLite's quick_check"""
+    try:
+        connection = sqlite3.connect(path)
+        try:
+            return connection.execute('PRAGMA quick_check').fetchone()[0] == 'ok'
+        finally:
+            connection.close()
+    except sqlite3.DatabaseError:
+        return False
+
+def init_snapshots(app):
+    """Snapshot the database after write requests, at most once per SNAPSHOT_INTERVAL_SECONDS"""
+    if not app.config['SNAPSHOT_DIR']:
+        return
+    app.after_request(_mark_dirty)
+    atexit.register(_flush_on_exit, app)
+
+def _mark_dirty(response):
+    """after_request hook: schedule a snapshot once a write has succeeded"""
+    if request.method in WRITE_METHODS and response.status_code < 400:
+        _dirty.set()
+        _start_worker(current_app._get_current_object())
+    return response
+
+def _start_worker(app):
+    """Start this process's snapshot thread (gunicorn workers each get their own)"""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_snapshot_loop, args=(app,), name='sqlite-snapshot', daemon=True)
+            _worker.start()
+
+def _snapshot_loop(app):
+    """Wait for writes, let them settle for one interval, then take a snapshot"""
+    while True:
+        _dirty.wait()
+        time.sleep(app.config['SNAPSHOT_INTERVAL_SECONDS'])
+        _dirty.clear()
+        with app.app_context():
+            try:
+                if create_snapshot() is None:
+                    _dirty.set()  # another process is snapshotting; retry next interval
+            except Exception:
+                app.logger.exception('SQLite snapshot failed')
+                _dirty.set()
+
+def _flush_on_exit(app):
+    """Snapshot writes that are still waiting when the process shuts down"""
+    if not _dirty.is_set():
+        return
+    with app.app_context():
+        try:
+            create_snapshot(wait=True)
+        except Exception:
+            app.logger.exception('SQLite snapshot on shutdown failed')
+
+snapshot_cli = AppGroup('snapshot', help='SQLite snapshot commands')
+
+@snapshot_cli.command('create')
+def snapshot_create_command():
+    """Write a snapshot of the database to SNAPSHOT_DIR now"""
+    if not current_app.config['SNAPSHOT_DIR'] or not sqlite_database_path():
+        raise click.ClickException('Snapshots need SNAPSHOT_DIR and a SQLite database file')
+    started = time.perf_counter()
+    path = create_snapshot(wait=True)
+    click.echo(f"✅ Snapshot written to {path} in {time.perf_counter() - started:.2f}s")
+
+@snapshot_cli.command('restore')
+@click.option('--force', is_flag=True, help='Restore even if the local database is newer')
+def snapshot_restore_command(force):
+    """Replace the local database with the snapshot in SNAPSHOT_DIR"""
+    started = time.perf_counter()
+    if restore_snapshot(force=force):
+        click.echo(f"✅ Restored snapshot in {time.perf_counter() - started:.2f}s")
+    else:
+        click.echo("ℹ️ Nothing restored (no snapshot, or the local database is up to date)")
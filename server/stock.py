@@ -0,0 +1,277 @@
+from flask.cli import AppGroup
+from datetime import datetime
+import click
+
+from .extensions import db, dialect_insert
+from .models import get_eat_time, User, Inventory, Order, StockBalance, StockMovement
+
+SALE_MOVEMENTS = ('sale', 'sale_reversal')
+
+def _stock_totals_from_history(user_id):
+    """Aggregate stock totals for a user straight from the Inventory and Order tables"""
+    total_bags_added, total_kg_added = db.session.query(
+        db.func.coalesce(db.func.sum(Inventory.bags_added), 0),
+        db.func.coalesce(db.func.sum(Inventory.total_kg), 0)
+    ).filter(Inventory.user_id == user_id).one()
+    total_sold_kg, reserved_kg = db.session.query(
+        db.func.coalesce(db.func.sum(db.case((Order.delivery_status == 'delivered', Order.quantity_kg), else_=0)), 0),
+        db.func.coalesce(db.func.sum(db.case((Order.delivery_status == 'pending', Order.quantity_kg), else_=0)), 0)
+    ).filter(Order.user_id == user_id).one()
+    return {
+        'total_bags_added': total_bags_added,
+        'total_kg_added': total_kg_added,
+        'total_sold_kg': total_sold_kg,
+        'available_kg': total_kg_added - total_sold_kg,
+        'reserved_kg': reserved_kg
+    }
+
+def ensure_stock_balance(user_id):
+    """Create the user's balance row from existing history if it is missing.
+
+    Called before the row being recorded is added to the session, so the
+    opening balance never includes the change that is about to be applied.
+    """
+    if db.session.query(StockBalance.user_id).filter_by(user_id=user_id).first():
+        return
+    
+    totals = _stock_totals_from_history(user_id)
+    result = db.session.execute(
+        dialect_insert(StockBalance).values(
+            user_id=user_id, updated_at=get_eat_time(), **totals
+        ).on_conflict_do_nothing()
+    )
+    if result.rowcount and totals['available_kg']:
+        db.session.add(StockMovement(
+            user_id=user_id,
+            movement_type='opening',
+            quantity_kg=totals['available_kg'],
+            bags=totals['total_bags_added'],
+            balance_kg=totals['available_kg']
+        ))
+
+def record_stock_movement(user_id, movement_type, quantity_kg, bags=0, reserved_kg=0, inventory=None, order=None):
+    """Apply a stock change to the running balance and append it to the ledger.
+
+    reserved_kg adjusts the reservation in the same UPDATE, e.g. when a
+    pending order is delivered. Runs in the caller's transaction. Record the
+    movement before mutating or adding the Inventory/Order it belongs to
+    (see ensure_stock_balance).
+    """
+    ensure_stock_balance(user_id)
+    
+    is_sale = movement_type in SALE_MOVEMENTS
+    balance_kg = db.session.execute(
+        db.update(StockBalance).where(StockBalance.user_id == user_id).values(
+            total_bags_added=StockBalance.total_bags_added + bags,
+            total_kg_added=StockBalance.total_kg_added + (0 if is_sale else quantity_kg),
+            total_sold_kg=StockBalance.total_sold_kg - (quantity_kg if is_sale else 0),
+            available_kg=StockBalance.available_kg + quantity_kg,
+            reserved_kg=StockBalance.reserved_kg + reserved_kg,
+            updated_at=get_eat_time()
+        ).returning(StockBalance.available_kg)
+    ).scalar_one()
+    
+    db.session.add(StockMovement(
+        user_id=user_id,
+        movement_type=movement_type,
+        quantity_kg=quantity_kg,
+        bags=bags,
+        balance_kg=balance_kg,
+        inventory=inventory,
+        order=order
+    ))
+    return balance_kg
+
+def reserve_stock(user_id, quantity_kg):
+    """Atomically hold kg for a pending order.
+
+    The check and the increment are a single conditional UPDATE on the user's
+    balance row, so concurrent workers cannot both claim the same stock.
+    Returns False when there is not enough unreserved stock.
+    """
+    ensure_stock_balance(user_id)
+    result = db.session.execute(
+        db.update(StockBalance).where(
+            StockBalance.user_id == user_id,
+            StockBalance.available_kg - StockBalance.reserved_kg >= quantity_kg
+        ).values(
+            reserved_kg=StockBalance.reserved_kg + quantity_kg,
+            updated_at=get_eat_time()
+        ).execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+def record_order_movements(user_id, movements):
+    """Apply many sale/sale_reversal movements with one balance UPDATE and one ledger INSERT.
+
+    movements are (movement_type, order_id, quantity_kg, reserved_kg) tuples
+    as record_stock_movement would take them one by one. Runs in the
+    caller's transaction; returns the new available_kg.
+    """
+    ensure_stock_balance(user_id)
+    
+    quantity_kg = sum(m[2] for m in movements)
+    now = get_eat_time()
+    balance_kg = db.session.execute(
+        db.update(StockBalance).where(StockBalance.user_id == user_id).values(
+            total_sold_kg=StockBalance.total_sold_kg - quantity_kg,
+            available_kg=StockBalance.available_kg + quantity_kg,
+            reserved_kg=StockBalance.reserved_kg + sum(m[3] for m in movements),
+            updated_at=now
+        ).returning(StockBalance.available_kg)
+    ).scalar_one()
+    
+    # Ledger rows carry the running balance, ending at the one just written
+    running_kg = balance_kg - quantity_kg
+    rows = []
+    for movement_type, order_id, kg, _ in movements:
+        running_kg += kg
+        rows.append({
+            'user_id': user_id,
+            'movement_type': movement_type,
+            'quantity_kg': kg,
+            'bags': 0,
+            'balance_kg': running_kg,
+            'order_id': order_id,
+            'created_at': now
+        })
+    db.session.execute(db.insert(StockMovement), rows)
+    return balance_kg
+
+def release_stock(user_id, quantity_kg):
+    """Give back kg held by a pending order (cancelled or reduced)"""
+    ensure_stock_balance(user_id)
+    db.session.execute(
+        db.update(StockBalance).where(StockBalance.user_id == user_id).values(
+            reserved_kg=StockBalance.reserved_kg - quantity_kg,
+            updated_at=get_eat_time()
+        ).execution_options(synchronize_session=False)
+    )
+
+def calculate_inventory(user_id):
+    """Calculate current inventory status for a specific user"""
+    try:
+        if not user_id:
+            return {'error': 'User not authenticated'}
+        
+        balance = db.session.query(
+            StockBalance.total_bags_added,
+            StockBalance.total_kg_added,
+            StockBalance.total_sold_kg,
+            StockBalance.available_kg,
+            StockBalance.reserved_kg
+        ).filter(StockBalance.user_id == user_id).first()
+        
+        # Users without a ledger yet (e.g. before migration) fall back to the raw tables
+        totals = balance._asdict() if balance else _stock_totals_from_history(user_id)
+        available_kg = totals['available_kg']
+        available_bags = available_kg / 60  # 60kg per bag
+        
+        return {
+            'available_kg': round(available_kg, 2),
+            'available_bags': round(available_bags, 2),
+            'reserved_kg': round(totals['reserved_kg'], 2),  # held by pending orders
+            'unreserved_kg': round(available_kg - totals['reserved_kg'], 2),
+            'total_bags_added': totals['total_bags_added'],
+            'total_kg_added': totals['total_kg_added'],
+            'total_sold_kg': totals['total_sold_kg']
+        }
+    except Exception as e:
+        return {'error': str(e)}
+
+def rebuild_stock_ledger(user_id=None):
+    """Recompute stock ledgers and balances from the raw Inventory and Order tables.
+
+    Returns the number of users rebuilt. The caller commits.
+    """
+    user_ids = [user_id] if user_id else [uid for (uid,) in db.session.query(User.id)]
+    
+    for uid in user_ids:
+        # (timestamp, sort order, movement type, kg, bags, inventory id, order id)
+        events = [
+            (r.date_added, 0, 'purchase', r.total_kg, r.bags_added, r.id, None)
+            for r in db.session.query(
+                Inventory.id, Inventory.bags_added, Inventory.total_kg, Inventory.date_added
+            ).filter(Inventory.user_id == uid)
+        ]
+        events += [
+            (o.delivery_date or o.order_date, 1, 'sale', -o.quantity_kg, 0, None, o.id)
+            for o in db.session.query(
+                Order.id, Order.quantity_kg, Order.order_date, Order.delivery_date
+            ).filter(Order.user_id == uid, Order.delivery_status == 'delivered')
+        ]
+        events.sort(key=lambda e: (e[0] or datetime.min, e[1]))
+        
+        db.session.query(StockMovement).filter(StockMovement.user_id == uid).delete(synchronize_session=False)
+        db.session.query(StockBalance).filter(StockBalance.user_id == uid).delete(synchronize_session=False)
+        
+        balance_kg = 0
+        movements = []
+        for created_at, _, movement_type, quantity_kg, bags, inventory_id, order_id in events:
+            balance_kg += quantity_kg
+            movements.append({
+                'user_id': uid,
+                'movement_type': movement_type,
+                'quantity_kg': quantity_kg,
+                'bags': bags,
+                'balance_kg': balance_kg,
+                'inventory_id': inventory_id,
+                'order_id': order_id,
+                'created_at': created_at
+            })
+        if movements:
+            db.session.execute(db.insert(StockMovement), movements)
+        
+        db.session.add(StockBalance(user_id=uid, updated_at=get_eat_time(), **_stock_totals_from_history(uid)))
+    
+    db.session.flush()
+    return len(user_ids)
+
+def verify_stock_ledger():
+    """Compare stored balances and ledgers with the raw tables; returns a list of mismatches"""
+    mismatches = []
+    balances = {b.user_id: b for b in StockBalance.query.all()}
+    ledger = {
+        uid: (total or 0)
+        for uid, total in db.session.query(
+            StockMovement.user_id, db.func.sum(StockMovement.quantity_kg)
+        ).group_by(StockMovement.user_id)
+    }
+    
+    for (uid,) in db.session.query(User.id):
+        expected = _stock_totals_from_history(uid)
+        balance = balances.get(uid)
+        if balance is None:
+            if expected['total_kg_added'] or expected['total_sold_kg']:
+                mismatches.append({'user_id': uid, 'field': 'balance', 'expected': expected['available_kg'], 'actual': None})
+            continue
+        
+        for field, value in expected.items():
+            if abs(getattr(balance, field) - value) > 1e-6:
+                mismatches.append({'user_id': uid, 'field': field, 'expected': value, 'actual': getattr(balance, field)})
+        if abs(ledger.get(uid, 0) - balance.available_kg) > 1e-6:
+            mismatches.append({'user_id': uid, 'field': 'ledger_sum', 'expected': balance.available_kg, 'actual': ledger.get(uid, 0)})
+    
+    return mismatches
+
+stock_cli = AppGroup('stock', help='Stock ledger maintenance commands')
+
+@stock_cli.command('rebuild')
+@click.option('--user-id', type=int, help='Only rebuild the ledger of this user')
+def stock_rebuild_command(user_id):
+    """Rebuild stock ledgers and balances from inventory and orders"""
+    count = rebuild_stock_ledger(user_id)
+    db.session.commit()
+    click.echo(f"✅ Rebuilt stock ledger for {count} user(s)")
+
+@stock_cli.command('verify')
+def stock_verify_command():
+    """Check stored stock balances against inventory and orders"""
+    mismatches = verify_stock_ledger()
+    if not mismatches:
+        click.echo("✅ Stock ledger is consistent")
+        return
+    
+    for m in mismatches:
+        click.echo(f"❌ user {m['user_id']}: {m['field']} expected {m['expected']}, found {m['actual']}")
+    raise SystemExit(1)
@@ -0,0 +1,85 @@
+from flask import current_app, request, make_response
+from functools import wraps
+from sqlalchemy import event
+import time
+
+from .extensions import db, dialect_insert
+from .models import get_eat_time, eat_day, Customer, Inventory, Order, Payment, DataVersion, Tombstone
+from .security import get_current_user_id
+
+VERSIONED_MODELS = (Order, Customer, Inventory, Payment)
+
+def bump_data_version(user_id):
+    """Advance a user's data version and return it; runs in the caller's transaction.
+
+    The new version is at least the current time in milliseconds, so it
+    keeps increasing even after a snapshot restore has rolled the counter
+    back and a client still holds a tag from the lost writes.
+    """
+    now_ms = int(time.time() * 1000)
+    stmt = dialect_insert(DataVersion).values(user_id=user_id, version=now_ms)
+    return db.session.execute(stmt.on_conflict_do_update(
+        index_elements=['user_id'],
+        set_={'version': db.case(
+            (DataVersion.version + 1 > stmt.excluded.version, DataVersion.version + 1),
+            else_=stmt.excluded.version
+        )}
+    ).returning(DataVersion.version)).scalar()
+
+def data_version(user_id):
+    """A user's current data version (0 before their first write)"""
+    version = db.session.query(DataVersion.version).filter(DataVersion.user_id == user_id).scalar()
+    return version or 0
+
+@event.listens_for(db.session, 'before_flush')
+def bump_versions_on_flush(session, flush_context, instances):
+    """Bump the version of every user whose versioned rows this flush inserts, changes or deletes.
+
+    Inserted and changed rows get the new version in updated_version;
+    deleted ones leave a Tombstone carrying it. Core UPDATE/DELETE
+    statements bypass the unit of work, so callers issuing them on these
+    tables bump the version and set updated_version themselves.
+    """
+    changes = {}
+    for obj in session.new | session.deleted:
+        if isinstance(obj, VERSIONED_MODELS):
+            changes.setdefault(obj.user_id, []).append(obj)
+    for obj in session.dirty:
+        if isinstance(obj, VERSIONED_MODELS) and session.is_modified(obj):
+            changes.setdefault(obj.user_id, []).append(obj)
+
+    for user_id in sorted(uid for uid in changes if uid):
+        version = bump_data_version(user_id)
+        tombstones = []
+        for obj in changes[user_id]:
+            if obj in session.deleted:
+                tombstones.append({'user_id': user_id, 'entity': obj.__tablename__, 'entity_id': obj.id, 'version': version})
+            else:
+                obj.updated_version = version
+        if tombstones:
+            session.execute(db.insert(Tombstone), tombstones)
+
+def conditional_on_data_version(view):
+    """Tag a user's GET responses with their data version and answer a matching
+    If-None-Match with 304 before the view runs any query.
+
+    The tag also carries the EAT day, since windows like "this month" move
+    at midnight without any write.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        user_id = get_current_user_id()
+        if not user_id:
+            return view(*args, **kwargs)
+
+        etag = f'{user_id}-{data_version(user_id)}-{eat_day(get_eat_time()).isoformat()}'
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'private, no-cache'  # browsers revalidate on every fetch
+        return response
+    return wrapper
@@ -0,0 +1,32 @@
+"""Fixtures shared by the API tests: a fresh app on its own SQLite file for every test"""
+
+import pytest
+
+from server.extensions import db
+from server.factory import create_app
+from server.schema import bootstrap_database
+from server.security import issue_token
+
+@pytest.fixture
+def app(tmp_path):
+    """The API on a bootstrapped SQLite file (WAL, as in production); the admin is user 1"""
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'RATE_LIMIT_ENABLED': False,
+        'TESTING': True
+    })
+    app.instance_path = str(tmp_path)  # bootstrap.lock
+    bootstrap_database(app)
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def headers(app):
+    """Authorization header for the admin user"""
+    with app.app_context():
+        return {'Authorization': f'Bearer {issue_token(1)}'}
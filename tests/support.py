@@ -0,0 +1,31 @@
+"""Helpers for the API tests"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from server.extensions import db
+
+@contextmanager
+def max_statements(limit):
+    """Fail if the wrapped block issues more than `limit` SQL statements.
+
+    Used to catch N+1 regressions, e.g. with app.app_context():
+        with max_statements(4):
+            client.get('/api/orders', headers=headers)
+    Yields the list of statements executed so far.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    if len(statements) > limit:
+        raise AssertionError(
+            f"Expected at most {limit} SQL statements, got {len(statements)}:\n" + '\n'.join(statements)
+        )
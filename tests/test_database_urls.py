@@ -0,0 +1,99 @@
+"""The app runs on every supported DATABASE_URL shape.
+
+The matrix covers a SQLite file, a shared-cache in-memory SQLite
+database, a private in-memory one and, when TEST_DATABASE_URL is set, any
+other URL (e.g. a scratch PostgreSQL database; its tables are dropped
+afterwards).
+"""
+
+import os
+import uuid
+from datetime import datetime
+
+import pytest
+
+from server.config import Config, engine_options
+from server.extensions import db
+from server.factory import create_app
+from server.models import EAT, Customer, Order
+from server.schema import bootstrap_database
+from server.security import issue_token
+
+PLUGGABLE_URL = os.getenv('TEST_DATABASE_URL')
+
+@pytest.fixture(params=['file', 'shared-memory', 'private-memory', 'pluggable'])
+def database_url(request, tmp_path):
+    """(DATABASE_URL, expected pool class name or None for any)"""
+    if request.param == 'file':
+        return f"sqlite:///{tmp_path / 'test.db'}", 'QueuePool'
+    if request.param == 'shared-memory':
+        return f'sqlite:///file:jbrice-{uuid.uuid4().hex}?mode=memory&cache=shared&uri=true', 'QueuePool'
+    if request.param == 'private-memory':
+        return 'sqlite://', 'StaticPool'
+    if not PLUGGABLE_URL:
+        pytest.skip('TEST_DATABASE_URL is not set')
+    return PLUGGABLE_URL, None
+
+@pytest.fixture
+def url_app(database_url, tmp_path):
+    url, _ = database_url
+    app = create_app({'SQLALCHEMY_DATABASE_URI': url, 'RATE_LIMIT_ENABLED': False, 'TESTING': True})
+    app.instance_path = str(tmp_path)  # bootstrap.lock
+    bootstrap_database(app)
+    yield app
+    with app.app_context():
+        if url == PLUGGABLE_URL:
+            db.drop_all()
+        db.engine.dispose()
+
+def test_api_round_trip(url_app, database_url):
+    _, pool_class = database_url
+    client = url_app.test_client()
+    with url_app.app_context():
+        headers = {'Authorization': f'Bearer {issue_token(1)}'}
+
+    assert client.post('/api/inventory', json={'bags': 2}, headers=headers).status_code == 201
+    assert client.get('/api/inventory', headers=headers).get_json()['available_kg'] == 120
+
+    health = client.get('/api/health/ready').get_json()
+    assert health['status'] == 'healthy'
+    if pool_class:
+        assert health['pool']['pool'] == pool_class
+
+def test_pooled_connections_share_the_database(url_app):
+    """Rows committed on one pooled connection are visible on another"""
+    with url_app.app_context():
+        with db.engine.connect() as writer, db.engine.connect() as reader:
+            writer.execute(db.text("INSERT INTO revoked_token (signature, user_id, expires_at) VALUES ('sig', 1, 0)"))
+            writer.commit()
+            assert reader.execute(db.text('SELECT COUNT(*) FROM revoked_token')).scalar() == 1
+
+def test_sqlite_profile_applies_to_files(url_app, database_url):
+    url, _ = database_url
+    if not url.startswith('sqlite'):
+        pytest.skip('SQLite pragmas only')
+    with url_app.app_context():
+        journal_mode = db.session.execute(db.text('PRAGMA journal_mode')).scalar()
+        foreign_keys = db.session.execute(db.text('PRAGMA foreign_keys')).scalar()
+    # In-memory databases have no WAL; they keep their 'memory' journal
+    assert journal_mode == ('memory' if 'memory' in url or url == 'sqlite://' else 'wal')
+    assert foreign_keys == 1
+
+def test_eat_timestamps_keep_their_wall_clock_time(url_app):
+    """Aware EAT datetimes are stored as Nairobi time; just after midnight must not slip to the previous day"""
+    placed = datetime(2026, 3, 2, 1, 30, tzinfo=EAT)
+    with url_app.app_context():
+        customer = Customer(user_id=1, name='Mama Njeri Hotel', customer_type='restaurant')
+        db.session.add(customer)
+        db.session.flush()
+        db.session.add(Order(user_id=1, customer_id=customer.id, quantity_kg=5, price_per_kg=180,
+                             total_amount=900, amount_remaining=900, order_date=placed))
+        db.session.commit()
+        db.session.expire_all()
+        stored = db.session.query(Order.order_date).scalar()
+    assert stored.replace(tzinfo=None) == placed.replace(tzinfo=None)
+
+def test_postgres_sessions_use_nairobi_time():
+    config = {**{name: getattr(Config, name) for name in dir(Config) if name.isupper()},
+              'SQLALCHEMY_DATABASE_URI': 'postgresql://jbrice@localhost/jbrice'}
+    assert '-c timezone=Africa/Nairobi' in engine_options(config)['connect_args']['options']
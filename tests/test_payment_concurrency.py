@@ -0,0 +1,62 @@
+"""Order balances under concurrent payments and payment deletions: no overpaying, no lost updates"""
+
+import threading
+from collections import Counter
+
+THREADS = 16
+PAYMENTS = 320
+PAYMENT = 100.0
+ORDER_TOTAL = 10000.0  # 50 kg at the individual price: room for 100 of the payments at once
+
+def test_parallel_payments_keep_the_balance(app, client, headers):
+    client.post('/api/inventory', json={'bags': 1}, headers=headers)
+    customer_id = client.post('/api/customers', json={
+        'name': 'Walk-in Kamau', 'phone': '0700000001', 'customer_type': 'individual'
+    }, headers=headers).get_json()['id']
+    order_id = client.post('/api/orders', json={'customer_id': customer_id, 'quantity_kg': 50}, headers=headers).get_json()['id']
+    assert client.put(f'/api/orders/{order_id}/status', json={'status': 'delivered'}, headers=headers).status_code == 200
+
+    added, deleted = Counter(), Counter()
+    balances = []
+    lock = threading.Lock()
+    start = threading.Barrier(THREADS)
+
+    def worker():
+        thread_client = app.test_client()
+        start.wait()
+        for i in range(PAYMENTS // THREADS):
+            response = thread_client.post(f'/api/orders/{order_id}/payments', json={'amount': PAYMENT}, headers=headers)
+            body = response.get_json()
+            with lock:
+                added[response.status_code] += 1
+                if response.status_code == 201:
+                    balances.append(body['order_status'])
+            # Take every other accepted payment back while the others keep paying
+            if response.status_code == 201 and i % 2:
+                response = thread_client.delete(f"/api/orders/{order_id}/payments/{body['payment']['id']}", headers=headers)
+                with lock:
+                    deleted[response.status_code] += 1
+                    if response.status_code == 200:
+                        balances.append(response.get_json()['order_status'])
+
+    workers = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    assert set(added) <= {201, 400, 409}, added
+    assert set(deleted) <= {200, 409}, deleted
+    assert added[201] >= ORDER_TOTAL / PAYMENT  # the order filled up
+    assert deleted[200] > 0
+    for balance in balances:
+        assert 0 <= balance['amount_paid'] <= ORDER_TOTAL
+        assert balance['amount_paid'] + balance['amount_remaining'] == ORDER_TOTAL
+
+    final = next(o for o in client.get('/api/orders?paginate=false', headers=headers).get_json() if o['id'] == order_id)
+    payments = client.get(f'/api/orders/{order_id}/payments?paginate=false', headers=headers).get_json()
+    assert final['amount_paid'] + final['amount_remaining'] == ORDER_TOTAL
+    assert final['amount_paid'] == sum(payment['amount'] for payment in payments)
+    assert final['amount_paid'] <= ORDER_TOTAL
+    assert len(payments) == added[201] - deleted[200]
+    assert final['payment_status'] == ('paid' if final['amount_remaining'] <= 0 else 'partial' if payments else 'unpaid')
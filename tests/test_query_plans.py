@@ -0,0 +1,102 @@
+"""Every query the endpoints issue is answered from an index, never a full table scan"""
+
+import pytest
+from sqlalchemy import event
+
+from server.extensions import db
+
+PASSWORD = 'Plans123!'
+
+def exercise_endpoints(client, headers):
+    """Drive every API endpoint once, with the filters the client uses"""
+    def ok(response):
+        assert response.status_code in (200, 201), (response.request.path, response.get_json())
+        return response.get_json()
+
+    ok(client.post('/api/auth/signup', json={
+        'username': 'wanjiru', 'email': 'wanjiru@example.com', 'phone': '0700000002',
+        'password': PASSWORD, 'confirm_password': PASSWORD
+    }))
+    token = ok(client.post('/api/auth/signin', json={'username_or_email': 'wanjiru@example.com', 'password': PASSWORD}))['token']
+    ok(client.post('/api/auth/forgot-password', json={'email': 'wanjiru@example.com'}))
+    reset = client.post('/api/auth/reset-password', json={'token': 'unknown', 'new_password': PASSWORD, 'confirm_password': PASSWORD})
+    assert reset.status_code == 400  # after the reset token lookup
+    ok(client.post('/api/auth/signout', headers={'Authorization': f'Bearer {token}'}))
+
+    ok(client.post('/api/inventory', json={'bags': 10}, headers=headers))
+    ok(client.put('/api/inventory/1', json={'bags': 11}, headers=headers))
+    ok(client.post('/api/customers', json={'name': 'Mama Njeri Hotel', 'phone': '0700000003', 'customer_type': 'restaurant'}, headers=headers))
+    ok(client.post('/api/customers', json={'name': 'Walk-in', 'phone': '0700000004', 'customer_type': 'individual'}, headers=headers))
+    ok(client.put('/api/customers/2', json={'name': 'Walk-in Kamau'}, headers=headers))
+
+    ok(client.post('/api/orders', json={'customer_id': 1, 'quantity_kg': 50}, headers=headers))
+    ok(client.put('/api/orders/1', json={'quantity_kg': 40}, headers=headers))
+    ok(client.put('/api/orders/1/status', json={'status': 'delivered'}, headers=headers))
+    ok(client.post('/api/orders/1/payments', json={'amount': 1000}, headers=headers))
+    ok(client.delete('/api/orders/1/payments/1', headers=headers))
+    ok(client.post('/api/orders/bulk', json={'orders': [
+        {'customer_id': 1, 'quantity_kg': 10}, {'customer_id': 2, 'quantity_kg': 20}
+    ]}, headers=headers))
+    ok(client.put('/api/orders/bulk/status', json={'orders': [
+        {'id': 2, 'status': 'delivered'}, {'id': 3, 'status': 'cancelled'}
+    ]}, headers=headers))
+    ok(client.post('/api/orders/bulk/payments', json={'payments': [{'order_id': 2, 'amount': 500}]}, headers=headers))
+    ok(client.post('/api/customers', json={'name': 'Gone', 'phone': '0700000005', 'customer_type': 'individual'}, headers=headers))
+    ok(client.delete('/api/customers/3', headers=headers))
+
+    for path in (
+        '/api/inventory',
+        '/api/inventory/history?period=week',
+        '/api/inventory/history?paginate=false',
+        '/api/customers?type=restaurant',
+        '/api/customers?include_total=true',
+        '/api/orders?status=delivered&period=week&include_total=true',
+        '/api/orders?status=pending&period=month',
+        '/api/orders?customer_id=1',
+        '/api/orders?paginate=false',
+        '/api/orders/1/payments',
+        '/api/dashboard/summary',
+        '/api/reports/sales?period=week',
+        '/api/reports/inventory',
+        '/api/reports/timeseries?bucket=week',
+        '/api/sync',
+        '/api/sync?since=1',
+        '/api/health/ready'
+    ):
+        ok(client.get(path, headers=headers))
+    events = client.get('/api/events', headers=headers)
+    assert events.status_code == 200
+    events.close()
+
+def full_scans(connection, statement, parameters):
+    """SCAN steps of a statement's plan that don't use an index"""
+    plan = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).fetchall()
+    return [row[-1] for row in plan if row[-1].startswith('SCAN') and 'INDEX' not in row[-1] and 'CONSTANT ROW' not in row[-1]]
+
+@pytest.fixture
+def endpoint_queries(app, client, headers):
+    """Every SELECT, UPDATE and DELETE the endpoints issued, with its parameters"""
+    queries = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(('SELECT', 'UPDATE', 'DELETE', 'WITH')):
+            queries.append((statement, parameters))
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            exercise_endpoints(client, headers)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+    return queries
+
+def test_no_endpoint_query_scans_a_table(app, endpoint_queries):
+    assert len(endpoint_queries) > 100  # the recorder saw the endpoints run
+    with app.app_context():
+        with db.engine.connect() as connection:
+            offenders = {
+                (' '.join(statement.split()), scan)
+                for statement, parameters in endpoint_queries
+                for scan in full_scans(connection, statement, parameters)
+            }
+    assert not offenders, '\n'.join(f'{scan}: {statement}' for statement, scan in sorted(offenders))
@@ -0,0 +1,56 @@
+"""The orjson provider sends the same JSON values as Flask's default provider"""
+
+import json
+from datetime import datetime
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+
+from server.serialization import OrjsonProvider, orjson
+
+pytestmark = pytest.mark.skipif(orjson is None, reason='orjson is not installed')
+
+PATHS = (
+    '/api/customers?paginate=false',
+    '/api/orders?paginate=false',
+    '/api/orders/1/payments?paginate=false',
+    '/api/inventory/history?paginate=false',
+    '/api/reports/inventory',
+    '/api/sync'
+)
+
+@pytest.fixture
+def sales(client, headers):
+    """Customers with non-ASCII names, a delivered order and a payment"""
+    def ok(response):
+        assert response.status_code in (200, 201), response.get_json()
+
+    ok(client.post('/api/inventory', json={'bags': 2}, headers=headers))
+    ok(client.post('/api/customers', json={'name': 'Café Wanjirũ', 'phone': '0700000001', 'customer_type': 'restaurant'}, headers=headers))
+    ok(client.post('/api/customers', json={'name': 'Njoroge “Mzee” Kamau', 'phone': '0700000002', 'customer_type': 'individual'}, headers=headers))
+    ok(client.post('/api/orders', json={'customer_id': 1, 'quantity_kg': 50}, headers=headers))
+    ok(client.put('/api/orders/1/status', json={'status': 'delivered'}, headers=headers))
+    ok(client.post('/api/orders/1/payments', json={'amount': 1000, 'notes': 'M-Pesa · ref QX1'}, headers=headers))
+
+def bodies(app, client, headers, provider):
+    app.json = provider
+    return [client.get(path, headers=headers).get_data() for path in PATHS]
+
+def test_api_responses_decode_to_the_same_values(app, client, headers, sales):
+    assert isinstance(app.json, OrjsonProvider)
+    fast = bodies(app, client, headers, app.json)
+    standard = bodies(app, client, headers, DefaultJSONProvider(app))
+
+    for path, fast_body, standard_body in zip(PATHS, fast, standard):
+        assert json.loads(fast_body) == json.loads(standard_body), path
+    # Only the encoding of the text differs
+    assert 'Café Wanjirũ'.encode() in fast[0]
+    assert b'Caf\\u00e9 Wanjir\\u0169' in standard[0]
+
+def test_datetimes_are_http_dates_as_with_the_default_provider(app):
+    payload = {'name': 'Café Wanjirũ', 'at': datetime(2026, 3, 2, 1, 30), 'totals': {1: 900.0}}
+    with app.app_context():
+        fast = OrjsonProvider(app).response(payload).get_data()
+        standard = DefaultJSONProvider(app).response(payload).get_data()
+    assert json.loads(fast) == json.loads(standard)
+    assert json.loads(fast)['at'] == 'Mon, 02 Mar 2026 01:30:00 GMT'
@@ -0,0 +1,42 @@
+"""Signing in as an unknown user costs the same KDF run as a wrong password"""
+
+import pytest
+
+from server import security
+
+@pytest.fixture
+def kdf_runs(app, monkeypatch):
+    """Number of times the configured KDF has run"""
+    runs = []
+    algorithm = app.config['PASSWORD_HASHER']
+    derive, params = security.PASSWORD_HASHERS[algorithm]
+
+    def counting(*args):
+        runs.append(args[1:])
+        return derive(*args)
+
+    monkeypatch.setitem(security.PASSWORD_HASHERS, algorithm, (counting, params))
+    return runs
+
+def sign_in(client, username_or_email, password='Wrong123!'):
+    return client.post('/api/auth/signin', json={'username_or_email': username_or_email, 'password': password})
+
+def test_unknown_user_runs_the_kdf_like_a_wrong_password(client, kdf_runs):
+    sign_in(client, 'nobody@example.com')  # builds the dummy hash
+    del kdf_runs[:]
+
+    assert sign_in(client, 'admin').status_code == 401
+    wrong_password = list(kdf_runs)
+    del kdf_runs[:]
+    assert sign_in(client, 'nobody@example.com').status_code == 401
+
+    assert len(kdf_runs) == len(wrong_password) == 1
+    assert kdf_runs[0][1:] == wrong_password[0][1:]  # same cost parameters
+
+def test_unknown_user_waits_for_a_hashing_slot(app, client):
+    with app.app_context():
+        sign_in(client, 'nobody@example.com')  # builds the dummy hash
+        app.config['PASSWORD_HASH_WAIT_SECONDS'] = 0.05
+        with security._hashing_slot():  # PASSWORD_HASH_CONCURRENCY is 1
+            assert sign_in(client, 'nobody@example.com').status_code == 503
+            assert sign_in(client, 'admin').status_code == 503
@@ -0,0 +1,91 @@
+"""An ephemeral disk comes back from the last snapshot on start (see DATA_PERSISTENCE_GUIDE.md)"""
+
+import os
+import time
+
+import pytest
+
+from server.extensions import db
+from server.factory import create_app
+from server.models import Customer, User
+from server.schema import bootstrap_database
+from server.snapshot import create_snapshot
+
+CUSTOMERS = 200
+
+@pytest.fixture
+def dirs(tmp_path):
+    """(local database directory, snapshot directory), as on the Render disk and its persistent mount"""
+    local, snapshots = tmp_path / 'local', tmp_path / 'snapshots'
+    local.mkdir()
+    snapshots.mkdir()
+    return local, snapshots
+
+def start(local, snapshots):
+    """A bootstrapped app on local/test.db that snapshots into snapshots/"""
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{local / 'test.db'}",
+        'SNAPSHOT_DIR': str(snapshots),
+        'RATE_LIMIT_ENABLED': False,
+        'TESTING': True
+    })
+    app.instance_path = str(local)  # bootstrap.lock
+    bootstrap_database(app)
+    return app
+
+def stop(app):
+    with app.app_context():
+        db.engine.dispose()
+
+def lose_local_database(local):
+    """What a restarted free-tier instance sees: the database and its WAL are gone"""
+    for name in ('test.db', 'test.db-wal', 'test.db-shm'):
+        if (local / name).exists():
+            os.remove(local / name)
+
+def counts(app):
+    with app.app_context():
+        return User.query.count(), Customer.query.count()
+
+def test_restore_brings_the_rows_back_within_budget(dirs):
+    local, snapshots = dirs
+    app = start(local, snapshots)
+    with app.app_context():
+        db.session.execute(db.insert(Customer), [
+            {'user_id': 1, 'name': f'Customer {i}', 'customer_type': 'restaurant'} for i in range(CUSTOMERS)
+        ])
+        db.session.commit()
+        assert create_snapshot(wait=True) == str(snapshots / 'test.db')
+    stop(app)
+    lose_local_database(local)
+
+    started = time.perf_counter()
+    app = start(local, snapshots)
+    elapsed = time.perf_counter() - started
+    try:
+        assert counts(app) == (1, CUSTOMERS)
+        assert elapsed < app.config['SNAPSHOT_RESTORE_BUDGET_SECONDS']
+    finally:
+        stop(app)
+
+def test_missing_snapshot_starts_a_fresh_database(dirs):
+    local, snapshots = dirs
+    app = start(local, snapshots)
+    try:
+        assert counts(app) == (1, 0)
+        assert not (snapshots / 'test.db').exists()
+    finally:
+        stop(app)
+
+def test_corrupt_snapshot_is_not_restored(dirs, caplog):
+    local, snapshots = dirs
+    (snapshots / 'test.db').write_bytes(b'SQLite format 3\x00' + b'\xff' * 4096)
+
+    app = start(local, snapshots)
+    try:
+        assert counts(app) == (1, 0)  # a fresh database with the admin, not a half-restored one
+        assert 'is corrupt' in caplog.text
+        assert not (local / 'test.db.restore').exists()
+        assert (snapshots / 'test.db').read_bytes().startswith(b'SQLite format 3')  # kept for inspection
+    finally:
+        stop(app)
@@ -0,0 +1,51 @@
+"""SQL statements per request stay constant as pages grow (no N+1 lookups)"""
+
+from datetime import timedelta
+
+import pytest
+
+from server.extensions import db
+from server.models import get_eat_time, Customer, Order
+
+from support import max_statements
+
+CUSTOMERS = 30
+ORDERS = 150
+
+@pytest.fixture
+def orders(app, client, headers):
+    """ORDERS pending orders spread over CUSTOMERS customers"""
+    now = get_eat_time()
+    with app.app_context():
+        db.session.execute(db.insert(Customer), [
+            {'user_id': 1, 'name': f'Customer {i}', 'customer_type': 'restaurant' if i % 3 else 'individual'}
+            for i in range(CUSTOMERS)
+        ])
+        db.session.execute(db.insert(Order), [{
+            'user_id': 1, 'customer_id': 1 + i % CUSTOMERS, 'quantity_kg': 5.0, 'price_per_kg': 180.0, 'total_amount': 900.0,
+            'order_date': now - timedelta(minutes=i), 'delivery_status': 'pending',
+            'amount_paid': 0.0, 'amount_remaining': 900.0, 'payment_status': 'unpaid'
+        } for i in range(ORDERS)])
+        db.session.commit()
+    client.get('/api/orders?limit=1', headers=headers)  # load the token revocation list outside the count
+
+# The If-None-Match data version lookup, the page and the total count
+ORDER_LIST_STATEMENTS = 3
+
+@pytest.mark.parametrize('limit', [5, 50, 200])
+def test_order_list_with_total_is_constant(app, client, headers, orders, limit):
+    with app.app_context():
+        with max_statements(ORDER_LIST_STATEMENTS) as statements:
+            response = client.get(f'/api/orders?include_total=true&limit={limit}', headers=headers)
+    body = response.get_json()
+    assert response.status_code == 200, body
+    assert len(body['items']) == min(limit, ORDERS)
+    assert body['total_count'] == ORDERS
+    assert body['items'][0]['customer_name'] == 'Customer 0'
+    assert len(statements) == ORDER_LIST_STATEMENTS
+
+def test_max_statements_reports_the_excess(app, client, headers, orders):
+    with app.app_context():
+        with pytest.raises(AssertionError, match=f'at most 1 SQL statements, got {ORDER_LIST_STATEMENTS}'):
+            with max_statements(1):
+                client.get('/api/orders?include_total=true', headers=headers)
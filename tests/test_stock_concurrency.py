@@ -0,0 +1,53 @@
+"""Stock reservations under concurrent order creation: no overselling"""
+
+import threading
+import time
+from collections import Counter
+
+from server.extensions import db
+from server.stock import verify_stock_ledger
+
+THREADS = 16
+ORDERS = 400
+ORDER_KG = 20
+STOCK_BAGS = 100  # 6,000 kg: room for exactly 300 of the orders
+
+def test_parallel_orders_never_oversell(app, client, headers):
+    client.post('/api/inventory', json={'bags': STOCK_BAGS}, headers=headers)
+    customer_id = client.post('/api/customers', json={
+        'name': 'Mama Njeri Hotel', 'phone': '0700000001', 'customer_type': 'restaurant'
+    }, headers=headers).get_json()['id']
+    with app.app_context():
+        assert db.session.execute(db.text('PRAGMA journal_mode')).scalar() == 'wal'
+
+    statuses = Counter()
+    lock = threading.Lock()
+    start = threading.Barrier(THREADS)
+
+    def worker():
+        thread_client = app.test_client()
+        start.wait()
+        for _ in range(ORDERS // THREADS):
+            response = thread_client.post('/api/orders', json={'customer_id': customer_id, 'quantity_kg': ORDER_KG}, headers=headers)
+            with lock:
+                statuses[response.status_code] += 1
+
+    workers = [threading.Thread(target=worker) for _ in range(THREADS)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    stock_orders = STOCK_BAGS * 60 // ORDER_KG
+    assert statuses == {201: stock_orders, 400: ORDERS - stock_orders}
+    assert ORDERS / elapsed > 50, f'{ORDERS / elapsed:.0f} orders/s'
+
+    inventory = client.get('/api/inventory', headers=headers).get_json()
+    assert inventory['reserved_kg'] == STOCK_BAGS * 60
+    assert inventory['unreserved_kg'] == 0
+    orders = client.get('/api/orders?paginate=false', headers=headers).get_json()
+    assert len(orders) == stock_orders
+    with app.app_context():
+        assert verify_stock_ledger() == []
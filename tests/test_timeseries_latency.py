@@ -0,0 +1,57 @@
+"""Latency budget for GET /api/reports/timeseries over a year of daily orders"""
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from server.extensions import db
+from server.models import get_eat_time, eat_day, Customer, Order
+from server.sales import backfill_daily_sales
+
+DAYS = 366
+ORDERS_PER_DAY = 30
+BUDGET_MS = 50  # per request; a year answers in under 10ms on a laptop
+REPEATS = 5
+
+@pytest.fixture
+def year_of_orders(app):
+    """ORDERS_PER_DAY delivered orders of KES 900 (5 kg) around noon on each of the last DAYS days"""
+    noon = get_eat_time().replace(hour=12, minute=0, second=0, microsecond=0)
+    with app.app_context():
+        db.session.execute(db.insert(Customer), [{'user_id': 1, 'name': 'Mama Njeri Hotel', 'customer_type': 'restaurant'}])
+        db.session.execute(db.insert(Order), [{
+            'user_id': 1, 'customer_id': 1, 'quantity_kg': 5.0, 'price_per_kg': 180.0, 'total_amount': 900.0,
+            'order_date': noon - timedelta(days=day, minutes=minute), 'delivery_status': 'delivered',
+            'amount_paid': 900.0, 'amount_remaining': 0.0, 'payment_status': 'paid'
+        } for day in range(DAYS) for minute in range(ORDERS_PER_DAY)])
+        backfill_daily_sales()
+        db.session.commit()
+    return eat_day(noon)
+
+@pytest.mark.parametrize('query', [
+    'bucket=day&metric=revenue',
+    'bucket=week&metric=kg',
+    'bucket=month&metric=orders',
+    'bucket=day&from={year_ago}&to={today}',
+    'bucket=week&from={year_ago}&to={today}&metric=orders'
+])
+def test_timeseries_within_budget(client, headers, year_of_orders, query):
+    today = year_of_orders
+    path = '/api/reports/timeseries?' + query.format(year_ago=today - timedelta(days=DAYS - 1), today=today)
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        response = client.get(path, headers=headers)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.get_json()
+
+    assert min(timings) < BUDGET_MS, f'{path}: best of {REPEATS} took {min(timings):.1f}ms'
+
+def test_full_year_series_is_dense_and_complete(client, headers, year_of_orders):
+    today = year_of_orders
+    points = client.get(
+        f'/api/reports/timeseries?bucket=day&metric=orders&from={today - timedelta(days=DAYS - 1)}&to={today}', headers=headers
+    ).get_json()['points']
+    assert len(points) == DAYS
+    assert sum(point['value'] for point in points) == DAYS * ORDERS_PER_DAY